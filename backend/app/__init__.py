@@ -1,20 +1,21 @@
 """Homelab Manager Flask Application."""
 
-import json
+import atexit
+import copy
+import functools
 import logging
+import queue
 import sys
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
-from flasgger import Swagger
+import orjson
 from flask import Flask, jsonify, request
-from flask_cors import CORS
 from flask_jwt_extended import JWTManager
-from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import Config
 from app.extensions import limiter
-from app.utils.errors import APIError, handle_database_exception
+from app.json_provider import OrjsonProvider
 
 logger = logging.getLogger(__name__)
 
@@ -22,19 +23,25 @@ logger = logging.getLogger(__name__)
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for production environments."""
 
+    # Optional context attributes copied from the record when present
+    EXTRA_FIELDS = ("request_id", "user_id")
+
+    # orjson renders naive datetimes as UTC with a trailing "Z"
+    DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
     def format(self, record):
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcnow(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         # Add extra fields if present
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
+        record_attrs = record.__dict__
+        for field in self.EXTRA_FIELDS:
+            if field in record_attrs:
+                log_data[field] = record_attrs[field]
 
         # Add exception info if present
         if record.exc_info:
@@ -48,30 +55,91 @@ class JSONFormatter(logging.Formatter):
                 "function": record.funcName,
             }
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, option=self.DUMPS_OPTIONS).decode()
 
 
 class TextFormatter(logging.Formatter):
     """Human-readable log formatter for development."""
 
+    # Second-resolution timestamps without the default ",mmm" suffix
+    default_time_format = "%Y-%m-%d %H:%M:%S"
+    default_msec_format = None
+
     def __init__(self):
-        super().__init__(
-            "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        super().__init__("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
+
+
+class LocalQueueHandler(QueueHandler):
+    """Queue handler feeding an in-process QueueListener.
+
+    The message is merged with its arguments at emit time so it reflects the
+    caller's state, but exception info is kept on the record so the
+    listener's formatter can still render it (the stdlib version flattens it
+    into the message).
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener that owns the console/file handlers
+_log_listener: QueueListener | None = None
+
+
+def _stop_log_listener():
+    """Stop the background log listener, flushing any queued records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+# Third-party loggers that are always quieter than the app itself
+QUIET_LOGGERS = ("werkzeug", "urllib3")
+
+
+@functools.lru_cache(maxsize=16)
+def parse_log_level(name: str) -> int:
+    """Resolve a log level name such as ``"debug"`` to its numeric value.
+
+    Args:
+        name: Level name (case-insensitive)
+
+    Returns:
+        Numeric logging level, or ``logging.INFO`` for unknown names
+    """
+    return logging.getLevelNamesMapping().get(name.upper(), logging.INFO)
 
 
 def setup_logging(app):
-    """Configure application logging based on environment."""
-    log_level = getattr(
-        logging, app.config.get("LOG_LEVEL", "INFO").upper(), logging.INFO
-    )
+    """Configure application logging based on environment.
+
+    Request threads only enqueue records; formatting and console/file writes
+    happen on a single QueueListener thread.
+    """
+    global _log_listener
+
+    # Neither formatter emits thread or process fields, so skip collecting
+    # them for every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    log_level = parse_log_level(app.config.get("LOG_LEVEL", "INFO"))
     log_file = app.config.get("LOG_FILE")
     log_format = app.config.get("LOG_FORMAT", "text")
 
     # Select formatter based on environment
     formatter = JSONFormatter() if log_format == "json" else TextFormatter()
 
+    # Replace any listener left over from a previous create_app call
+    _stop_log_listener()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -79,39 +147,124 @@ def setup_logging(app):
     # Clear existing handlers to avoid duplicates
     root_logger.handlers.clear()
 
+    # Only the queue handler runs on the calling thread
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(LocalQueueHandler(log_queue))
+
     # Console handler (always enabled)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log file is configured)
     if log_file:
         try:
-            file_handler = RotatingFileHandler(
+            # Time-based rotation avoids a size check on every write; the
+            # file is only opened once the first record arrives
+            file_handler = TimedRotatingFileHandler(
                 log_file,
-                maxBytes=10 * 1024 * 1024,  # 10 MB
-                backupCount=10,
+                when="H",
+                backupCount=24 * 7,  # One week of hourly files
+                delay=True,
+                utc=True,
             )
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
-            logger.info(f"Logging to file: {log_file}")
+            handlers.append(file_handler)
+            logger.info("Logging to file: %s", log_file)
         except (OSError, PermissionError) as e:
-            logger.warning(f"Could not create log file {log_file}: {e}")
+            logger.warning("Could not create log file %s: %s", log_file, e)
+
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    app.extensions["log_listener"] = _log_listener
 
     # Set third-party logger levels
-    logging.getLogger("werkzeug").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.engine").setLevel(
+    third_party_levels = dict.fromkeys(QUIET_LOGGERS, logging.WARNING)
+    third_party_levels["sqlalchemy.engine"] = (
         logging.INFO if log_level <= logging.DEBUG else logging.WARNING
     )
+    for name, level in third_party_levels.items():
+        logging.getLogger(name).setLevel(level)
 
     logger.info(
-        f"Logging configured: level={logging.getLevelName(log_level)}, format={log_format}"
+        "Logging configured: level=%s, format=%s",
+        logging.getLevelName(log_level),
+        log_format,
     )
 
 
+def log_request_info():
+    """Log incoming request details (debug level)."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(
+        "Request: %s %s from %s", request.method, request.path, request.remote_addr
+    )
+
+
+def log_response_info(response):
+    """Log response status for errors."""
+    if response.status_code < 400:
+        return response
+    logger.warning(
+        "Response: %s %s -> %s", request.method, request.path, response.status_code
+    )
+    return response
+
+
+# CORS response headers - fixed for the lifetime of the app
+CORS_ALLOW_HEADERS = "Content-Type, Authorization, X-CSRF-TOKEN"
+CORS_ALLOW_METHODS = "GET, POST, PUT, DELETE, OPTIONS"
+
+
+def setup_cors(app):
+    """Attach CORS headers for the configured origins.
+
+    The allowed origins and header values never change after startup, so
+    they are built once here and each request only does a set lookup on
+    the Origin header. Preflight requests are answered before dispatch.
+    """
+    allowed_origins = frozenset(app.config["CORS_ORIGINS"])
+    allow_any_origin = "*" in allowed_origins
+    preflight_headers = {
+        "Access-Control-Allow-Headers": CORS_ALLOW_HEADERS,
+        "Access-Control-Allow-Methods": CORS_ALLOW_METHODS,
+    }
+
+    def is_allowed(origin):
+        return origin is not None and (allow_any_origin or origin in allowed_origins)
+
+    @app.before_request
+    def handle_cors_preflight():
+        """Short-circuit CORS preflight requests with an empty response."""
+        if (
+            request.method == "OPTIONS"
+            and "Access-Control-Request-Method" in request.headers
+            and is_allowed(request.headers.get("Origin"))
+        ):
+            return app.response_class(status=204)
+        return None
+
+    @app.after_request
+    def add_cors_headers(response):
+        """Add CORS headers to responses for allowed origins."""
+        origin = request.headers.get("Origin")
+        if is_allowed(origin):
+            headers = response.headers
+            headers["Access-Control-Allow-Origin"] = origin
+            headers["Access-Control-Allow-Credentials"] = "true"
+            headers.add("Vary", "Origin")
+            if request.method == "OPTIONS":
+                headers.update(preflight_headers)
+        return response
+
+
+# Pre-serialized body for the health check, which load balancers poll constantly
+HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "homelab-manager"})
+
+
 SWAGGER_TEMPLATE = {
     "info": {
         "title": "Homelab Manager API",
@@ -124,18 +277,18 @@ SWAGGER_TEMPLATE = {
         },
     },
     "basePath": "/api",
-    "schemes": ["http", "https"],
-    "tags": [
+    "schemes": ("http", "https"),
+    "tags": (
         {"name": "Devices", "description": "Device management operations"},
         {"name": "Network Interfaces", "description": "Network interface operations"},
         {"name": "Services", "description": "Service tracking operations"},
         {"name": "Metrics", "description": "Performance metrics operations"},
         {"name": "Automation", "description": "Automation and playbook execution"},
-    ],
+    ),
 }
 
 SWAGGER_CONFIG = {
-    "headers": [],
+    "headers": (),
     "specs": [
         {
             "endpoint": "apispec",
@@ -150,10 +303,52 @@ SWAGGER_CONFIG = {
 }
 
 
+def _with_libyaml(render):
+    """Call render() with yaml.safe_load parsing through libyaml when built.
+
+    flasgger parses each view docstring with yaml.safe_load, which uses the
+    pure-Python parser; libyaml's CSafeLoader builds the same documents
+    several times faster.
+    """
+    import yaml
+
+    if not yaml.__with_libyaml__:
+        return render()
+    safe_load = yaml.safe_load
+    yaml.safe_load = functools.partial(yaml.load, Loader=yaml.CSafeLoader)
+    try:
+        return render()
+    finally:
+        yaml.safe_load = safe_load
+
+
+def cache_apispec(app, endpoint="flasgger.apispec"):
+    """Serve the Swagger spec from bytes generated on its first request.
+
+    flasgger rebuilds the spec by walking every view docstring on each hit.
+    Routes never change after startup, so the first rendering is reused.
+
+    Args:
+        app: Flask application with Swagger already initialized
+        endpoint: Endpoint name of flasgger's spec view
+    """
+    generate_spec = app.view_functions[endpoint]
+    spec = None
+
+    def cached_apispec():
+        nonlocal spec
+        if spec is None:
+            spec = _with_libyaml(generate_spec).get_data()
+        return app.response_class(spec, mimetype="application/json")
+
+    app.view_functions[endpoint] = cached_apispec
+
+
 def create_app(config_class=Config):
     """Create and configure the Flask application."""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
 
     # Call init_app if the config class has one (production validation)
     if hasattr(config_class, "init_app"):
@@ -164,118 +359,59 @@ def create_app(config_class=Config):
 
     # Log startup info
     flask_env = app.config.get("FLASK_ENV", "development")
-    logger.info(f"Starting homelab-manager in {flask_env} mode")
+    logger.info("Starting homelab-manager in %s mode", flask_env)
 
     # Initialize extensions
-    CORS(
-        app,
-        origins=app.config["CORS_ORIGINS"],
-        supports_credentials=True,
-        allow_headers=["Content-Type", "Authorization", "X-CSRF-TOKEN"],
-        methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    )
+    setup_cors(app)
     jwt = JWTManager(app)
     limiter.init_app(app)
 
-    # Request logging middleware
-    @app.before_request
-    def log_request_info():
-        """Log incoming request details (debug level)."""
-        if app.debug:
-            logger.debug(
-                f"Request: {request.method} {request.path} from {request.remote_addr}"
-            )
-
-    @app.after_request
-    def log_response_info(response):
-        """Log response status for errors."""
-        if response.status_code >= 400:
-            logger.warning(
-                f"Response: {request.method} {request.path} -> {response.status_code}"
-            )
-        return response
+    # Request logging middleware (request details are only logged in debug)
+    if app.debug:
+        app.before_request(log_request_info)
+    app.after_request(log_response_info)
 
     # JWT error handlers
     @jwt.invalid_token_loader
     def invalid_token_callback(error_string):
-        logger.warning(f"Invalid JWT token: {error_string}")
+        logger.warning("Invalid JWT token: %s", error_string)
         return jsonify({"error": "Invalid token", "details": error_string}), 401
 
     @jwt.unauthorized_loader
     def unauthorized_callback(error_string):
-        logger.warning(f"Missing JWT token: {error_string}")
+        logger.warning("Missing JWT token: %s", error_string)
         return jsonify({"error": "Missing authorization token"}), 401
 
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
-        logger.warning(f"Expired JWT token for user: {jwt_payload.get('sub')}")
+        logger.warning("Expired JWT token for user: %s", jwt_payload.get("sub"))
         return jsonify({"error": "Token has expired"}), 401
 
-    # Only enable Swagger in non-production
+    # Only enable Swagger in non-production; flasgger is imported lazily so
+    # production workers never load it
     if flask_env != "production":
+        from flasgger import Swagger
+
         Swagger(app, template=SWAGGER_TEMPLATE, config=SWAGGER_CONFIG)
+        cache_apispec(app)
 
     # Late imports to avoid circular imports
     from app.cli import register_cli
+    from app.database import remove_session
     from app.routes import register_blueprints
 
+    # One database session per request (or Celery task), closed at teardown
+    app.teardown_appcontext(remove_session)
+
     # Register blueprints
     register_blueprints(app)
 
     # Register CLI commands
     register_cli(app)
 
-    # Register error handlers
-    @app.errorhandler(APIError)
-    def handle_api_error(error):
-        """Handle custom API errors."""
-        logger.warning(f"API Error {error.status_code}: {error.message}")
-        return jsonify(error.to_dict()), error.status_code
-
-    @app.errorhandler(SQLAlchemyError)
-    def handle_sqlalchemy_error(error):
-        """Handle SQLAlchemy database errors."""
-        logger.error(f"Database error: {str(error)}")
-        return handle_database_exception(error)
-
-    @app.errorhandler(ValueError)
-    def handle_value_error(error):
-        """Handle ValueError exceptions (usually enum validation)."""
-        logger.warning(f"ValueError: {str(error)}")
-        # Don't expose raw error message in production
-        return jsonify({"error": "Invalid input provided"}), 400
-
-    @app.errorhandler(429)
-    def handle_rate_limit_exceeded(error):
-        """Handle rate limit exceeded errors."""
-        logger.warning(f"Rate limit exceeded: {error.description}")
-        return jsonify({"error": "Rate limit exceeded. Please try again later."}), 429
-
-    @app.errorhandler(404)
-    def handle_not_found(error):
-        """Handle 404 Not Found errors."""
-        return jsonify({"error": "Endpoint not found"}), 404
-
-    @app.errorhandler(405)
-    def handle_method_not_allowed(error):
-        """Handle 405 Method Not Allowed errors."""
-        return jsonify({"error": "Method not allowed"}), 405
-
-    @app.errorhandler(500)
-    def handle_internal_error(error):
-        """Handle 500 Internal Server Error."""
-        logger.error(f"Internal server error: {str(error)}")
-        return jsonify({"error": "Internal server error"}), 500
-
-    @app.errorhandler(Exception)
-    def handle_unexpected_error(error):
-        """Handle any unexpected exceptions."""
-        logger.exception(f"Unexpected error: {str(error)}")
-        return jsonify({"error": "An unexpected error occurred"}), 500
-
     @app.route("/health")
     def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "service": "homelab-manager"}, 200
+        return app.response_class(HEALTH_BODY, 200, mimetype="application/json")
 
     return app
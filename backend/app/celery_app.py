@@ -1,9 +1,21 @@
 """Celery application configuration and initialization."""
 
+import orjson
 from celery import Celery
+from kombu.serialization import register
 
 from app.config import Config
 
+# orjson-backed codec for task and result payloads; plain "json" stays in
+# CELERY_ACCEPT_CONTENT so messages queued by older workers still decode
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 
 def make_celery(app=None):
     """Create and configure Celery application.
@@ -33,6 +45,16 @@ def make_celery(app=None):
         task_reject_on_worker_lost=True,
         # Result settings
         result_expires=3600,  # Results expire after 1 hour
+        # Keep broker and result connections pooled and alive across idle
+        # periods so workers don't hit broken pipes and reconnect storms
+        broker_transport_options={
+            "max_connections": Config.REDIS_MAX_CONNECTIONS,
+            "socket_keepalive": True,
+            "health_check_interval": Config.REDIS_HEALTH_CHECK_INTERVAL,
+        },
+        redis_max_connections=Config.REDIS_MAX_CONNECTIONS,
+        redis_socket_keepalive=True,
+        redis_backend_health_check_interval=Config.REDIS_HEALTH_CHECK_INTERVAL,
     )
 
     if app:
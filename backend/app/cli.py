@@ -2,13 +2,27 @@
 
 import click
 from flask.cli import with_appcontext
+from sqlalchemy import or_
 
-from app.database import Session
 from app.models.user import User
+from app.utils.errors import DatabaseSession
+
+# Column layout for list-users output, applied with the % operator per row
+USER_ROW_FORMAT = "%-5s %-20s %-30s %-7s %-7s"
+USER_TABLE_HEADER = USER_ROW_FORMAT % ("ID", "Username", "Email", "Admin", "Active")
+# Indexed by a boolean column value
+YES_NO = ("No", "Yes")
+
+
+def _normalize_username(ctx, param, value: str) -> str:
+    """Lower-case usernames, matching how the API stores and looks them up."""
+    return value.lower()
 
 
 @click.command("create-admin")
-@click.option("--username", prompt=True, help="Admin username")
+@click.option(
+    "--username", prompt=True, callback=_normalize_username, help="Admin username"
+)
 @click.option("--email", prompt=True, help="Admin email address")
 @click.option(
     "--password",
@@ -27,79 +41,91 @@ def create_admin(username: str, email: str, password: str):
     Example:
         flask create-admin --username admin --email admin@example.com
     """
-    db = Session()
-    try:
-        # Check if username already exists
-        existing_user = db.query(User).filter(User.username == username).first()
-        if existing_user:
-            click.echo(
-                click.style(f"Error: User '{username}' already exists.", fg="red")
+    with DatabaseSession() as db:
+        try:
+            # Check username and email uniqueness in a single round-trip
+            existing = (
+                db.query(User.username, User.email)
+                .filter(or_(User.username == username, User.email == email))
+                .first()
             )
-            return
-
-        # Check if email already exists
-        existing_email = db.query(User).filter(User.email == email).first()
-        if existing_email:
-            click.echo(
-                click.style(f"Error: Email '{email}' is already in use.", fg="red")
+            if existing:
+                if existing.username == username:
+                    message = f"Error: User '{username}' already exists."
+                else:
+                    message = f"Error: Email '{email}' is already in use."
+                click.echo(click.style(message, fg="red"))
+                return
+
+            # Create the admin user
+            admin = User(
+                username=username,
+                email=email,
+                is_admin=True,
+                is_active=True,
             )
-            return
-
-        # Create the admin user
-        admin = User(
-            username=username,
-            email=email,
-            is_admin=True,
-            is_active=True,
-        )
-        admin.set_password(password)
+            admin.set_password(password)
 
-        db.add(admin)
-        db.commit()
+            db.add(admin)
+            db.commit()
 
-        click.echo(
-            click.style(f"Admin user '{username}' created successfully!", fg="green")
-        )
-        click.echo(f"  Username: {username}")
-        click.echo(f"  Email: {email}")
-        click.echo("  Admin: Yes")
+            click.echo(
+                click.style(
+                    f"Admin user '{username}' created successfully!", fg="green"
+                )
+            )
+            click.echo(f"  Username: {username}")
+            click.echo(f"  Email: {email}")
+            click.echo("  Admin: Yes")
 
-    except Exception as e:
-        db.rollback()
-        click.echo(click.style(f"Error creating admin user: {str(e)}", fg="red"))
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            click.echo(click.style(f"Error creating admin user: {str(e)}", fg="red"))
+            raise
 
 
 @click.command("list-users")
 @with_appcontext
 def list_users():
     """List all users in the system."""
-    db = Session()
-    try:
-        users = db.query(User).all()
-        if not users:
-            click.echo("No users found.")
-            return
-
-        click.echo(
-            f"\n{'ID':<5} {'Username':<20} {'Email':<30} {'Admin':<7} {'Active':<7}"
+    with DatabaseSession() as db:
+        # Project only the printed columns and stream them in batches so large
+        # user tables are never fully hydrated into ORM objects
+        rows = (
+            db.query(User.id, User.username, User.email, User.is_admin, User.is_active)
+            .order_by(User.id)
+            .yield_per(1000)
         )
-        click.echo("-" * 75)
-        for user in users:
+
+        total = 0
+        for user_id, username, email, is_admin, is_active in rows:
+            if not total:
+                click.echo(f"\n{USER_TABLE_HEADER}")
+                click.echo("-" * 75)
+            total += 1
             click.echo(
-                f"{user.id:<5} {user.username:<20} {user.email:<30} "
-                f"{'Yes' if user.is_admin else 'No':<7} "
-                f"{'Yes' if user.is_active else 'No':<7}"
+                USER_ROW_FORMAT
+                % (
+                    user_id,
+                    username,
+                    email,
+                    YES_NO[bool(is_admin)],
+                    YES_NO[bool(is_active)],
+                )
             )
-        click.echo(f"\nTotal: {len(users)} user(s)")
-    finally:
-        db.close()
+
+        if not total:
+            click.echo("No users found.")
+            return
+        click.echo(f"\nTotal: {total} user(s)")
 
 
 @click.command("reset-password")
-@click.option("--username", prompt=True, help="Username to reset password for")
+@click.option(
+    "--username",
+    prompt=True,
+    callback=_normalize_username,
+    help="Username to reset password for",
+)
 @click.option(
     "--password",
     prompt=True,
@@ -110,26 +136,25 @@ def list_users():
 @with_appcontext
 def reset_password(username: str, password: str):
     """Reset a user's password from the command line."""
-    db = Session()
-    try:
-        user = db.query(User).filter(User.username == username).first()
-        if not user:
-            click.echo(click.style(f"Error: User '{username}' not found.", fg="red"))
-            return
-
-        user.set_password(password)
-        db.commit()
+    with DatabaseSession() as db:
+        try:
+            user = db.query(User).filter(User.username == username).first()
+            if not user:
+                click.echo(
+                    click.style(f"Error: User '{username}' not found.", fg="red")
+                )
+                return
+
+            user.set_password(password)
+            db.commit()
 
-        click.echo(
-            click.style(f"Password for '{username}' has been reset.", fg="green")
-        )
+            click.echo(
+                click.style(f"Password for '{username}' has been reset.", fg="green")
+            )
 
-    except Exception as e:
-        db.rollback()
-        click.echo(click.style(f"Error resetting password: {str(e)}", fg="red"))
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            click.echo(click.style(f"Error resetting password: {str(e)}", fg="red"))
+            raise
 
 
 def register_cli(app):
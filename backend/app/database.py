@@ -1,13 +1,44 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import scoped_session, sessionmaker
+import orjson
+from sqlalchemy import JSON, BigInteger, DateTime, Integer, create_engine, make_url
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.config import Config
 
+
+def _engine_options(database_url: str | None) -> dict:
+    """Return pool and driver options suitable for the configured database.
+
+    SQLite uses SingletonThreadPool/StaticPool, which reject QueuePool
+    sizing arguments, so pooling options only apply to server databases.
+    """
+    if database_url and database_url.startswith("sqlite"):
+        return {}
+    options = dict(Config.SQLALCHEMY_ENGINE_OPTIONS)
+    if database_url and make_url(database_url).get_driver_name() == "psycopg2":
+        # INSERTs already batch via insertmanyvalues; also batch executemany
+        # UPDATE/DELETE (e.g. ORM flushes of many rows) with execute_batch
+        options["executemany_mode"] = "values_plus_batch"
+    return options
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (non-string keys allowed)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create engine
-engine = create_engine(Config.DATABASE_URL, echo=Config.SQLALCHEMY_ECHO)
+engine = create_engine(
+    Config.DATABASE_URL,
+    echo=Config.SQLALCHEMY_ECHO,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options(Config.DATABASE_URL),
+)
 
 # Create session factory
 # expire_on_commit=False prevents attributes from being expired after commit,
@@ -15,8 +46,50 @@ engine = create_engine(Config.DATABASE_URL, echo=Config.SQLALCHEMY_ECHO)
 session_factory = sessionmaker(bind=engine, expire_on_commit=False)
 Session = scoped_session(session_factory)
 
-# Create base class for models
-Base = declarative_base()
+
+def remove_session(exception: BaseException | None = None) -> None:
+    """Close the scoped session and return its connection to the pool.
+
+    Registered with ``teardown_appcontext``, so every ``Session()`` call in a
+    request (routes, audit logging, helpers) shares one session and one
+    pooled connection until the request ends.
+    """
+    Session.remove()
+
+
+class Base(DeclarativeBase):
+    """Base class for all ORM models."""
+
+
+# JSON column type stored as binary JSONB on PostgreSQL (indexable with GIN)
+# and as plain JSON on other backends such as the SQLite test database
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+# 64-bit key for high-volume tables; SQLite only auto-increments an
+# INTEGER PRIMARY KEY, so the test database keeps a plain integer there
+BigIntegerType = BigInteger().with_variant(Integer(), "sqlite")
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database.
+
+    Timestamp columns are ``timestamp without time zone`` holding UTC, so
+    this matches what ``datetime.utcnow`` used to write from Python.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
 
 
 def init_db():
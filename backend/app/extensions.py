@@ -2,8 +2,10 @@
 
 import os
 
+from flask import g, request
 from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
+
+from app.config import Config
 
 # Use Redis for rate limiting storage (shared across workers, persists across restarts)
 # Falls back to memory:// in development if Redis unavailable
@@ -19,9 +21,47 @@ DEFAULT_LIMITS = (
     else ["200 per day", "50 per hour"]
 )
 
+
+def rate_limit_key() -> str:
+    """Return the client address used to key rate limits.
+
+    Reads the WSGI environ directly and memoizes the result on ``g`` so that
+    the default limits and any per-route limits share a single parse.
+
+    The bundled nginx config sets ``X-Real-IP`` to the peer address and appends
+    it to ``X-Forwarded-For``, so the proxy-supplied values are preferred. The
+    right-most ``X-Forwarded-For`` hop is used because earlier entries are
+    client-controlled and would let callers pick their own rate-limit bucket.
+
+    Returns:
+        Client IP address, or an empty string if none is available
+    """
+    key = g.get("_rate_key")
+    if key is None:
+        env = request.environ
+        key = env.get("HTTP_X_REAL_IP")
+        if not key:
+            forwarded = env.get("HTTP_X_FORWARDED_FOR")
+            if forwarded:
+                key = forwarded.rpartition(",")[2].strip()
+        if not key:
+            key = env.get("REMOTE_ADDR", "")
+        g._rate_key = key
+    return key
+
+
 # Initialize rate limiter (attached to app in create_app)
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     default_limits=DEFAULT_LIMITS,
     storage_uri=RATE_LIMIT_STORAGE,
+    # Sliding window avoids bursts at window boundaries; on Redis the
+    # check-and-hit runs as a single server-side Lua script per limit
+    strategy="moving-window",
+    # Same Redis pool sizing and keepalive as Celery (ignored by memory://)
+    storage_options={
+        "max_connections": Config.REDIS_MAX_CONNECTIONS,
+        "socket_keepalive": True,
+        "health_check_interval": Config.REDIS_HEALTH_CHECK_INTERVAL,
+    },
 )
@@ -0,0 +1,51 @@
+"""Flask JSON provider backed by orjson."""
+
+import decimal
+from collections.abc import Mapping
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+# Stdlib-style int keys; no key sorting. Datetimes and enums are encoded
+# natively (ISO 8601 and .value), so model to_dict() can return them raw.
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the types Flask's default provider supports beyond orjson's."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    # Read-only mappings such as MappingProxyType, which orjson rejects
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that encodes with orjson and responds with raw bytes.
+
+    Used for ``jsonify``, ``request.get_json`` and ``app.json``. Output is
+    compact, with keys in insertion order, and indented in debug mode.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=_default, option=DUMPS_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON from text or UTF-8 bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize the arguments into an ``application/json`` response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = DUMPS_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if self._app.debug:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=option),
+            mimetype="application/json",
+        )
@@ -1,14 +1,11 @@
 """Main application entry point."""
 
-import os
-
 from app import create_app
-from app.config import config
+from app.config import get_config
 from app.database import init_db
 
-# Get configuration from environment
-config_name = os.getenv("FLASK_ENV", "development")
-app = create_app(config[config_name])
+# Get configuration from environment (FLASK_ENV)
+app = create_app(get_config())
 
 if __name__ == "__main__":
     # Initialize database tables
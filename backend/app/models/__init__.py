@@ -5,11 +5,14 @@ from app.models.audit_log import AuditLog
 from app.models.automation_job import AutomationJob, JobStatus
 from app.models.device import Device, DeviceStatus, DeviceType
 from app.models.device_variables import DeviceVariables
+from app.models.error_category import ErrorCategory
 from app.models.hardware_spec import HardwareSpec
 from app.models.metric import Metric
 from app.models.network_interface import InterfaceStatus, NetworkInterface
 from app.models.service import Service, ServiceStatus
 from app.models.user import User
+from app.models.user_agent import UserAgent
+from app.models.user_avatar import UserAvatar
 from app.models.vault_secret import VaultSecret
 from app.models.workflow import WorkflowInstance, WorkflowStatus, WorkflowTemplate
 
@@ -21,6 +24,7 @@ __all__ = [
     "DeviceStatus",
     "DeviceType",
     "DeviceVariables",
+    "ErrorCategory",
     "HardwareSpec",
     "InterfaceStatus",
     "JobStatus",
@@ -29,6 +33,8 @@ __all__ = [
     "Service",
     "ServiceStatus",
     "User",
+    "UserAgent",
+    "UserAvatar",
     "VaultSecret",
     "WorkflowInstance",
     "WorkflowStatus",
@@ -0,0 +1,48 @@
+"""Generate ``to_dict`` methods from a model's mapped columns."""
+
+from collections.abc import Callable, Iterable
+
+
+def codegen_to_dict(
+    cls: type | None = None, *, exclude: Iterable[str] = ()
+) -> type | Callable[[type], type]:
+    """Class decorator that compiles a ``to_dict`` for plain column models.
+
+    The method is built once at import as a single dict literal over the
+    mapped column attributes, in declaration order, so each call is just
+    attribute reads. Datetimes and enums are returned raw for the JSON
+    provider to encode. Models whose ``to_dict`` computes or renames
+    fields keep a hand-written one.
+
+    Args:
+        cls: Declarative model class (when used without arguments)
+        exclude: Attribute names to leave out of the dictionary
+
+    Returns:
+        The decorated class, or a decorator when called with arguments
+
+    Example:
+        @codegen_to_dict(exclude=("updated_by",))
+        class AppSetting(Base):
+            ...
+    """
+
+    def decorate(model: type) -> type:
+        skip = frozenset(exclude)
+        # Mapper.columns is keyed by attribute name and, unlike column_attrs,
+        # does not force relationships to other models to resolve yet
+        names = [
+            name for name, _ in model.__mapper__.columns.items() if name not in skip
+        ]
+        fields = ", ".join(f"{name!r}: self.{name}" for name in names)
+        namespace: dict = {}
+        exec(f"def to_dict(self):\n    return {{{fields}}}\n", namespace)
+
+        to_dict = namespace["to_dict"]
+        to_dict.__doc__ = "Convert model to dictionary."
+        to_dict.__module__ = model.__module__
+        to_dict.__qualname__ = f"{model.__qualname__}.to_dict"
+        model.to_dict = to_dict
+        return model
+
+    return decorate if cls is None else decorate(cls)
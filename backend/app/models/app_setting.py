@@ -1,12 +1,16 @@
 """Application settings model for storing configurable settings."""
 
 from datetime import datetime
+from types import MappingProxyType
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utcnow
+from app.models._codegen import codegen_to_dict
 
 
+@codegen_to_dict(exclude=("id", "updated_by"))
 class AppSetting(Base):
     """Store application-wide settings as key-value pairs.
 
@@ -15,39 +19,38 @@ class AppSetting(Base):
     """
 
     __tablename__ = "app_settings"
-
-    id = Column(Integer, primary_key=True, index=True)
-    key = Column(String(100), unique=True, nullable=False, index=True)
-    value = Column(Text, nullable=False)
-    description = Column(Text, nullable=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    updated_by = Column(Integer, nullable=True)  # User ID who last updated
-
-    # Default values for settings (class-level constants)
-    DEFAULTS = {
-        "session_timeout_minutes": ("60", "Session timeout in minutes (default: 60)"),
-        "max_login_attempts": ("5", "Maximum failed login attempts before lockout"),
-        "lockout_duration_minutes": (
-            "15",
-            "Account lockout duration in minutes after max failed attempts",
-        ),
-    }
-
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "key": self.key,
-            "value": self.value,
-            "description": self.description,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+    # Fetch database-generated timestamps in the INSERT/UPDATE (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    key: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    value: Mapped[str] = mapped_column(Text)
+    description: Mapped[str | None] = mapped_column(Text)
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
+    updated_by: Mapped[int | None] = mapped_column(Integer)  # User ID who last updated
+
+    # Default values for settings (class-level constants, read-only)
+    DEFAULTS = MappingProxyType(
+        {
+            "session_timeout_minutes": (
+                "60",
+                "Session timeout in minutes (default: 60)",
+            ),
+            "max_login_attempts": ("5", "Maximum failed login attempts before lockout"),
+            "lockout_duration_minutes": (
+                "15",
+                "Account lockout duration in minutes after max failed attempts",
+            ),
         }
+    )
 
     @classmethod
     def get_default(cls, key: str) -> str | None:
         """Get default value for a setting key."""
-        if key in cls.DEFAULTS:
-            return cls.DEFAULTS[key][0]
-        return None
+        default = cls.DEFAULTS.get(key)
+        return default[0] if default is not None else None
 
     def __repr__(self):
         """String representation."""
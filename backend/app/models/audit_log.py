@@ -1,56 +1,107 @@
 """Audit log model for tracking user actions."""
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import Column, DateTime, Integer, String
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    insert,
+    text,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
-from app.database import Base
+from app.database import Base, JSONBType, utcnow
+from app.models._codegen import codegen_to_dict
 
+# Closed set of outcomes an audit entry can record
+AUDIT_STATUSES = ("success", "failure", "denied")
 
+
+@codegen_to_dict(exclude=("user_agent_id",))
 class AuditLog(Base):
     """Audit log model for tracking security-relevant actions."""
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Per-user history, newest first; also serves plain user_id lookups
+        Index("ix_audit_user_ts", "user_id", "timestamp"),
+        # All entries for a given resource; also serves resource_type lookups
+        Index("ix_audit_resource", "resource_type", "resource_id"),
+        # Failed/denied actions are the most-read security view and a small
+        # fraction of rows, so index them separately (partial on PostgreSQL)
+        Index(
+            "ix_audit_action_ts",
+            "action",
+            "timestamp",
+            postgresql_where=text("status IN ('failure', 'denied')"),
+        ),
+        # Containment queries inside details (PostgreSQL only)
+        Index("ix_audit_details_gin", "details", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        # Reject typos in the outcome column; action/resource_type stay open
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s}'" for s in AUDIT_STATUSES)),
+            name="ck_audit_logs_status",
+        ),
+    )
+    # Fetch the database-generated timestamp in the INSERT (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime, server_default=utcnow(), index=True
+    )
 
     # Who performed the action
-    user_id = Column(Integer, nullable=True, index=True)  # None for unauthenticated
-    username = Column(String(80), nullable=True)  # Denormalized for query convenience
-
-    # What action was performed
-    action = Column(
-        String(50), nullable=False, index=True
-    )  # CREATE, UPDATE, DELETE, LOGIN, etc.
-    resource_type = Column(
-        String(50), nullable=False, index=True
-    )  # Device, Service, User, etc.
-    resource_id = Column(Integer, nullable=True)
+    user_id: Mapped[int | None] = mapped_column(Integer)  # None for unauthenticated
+    # Denormalized for query convenience
+    username: Mapped[str | None] = mapped_column(String(80))
+
+    # What action was performed (CREATE, UPDATE, DELETE, LOGIN, etc.)
+    # on which kind of resource (Device, Service, User, etc.)
+    action: Mapped[str] = mapped_column(String(50), index=True)
+    resource_type: Mapped[str] = mapped_column(String(50))
+    resource_id: Mapped[int | None] = mapped_column(Integer)
 
     # Request context
-    ip_address = Column(String(45), nullable=True)  # IPv6 compatible
-    user_agent = Column(String(500), nullable=True)
-
-    # Additional details
-    details = Column(JSON, nullable=True)  # Flexible storage for action-specific data
-    status = Column(String(20), default="success")  # success, failure, denied
-
-    def to_dict(self) -> dict:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "user_id": self.user_id,
-            "username": self.username,
-            "action": self.action,
-            "resource_type": self.resource_type,
-            "resource_id": self.resource_id,
-            "ip_address": self.ip_address,
-            "details": self.details,
-            "status": self.status,
-        }
+    ip_address: Mapped[str | None] = mapped_column(String(45))  # IPv6 compatible
+    user_agent_id: Mapped[int | None] = mapped_column(
+        ForeignKey("user_agents.id", name="fk_audit_logs_user_agent_id")
+    )
+
+    # Additional details (flexible storage for action-specific data)
+    details: Mapped[dict[str, Any] | None] = mapped_column(JSONBType)
+    status: Mapped[str | None] = mapped_column(
+        String(20), default="success"
+    )  # success, failure, denied
+
+    @classmethod
+    def bulk_create(
+        cls, session: Session, rows: Sequence[Mapping[str, Any]]
+    ) -> list[int]:
+        """Insert many audit entries in a single INSERT statement.
+
+        Timestamps are assigned by the database, so the batch needs no
+        per-row clock reads or per-object flushes. The caller commits.
+
+        Args:
+            session: Session to execute in
+            rows: Column values for each entry, keyed by attribute name
+
+        Returns:
+            IDs of the inserted entries, in the order given
+        """
+        if not rows:
+            return []
+        stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        return list(session.scalars(stmt, rows))
 
     def __repr__(self):
         """String representation."""
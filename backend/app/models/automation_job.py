@@ -1,24 +1,42 @@
 """Automation job model."""
 
 import enum
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
-    JSON,
     Boolean,
     Column,
     DateTime,
-    Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Table,
     Text,
+    lambda_stmt,
+    select,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    joinedload,
+    mapped_column,
+    relationship,
+    undefer,
+    validates,
+)
+
+from app.database import Base, JSONBType
+from app.models.error_category import ErrorCategory, ErrorCategoryType
 
-from app.database import Base
+if TYPE_CHECKING:
+    from app.models.device import Device
+    from app.models.vault_secret import VaultSecret
+    from app.models.workflow import WorkflowInstance
 
 
-class JobStatus(enum.Enum):
+class JobStatus(enum.StrEnum):
     """Job status enumeration."""
 
     PENDING = "pending"
@@ -28,6 +46,46 @@ class JobStatus(enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Every device a job targets, primary included; indexed by device so
+# "which jobs target device X?" is an index lookup rather than a JSON scan
+automation_job_devices = Table(
+    "automation_job_devices",
+    Base.metadata,
+    Column(
+        "job_id",
+        Integer,
+        ForeignKey("automation_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "device_id",
+        Integer,
+        ForeignKey("devices.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Index("ix_automation_job_devices_device_job", "device_id", "job_id"),
+)
+
+# Workflow step ordering: job_id may only start once depends_on_id completed
+automation_job_deps = Table(
+    "automation_job_deps",
+    Base.metadata,
+    Column(
+        "job_id",
+        Integer,
+        ForeignKey("automation_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "depends_on_id",
+        Integer,
+        ForeignKey("automation_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Index("ix_automation_job_deps_depends_on_job", "depends_on_id", "job_id"),
+)
+
+
 class AutomationJob(Base):
     """Automation job for executing automation actions.
 
@@ -36,99 +94,149 @@ class AutomationJob(Base):
     """
 
     __tablename__ = "automation_jobs"
+    # Workflow instances load their jobs, and the orchestrator its pending
+    # steps, by workflow_instance_id
+    __table_args__ = (
+        Index("ix_automation_jobs_workflow_step", "workflow_instance_id", "step_order"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(
-        Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("devices.id", ondelete="CASCADE")
+    )
+    executor_type: Mapped[str] = mapped_column(String(50), default="ansible")
+    action_name: Mapped[str] = mapped_column(String(255))
+    action_config: Mapped[dict[str, Any] | None] = mapped_column(JSONBType)
+    # Extra variables for executor (e.g., Ansible extra-vars)
+    extra_vars: Mapped[dict[str, Any] | None] = mapped_column(JSONBType)
+    status: Mapped[JobStatus | None] = mapped_column(
+        String(16), default=JobStatus.PENDING
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
+    # Can run to megabytes; left out of job queries unless undeferred
+    log_output: Mapped[str | None] = mapped_column(Text, deferred=True)
+
+    # Progress tracking: percentage (0-100), tasks in playbook, tasks finished
+    progress: Mapped[int | None] = mapped_column(Integer, default=0)
+    task_count: Mapped[int | None] = mapped_column(Integer, default=0)
+    tasks_completed: Mapped[int | None] = mapped_column(Integer, default=0)
+
+    # Error categorization (connectivity, permission, etc.), stored as the
+    # SMALLINT error_categories ID
+    error_category: Mapped[ErrorCategory | None] = mapped_column(
+        "error_category_id",
+        ErrorCategoryType,
+        ForeignKey("error_categories.id", name="fk_automation_jobs_error_category_id"),
     )
-    # Multiple device IDs for batch execution (JSON array)
-    # When set, the job runs on all devices; device_id is the "primary" for the relationship
-    device_ids = Column(JSON, nullable=True)
-    executor_type = Column(String(50), nullable=False, default="ansible")
-    action_name = Column(String(255), nullable=False)
-    action_config = Column(JSON, nullable=True)
-    extra_vars = Column(
-        JSON, nullable=True
-    )  # Extra variables for executor (e.g., Ansible extra-vars)
-    status = Column(Enum(JobStatus), default=JobStatus.PENDING)
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-    log_output = Column(Text, nullable=True)
-
-    # Progress tracking
-    progress = Column(Integer, default=0)  # 0-100 percentage
-    task_count = Column(Integer, default=0)  # Total tasks in playbook
-    tasks_completed = Column(Integer, default=0)  # Tasks finished so far
-
-    # Error categorization
-    error_category = Column(String(50), nullable=True)  # connectivity, permission, etc.
 
     # Cancellation support
-    cancel_requested = Column(Boolean, default=False)
-    cancelled_at = Column(DateTime, nullable=True)
+    cancel_requested: Mapped[bool | None] = mapped_column(Boolean, default=False)
+    cancelled_at: Mapped[datetime | None] = mapped_column(DateTime)
 
     # Celery task tracking
-    celery_task_id = Column(String(255), nullable=True)
+    celery_task_id: Mapped[str | None] = mapped_column(String(255))
 
     # Vault secret for ansible-vault encrypted content
-    vault_secret_id = Column(Integer, ForeignKey("vault_secrets.id"), nullable=True)
+    vault_secret_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("vault_secrets.id")
+    )
 
     # Workflow integration
-    workflow_instance_id = Column(
-        Integer, ForeignKey("workflow_instances.id", ondelete="SET NULL"), nullable=True
+    workflow_instance_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("workflow_instances.id", ondelete="SET NULL")
     )
-    step_order = Column(Integer, nullable=True)  # Order within workflow
-    depends_on_job_ids = Column(JSON, nullable=True)  # Job IDs this depends on
-    is_rollback = Column(Boolean, default=False)  # Whether this is a rollback action
+    # Order within workflow, and whether this is a rollback action
+    step_order: Mapped[int | None] = mapped_column(Integer)
+    is_rollback: Mapped[bool | None] = mapped_column(Boolean, default=False)
 
     # Relationships
-    device = relationship("Device", backref="automation_jobs")
-    vault_secret = relationship("VaultSecret")
-    workflow_instance = relationship(
-        "WorkflowInstance",
+    device: Mapped["Device"] = relationship(back_populates="automation_jobs")
+    # All devices the job runs on; device_id is the "primary" among them
+    target_devices: Mapped[list["Device"]] = relationship(
+        secondary=automation_job_devices, order_by="Device.id"
+    )
+    depends_on: Mapped[list["AutomationJob"]] = relationship(
+        secondary=automation_job_deps,
+        primaryjoin=lambda: AutomationJob.id == automation_job_deps.c.job_id,
+        secondaryjoin=lambda: AutomationJob.id == automation_job_deps.c.depends_on_id,
+        order_by="AutomationJob.id",
+    )
+    vault_secret: Mapped["VaultSecret | None"] = relationship()
+    workflow_instance: Mapped["WorkflowInstance | None"] = relationship(
         back_populates="jobs",
         foreign_keys=[workflow_instance_id],
     )
 
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
+    @validates("status")
+    def _validate_status(self, key, value):
+        """Coerce to JobStatus, rejecting unknown values with ValueError."""
+        return JobStatus(value) if value is not None else None
+
+    @validates("error_category")
+    def _validate_error_category(self, key, value):
+        """Coerce to ErrorCategory, rejecting unknown values with ValueError."""
+        return ErrorCategory(value) if value is not None else None
+
+    @classmethod
+    def get_with_device(cls, session: Session, job_id: int) -> "AutomationJob | None":
+        """Fetch a job by ID with its primary device joined in and its log loaded.
+
+        Built with ``lambda_stmt`` so the statement and its cache key are
+        constructed once; later calls only bind ``job_id``.
+
+        Args:
+            session: Session to execute in
+            job_id: Job ID
+
+        Returns:
+            The job, or None if it does not exist
+        """
+        stmt = lambda_stmt(
+            lambda: select(AutomationJob).options(
+                joinedload(AutomationJob.device), undefer(AutomationJob.log_output)
+            )
+        )
+        stmt += lambda s: s.where(AutomationJob.id == job_id)
+        return session.scalar(stmt)
+
+    def to_dict(self, include_log: bool = True):
+        """Convert model to dictionary.
+
+        Callers listing jobs should selectinload ``target_devices`` and
+        ``depends_on`` to avoid a query per job, and pass
+        ``include_log=False`` so the deferred log is not loaded per job;
+        clients fetch it from the job's logs endpoint instead.
+        """
+        result = {
             "id": self.id,
             "device_id": self.device_id,
-            "device_ids": self.device_ids,
+            "device_ids": [device.id for device in self.target_devices],
             "executor_type": self.executor_type,
             "action_name": self.action_name,
             "action_config": self.action_config,
             "extra_vars": self.extra_vars,
-            "status": self.status.value if self.status else None,
-            "started_at": (self.started_at.isoformat() if self.started_at else None),
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "log_output": self.log_output,
-            # Progress tracking
+            "status": self.status,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "progress": self.progress,
             "task_count": self.task_count,
             "tasks_completed": self.tasks_completed,
-            # Error info
             "error_category": self.error_category,
-            # Cancellation
             "cancel_requested": self.cancel_requested,
-            "cancelled_at": (
-                self.cancelled_at.isoformat() if self.cancelled_at else None
-            ),
-            # Celery tracking
+            "cancelled_at": self.cancelled_at,
             "celery_task_id": self.celery_task_id,
-            # Vault
             "vault_secret_id": self.vault_secret_id,
-            # Workflow
             "workflow_instance_id": self.workflow_instance_id,
             "step_order": self.step_order,
-            "depends_on_job_ids": self.depends_on_job_ids,
+            "depends_on_job_ids": [job.id for job in self.depends_on],
             "is_rollback": self.is_rollback,
         }
+        if include_log:
+            result["log_output"] = self.log_output
+        return result
 
     def __repr__(self):
         """String representation."""
-        status_str = self.status.value if self.status else "unknown"
+        status_str = self.status or "unknown"
         return f"<AutomationJob {self.id} ({self.executor_type}) - {status_str}>"
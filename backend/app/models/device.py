@@ -2,13 +2,35 @@
 
 import enum
 from datetime import datetime
-
-from sqlalchemy import JSON, Column, DateTime, Enum, Integer, String
-
-from app.database import Base
-
-
-class DeviceType(enum.Enum):
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import DateTime, Integer, String, lambda_stmt, select
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    WriteOnlyMapped,
+    mapped_column,
+    relationship,
+    validates,
+)
+
+from app.database import Base, JSONBType, utcnow
+
+if TYPE_CHECKING:
+    from app.models.automation_job import AutomationJob
+    from app.models.device_variables import DeviceVariables
+    from app.models.hardware_spec import HardwareSpec
+    from app.models.metric import Metric
+    from app.models.network_interface import NetworkInterface
+    from app.models.service import Service
+
+# Shared read-only stand-in for devices without metadata, so empty metadata
+# costs no per-row dict
+_EMPTY_METADATA = MappingProxyType({})
+
+
+class DeviceType(enum.StrEnum):
     """Device type enumeration."""
 
     SERVER = "server"
@@ -18,7 +40,7 @@ class DeviceType(enum.Enum):
     STORAGE = "storage"
 
 
-class DeviceStatus(enum.Enum):
+class DeviceStatus(enum.StrEnum):
     """Device status enumeration."""
 
     ACTIVE = "active"
@@ -30,45 +52,107 @@ class Device(Base):
     """Device model representing physical or virtual systems."""
 
     __tablename__ = "devices"
+    # Read database-set timestamps back with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    type: Mapped[DeviceType] = mapped_column(String(16))
+    status: Mapped[DeviceStatus | None] = mapped_column(
+        String(16), default=DeviceStatus.ACTIVE
+    )
+    ip_address: Mapped[str | None] = mapped_column(String(45))  # IPv6 compatible
+    mac_address: Mapped[str | None] = mapped_column(String(17))
+    # Copied from the primary network interface (kept in sync by a listener
+    # in network_interface.py) so serializing a device needs no join
+    primary_ip_address: Mapped[str | None] = mapped_column(String(45))
+    primary_mac_address: Mapped[str | None] = mapped_column(String(17))
+    _device_metadata: Mapped[dict[str, Any] | None] = mapped_column(
+        "device_metadata", JSONBType
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), unique=True, nullable=False, index=True)
-    type = Column(Enum(DeviceType), nullable=False)
-    status = Column(Enum(DeviceStatus), default=DeviceStatus.ACTIVE)
-    ip_address = Column(String(45), nullable=True)  # IPv6 compatible
-    mac_address = Column(String(17), nullable=True)
-    device_metadata = Column(JSON, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    # Child rows can grow without bound (metrics especially), so these are
+    # never loaded as lists: query them with e.g. device.metrics.select().
+    # The foreign keys cascade, so deleting a device leaves them to the DB.
+    automation_jobs: WriteOnlyMapped["AutomationJob"] = relationship(
+        back_populates="device", passive_deletes=True
     )
+    hardware_spec: WriteOnlyMapped["HardwareSpec"] = relationship(
+        back_populates="device", passive_deletes=True
+    )
+    metrics: WriteOnlyMapped["Metric"] = relationship(
+        back_populates="device", passive_deletes=True
+    )
+    network_interfaces: WriteOnlyMapped["NetworkInterface"] = relationship(
+        back_populates="device", passive_deletes=True
+    )
+    services: WriteOnlyMapped["Service"] = relationship(
+        back_populates="device", passive_deletes=True
+    )
+    variable_sets: WriteOnlyMapped["DeviceVariables"] = relationship(
+        back_populates="device", passive_deletes=True
+    )
+
+    @property
+    def device_metadata(self):
+        """Metadata mapping, read-only and shared when the device has none."""
+        if self._device_metadata is None:
+            return _EMPTY_METADATA
+        return self._device_metadata
+
+    @device_metadata.setter
+    def device_metadata(self, value):
+        # Leave a new device's column unset rather than writing JSON null
+        if value or self._device_metadata is not None:
+            self._device_metadata = value or None
+
+    @validates("type", "status")
+    def _validate_enum(self, key, value):
+        """Coerce to DeviceType/DeviceStatus, rejecting unknown values."""
+        if value is None:
+            return None
+        return DeviceType(value) if key == "type" else DeviceStatus(value)
+
+    @classmethod
+    def get_by_name(cls, session: Session, name: str) -> "Device | None":
+        """Fetch a device by its unique name.
+
+        Built with ``lambda_stmt`` so the statement is constructed once and
+        later calls only bind ``name``.
+
+        Args:
+            session: Session to execute in
+            name: Device name
+
+        Returns:
+            The device, or None if no device has that name
+        """
+        stmt = lambda_stmt(lambda: select(Device))
+        stmt += lambda s: s.where(Device.name == name)
+        return session.scalar(stmt)
 
     def to_dict(self):
-        """Convert model to dictionary."""
-        # Compute primary interface values for backward compatibility
-        primary_interface = None
-        if hasattr(self, "network_interfaces"):
-            primary_interface = next(
-                (ni for ni in self.network_interfaces if ni.is_primary), None
-            )
+        """Convert model to dictionary.
 
+        Datetimes and enums are left as-is for the JSON provider to encode.
+        """
         return {
             "id": self.id,
             "name": self.name,
-            "type": self.type.value if self.type else None,
-            "status": self.status.value if self.status else None,
+            "type": self.type,
+            "status": self.status,
             # Backward compatibility: prefer primary interface, fall back to old fields
-            "ip_address": (
-                primary_interface.ip_address if primary_interface else self.ip_address
-            ),
-            "mac_address": (
-                primary_interface.mac_address if primary_interface else self.mac_address
-            ),
+            "ip_address": self.primary_ip_address or self.ip_address,
+            "mac_address": self.primary_mac_address or self.mac_address,
             "metadata": self.device_metadata,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def __repr__(self):
         """String representation."""
-        return f"<Device {self.name} ({self.type.value if self.type else 'unknown'})>"
+        return f"<Device {self.name} ({self.type or 'unknown'})>"
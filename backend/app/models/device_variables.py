@@ -1,21 +1,27 @@
 """Device variables model for storing per-device automation defaults."""
 
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
-    JSON,
-    Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, JSONBType, utcnow
+from app.models._codegen import codegen_to_dict
 
+if TYPE_CHECKING:
+    from app.models.device import Device
 
+
+@codegen_to_dict
 class DeviceVariables(Base):
     """Store variable defaults for devices, optionally per-playbook.
 
@@ -27,35 +33,83 @@ class DeviceVariables(Base):
     """
 
     __tablename__ = "device_variables"
+    # Read database-set timestamps back with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(
-        Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("devices.id", ondelete="CASCADE")
     )
     # NULL = device-wide defaults, set = playbook-specific overrides
-    playbook_name = Column(String(100), nullable=True)
-    variables = Column(JSON, nullable=False, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    playbook_name: Mapped[str | None] = mapped_column(String(100))
+    variables: Mapped[dict[str, Any]] = mapped_column(JSONBType, server_default="{}")
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
 
-    # Ensure one record per device+playbook combination
+    # Ensure one record per device+playbook combination. NULLs never collide
+    # in a unique constraint, so device defaults need their own partial index.
     __table_args__ = (
         UniqueConstraint("device_id", "playbook_name", name="uq_device_playbook"),
+        Index(
+            "uq_device_variables_defaults",
+            "device_id",
+            unique=True,
+            postgresql_where=playbook_name.is_(None),
+            sqlite_where=playbook_name.is_(None),
+        ),
     )
 
     # Relationship
-    device = relationship("Device", backref="variable_sets")
-
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "device_id": self.device_id,
-            "playbook_name": self.playbook_name,
-            "variables": self.variables,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    device: Mapped["Device"] = relationship(back_populates="variable_sets")
+
+    @classmethod
+    def upsert(
+        cls,
+        session: Session,
+        device_id: int,
+        playbook_name: str | None,
+        variables: dict[str, Any],
+    ) -> "DeviceVariables":
+        """Create or replace a variable set in a single statement.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE ... RETURNING, so the existing
+        row is never read first. The caller commits.
+
+        Args:
+            session: Session to execute in
+            device_id: Device the variables belong to
+            playbook_name: Playbook to scope to, or None for device defaults
+            variables: Variables to store, replacing any existing set
+
+        Returns:
+            The stored variable set
+        """
+        dialect = session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(cls).values(
+            device_id=device_id, playbook_name=playbook_name, variables=variables
+        )
+        if playbook_name is None:
+            conflict = {
+                "index_elements": [cls.device_id],
+                "index_where": cls.playbook_name.is_(None),
+            }
+        else:
+            conflict = {"index_elements": [cls.device_id, cls.playbook_name]}
+        stmt = stmt.on_conflict_do_update(
+            **conflict,
+            set_={
+                "variables": stmt.excluded.variables,
+                "updated_at": utcnow(),
+            },
+        ).returning(cls)
+        return session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
     def __repr__(self):
         """String representation."""
@@ -0,0 +1,68 @@
+"""Error category lookup table for automation jobs."""
+
+import enum
+
+from sqlalchemy import Column, SmallInteger, String, Table, event, insert
+from sqlalchemy.types import TypeDecorator
+
+from app.database import Base
+
+
+class ErrorCategory(enum.StrEnum):
+    """Why an automation job failed, for user feedback."""
+
+    CONNECTIVITY = "connectivity"
+    PERMISSION = "permission"
+    NOT_FOUND = "not_found"
+    TIMEOUT = "timeout"
+    AUTHENTICATION = "authentication"
+    EXECUTION = "execution"
+    CONFIGURATION = "configuration"
+
+
+# Stored IDs. Fixed here rather than read from the table so jobs resolve their
+# category without a JOIN or query; append new categories, never renumber.
+ERROR_CATEGORY_IDS: dict[ErrorCategory, int] = {
+    ErrorCategory.CONNECTIVITY: 1,
+    ErrorCategory.PERMISSION: 2,
+    ErrorCategory.NOT_FOUND: 3,
+    ErrorCategory.TIMEOUT: 4,
+    ErrorCategory.AUTHENTICATION: 5,
+    ErrorCategory.EXECUTION: 6,
+    ErrorCategory.CONFIGURATION: 7,
+}
+_ERROR_CATEGORIES_BY_ID = {id_: name for name, id_ in ERROR_CATEGORY_IDS.items()}
+
+# Names for the IDs, so SQL reading automation_jobs can join for a label
+error_categories = Table(
+    "error_categories",
+    Base.metadata,
+    Column("id", SmallInteger, primary_key=True, autoincrement=False),
+    Column("name", String(32), nullable=False, unique=True),
+)
+
+
+@event.listens_for(error_categories, "after_create")
+def _seed_error_categories(target, connection, **kw):
+    """Fill the table when created outside migrations (e.g. create_all)."""
+    connection.execute(
+        insert(target),
+        [{"id": id_, "name": name} for name, id_ in ERROR_CATEGORY_IDS.items()],
+    )
+
+
+class ErrorCategoryType(TypeDecorator):
+    """ErrorCategory stored as its SMALLINT lookup ID."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return ERROR_CATEGORY_IDS[ErrorCategory(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _ERROR_CATEGORIES_BY_ID[value]
@@ -1,40 +1,35 @@
 """Hardware specification model."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models._codegen import codegen_to_dict
+
+if TYPE_CHECKING:
+    from app.models.device import Device
 
 
+@codegen_to_dict
 class HardwareSpec(Base):
     """Hardware specifications for devices."""
 
     __tablename__ = "hardware_specs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(
-        Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("devices.id", ondelete="CASCADE")
     )
-    cpu_model = Column(String(255), nullable=True)
-    cpu_cores = Column(Integer, nullable=True)
-    ram_gb = Column(Integer, nullable=True)
-    storage_gb = Column(Integer, nullable=True)
-    gpu_model = Column(String(255), nullable=True)
+    cpu_model: Mapped[str | None] = mapped_column(String(255))
+    cpu_cores: Mapped[int | None] = mapped_column(Integer)
+    ram_gb: Mapped[int | None] = mapped_column(Integer)
+    storage_gb: Mapped[int | None] = mapped_column(Integer)
+    gpu_model: Mapped[str | None] = mapped_column(String(255))
 
     # Relationship
-    device = relationship("Device", backref="hardware_spec")
-
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "device_id": self.device_id,
-            "cpu_model": self.cpu_model,
-            "cpu_cores": self.cpu_cores,
-            "ram_gb": self.ram_gb,
-            "storage_gb": self.storage_gb,
-            "gpu_model": self.gpu_model,
-        }
+    device: Mapped["Device"] = relationship(back_populates="hardware_spec")
 
     def __repr__(self):
         """String representation."""
@@ -1,44 +1,71 @@
 """Metric model."""
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    insert,
+    text,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, BigIntegerType, utcnow
+from app.models._codegen import codegen_to_dict
 
+if TYPE_CHECKING:
+    from app.models.device import Device
 
+
+@codegen_to_dict
 class Metric(Base):
     """System metrics for devices."""
 
     __tablename__ = "metrics"
+    __table_args__ = (
+        # Latest samples for a device: WHERE device_id = ? ORDER BY timestamp DESC
+        Index("ix_metrics_device_ts", "device_id", text("timestamp DESC")),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(
-        Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[int] = mapped_column(BigIntegerType, primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("devices.id", ondelete="CASCADE")
     )
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    cpu_usage = Column(Float, nullable=True)  # Percentage
-    memory_usage = Column(Float, nullable=True)  # Percentage
-    disk_usage = Column(Float, nullable=True)  # Percentage
-    network_rx_bytes = Column(BigInteger, nullable=True)
-    network_tx_bytes = Column(BigInteger, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    cpu_usage: Mapped[float | None] = mapped_column(Float)  # Percentage
+    memory_usage: Mapped[float | None] = mapped_column(Float)  # Percentage
+    disk_usage: Mapped[float | None] = mapped_column(Float)  # Percentage
+    network_rx_bytes: Mapped[int | None] = mapped_column(BigInteger)
+    network_tx_bytes: Mapped[int | None] = mapped_column(BigInteger)
 
     # Relationship
-    device = relationship("Device", backref="metrics")
-
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "device_id": self.device_id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "cpu_usage": self.cpu_usage,
-            "memory_usage": self.memory_usage,
-            "disk_usage": self.disk_usage,
-            "network_rx_bytes": self.network_rx_bytes,
-            "network_tx_bytes": self.network_tx_bytes,
-        }
+    device: Mapped["Device"] = relationship(back_populates="metrics")
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert many metric samples without building ORM objects.
+
+        Rows are sent as one executemany, which SQLAlchemy batches into
+        multi-row INSERTs (insertmanyvalues), instead of one INSERT per
+        Metric instance. The caller commits.
+
+        Args:
+            session: Session to execute in
+            rows: Column values for each sample, keyed by attribute name
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        session.execute(insert(cls), rows)
+        return len(rows)
 
     def __repr__(self):
         """String representation."""
@@ -2,13 +2,31 @@
 
 import enum
 
-from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Boolean,
+    ForeignKey,
+    Integer,
+    String,
+    event,
+    select,
+    update,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    object_session,
+    relationship,
+    validates,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from app.database import Base
+from app.models._codegen import codegen_to_dict
+from app.models.device import Device
 
 
-class InterfaceStatus(enum.Enum):
+class InterfaceStatus(enum.StrEnum):
     """Network interface status enumeration."""
 
     UP = "up"
@@ -16,44 +34,81 @@ class InterfaceStatus(enum.Enum):
     DISABLED = "disabled"
 
 
+@codegen_to_dict
 class NetworkInterface(Base):
     """Network interface on a device."""
 
     __tablename__ = "network_interfaces"
 
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(
-        Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("devices.id", ondelete="CASCADE")
+    )
+    interface_name: Mapped[str] = mapped_column(String(50))  # e.g., eth0, ens18
+    mac_address: Mapped[str] = mapped_column(String(17), index=True)  # 00:11:22:...
+    ip_address: Mapped[str | None] = mapped_column(String(45))  # IPv4/IPv6 compatible
+    subnet_mask: Mapped[str | None] = mapped_column(String(45))  # 255.255.255.0 or /24
+    gateway: Mapped[str | None] = mapped_column(String(45))
+    vlan_id: Mapped[int | None] = mapped_column(Integer)  # VLAN tag
+    is_primary: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    status: Mapped[InterfaceStatus | None] = mapped_column(
+        String(16), default=InterfaceStatus.UP
     )
-    interface_name = Column(String(50), nullable=False)  # e.g., eth0, ens18, wlan0
-    mac_address = Column(
-        String(17), nullable=False, index=True
-    )  # Format: 00:11:22:33:44:55
-    ip_address = Column(String(45), nullable=True)  # IPv4/IPv6 compatible
-    subnet_mask = Column(String(45), nullable=True)  # e.g., 255.255.255.0 or /24
-    gateway = Column(String(45), nullable=True)
-    vlan_id = Column(Integer, nullable=True)  # VLAN tag
-    is_primary = Column(Boolean, default=False, nullable=False, index=True)
-    status = Column(Enum(InterfaceStatus), default=InterfaceStatus.UP)
 
     # Relationship
-    device = relationship("Device", backref="network_interfaces")
-
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "device_id": self.device_id,
-            "interface_name": self.interface_name,
-            "mac_address": self.mac_address,
-            "ip_address": self.ip_address,
-            "subnet_mask": self.subnet_mask,
-            "gateway": self.gateway,
-            "vlan_id": self.vlan_id,
-            "is_primary": self.is_primary,
-            "status": self.status.value if self.status else None,
-        }
+    device: Mapped["Device"] = relationship(back_populates="network_interfaces")
+
+    @validates("status")
+    def _validate_status(self, key, value):
+        """Coerce to InterfaceStatus, rejecting unknown values with ValueError."""
+        return InterfaceStatus(value) if value is not None else None
 
     def __repr__(self):
         """String representation."""
         return f"<NetworkInterface {self.interface_name} on device_id={self.device_id}>"
+
+
+@event.listens_for(NetworkInterface, "after_insert")
+@event.listens_for(NetworkInterface, "after_update")
+@event.listens_for(NetworkInterface, "after_delete")
+def _sync_device_primary(mapper, connection, target):
+    """Copy the primary interface's addresses onto its device row.
+
+    Re-reads the primary from the table rather than trusting ``target``,
+    because ensure_single_primary() clears the old primary with a bulk
+    UPDATE that fires no events. The last event of a flush therefore
+    always sees the final state.
+    """
+    interfaces = NetworkInterface.__table__
+    devices = Device.__table__
+
+    primary = connection.execute(
+        select(interfaces.c.ip_address, interfaces.c.mac_address)
+        .where(
+            interfaces.c.device_id == target.device_id,
+            interfaces.c.is_primary.is_(True),
+        )
+        .limit(1)
+    ).first()
+    ip_address, mac_address = primary if primary else (None, None)
+
+    connection.execute(
+        update(devices)
+        .where(
+            devices.c.id == target.device_id,
+            devices.c.primary_ip_address.is_distinct_from(ip_address)
+            | devices.c.primary_mac_address.is_distinct_from(mac_address),
+        )
+        .values(primary_ip_address=ip_address, primary_mac_address=mac_address)
+    )
+
+    # Keep a Device already loaded in this session consistent with the row
+    session = object_session(target)
+    device = (
+        session.identity_map.get(identity_key(Device, target.device_id))
+        if session
+        else None
+    )
+    if device is not None:
+        set_committed_value(device, "primary_ip_address", ip_address)
+        set_committed_value(device, "primary_mac_address", mac_address)
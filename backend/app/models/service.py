@@ -1,14 +1,19 @@
 """Service model."""
 
 import enum
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
+from app.models._codegen import codegen_to_dict
 
+if TYPE_CHECKING:
+    from app.models.device import Device
 
-class ServiceStatus(enum.Enum):
+
+class ServiceStatus(enum.StrEnum):
     """Service status enumeration."""
 
     RUNNING = "running"
@@ -16,35 +21,31 @@ class ServiceStatus(enum.Enum):
     ERROR = "error"
 
 
+@codegen_to_dict
 class Service(Base):
     """Service running on a device."""
 
     __tablename__ = "services"
 
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(
-        Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("devices.id", ondelete="CASCADE")
+    )
+    name: Mapped[str] = mapped_column(String(255))
+    port: Mapped[int | None] = mapped_column(Integer)
+    protocol: Mapped[str | None] = mapped_column(String(50))
+    status: Mapped[ServiceStatus | None] = mapped_column(
+        String(16), default=ServiceStatus.STOPPED
     )
-    name = Column(String(255), nullable=False)
-    port = Column(Integer, nullable=True)
-    protocol = Column(String(50), nullable=True)
-    status = Column(Enum(ServiceStatus), default=ServiceStatus.STOPPED)
-    health_check_url = Column(String(500), nullable=True)
+    health_check_url: Mapped[str | None] = mapped_column(String(500))
 
     # Relationship
-    device = relationship("Device", backref="services")
-
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "device_id": self.device_id,
-            "name": self.name,
-            "port": self.port,
-            "protocol": self.protocol,
-            "status": self.status.value if self.status else None,
-            "health_check_url": self.health_check_url,
-        }
+    device: Mapped["Device"] = relationship(back_populates="services")
+
+    @validates("status")
+    def _validate_status(self, key, value):
+        """Coerce to ServiceStatus, rejecting unknown values with ValueError."""
+        return ServiceStatus(value) if value is not None else None
 
     def __repr__(self):
         """String representation."""
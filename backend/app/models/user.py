@@ -2,93 +2,211 @@
 
 from datetime import datetime
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from sqlalchemy import (
     JSON,
     Boolean,
-    Column,
     DateTime,
     Integer,
-    LargeBinary,
     String,
     Text,
+    case,
+    cast,
+    event,
+    func,
+    select,
 )
-from werkzeug.security import check_password_hash, generate_password_hash
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    column_property,
+    mapped_column,
+    validates,
+)
+from werkzeug.security import check_password_hash
+
+from app.database import Base, utcnow
+from app.models.user_avatar import UserAvatar
 
-from app.database import Base
+# Argon2id via the argon2-cffi C extension. Stored hashes made with other
+# parameters, or by werkzeug before the switch, are upgraded on next login.
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
 
 
 class User(Base):
     """User model for authentication and authorization."""
 
     __tablename__ = "users"
+    # Read database-set timestamps back with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(80), unique=True, nullable=False, index=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    username: Mapped[str] = mapped_column(String(80), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    # Only needed to log in or change password; those queries undefer it
+    password_hash: Mapped[str] = mapped_column(String(255), deferred=True)
 
     # Profile information
-    display_name = Column(String(100), nullable=True)
-    avatar_url = Column(String(500), nullable=True)  # For external URLs
-    avatar_data = Column(LargeBinary, nullable=True)  # For uploaded images
-    avatar_mime_type = Column(String(50), nullable=True)  # e.g., "image/png"
-    bio = Column(Text, nullable=True)
+    display_name: Mapped[str | None] = mapped_column(String(100))
+    # External avatar URL; an uploaded image lives in user_avatars instead
+    avatar_url: Mapped[str | None] = mapped_column(String(500))
+    # Loaded with the row in place of the image itself; kept current by
+    # set_avatar/clear_avatar rather than re-selected after every flush
+    has_avatar: Mapped[bool] = column_property(
+        select(UserAvatar.user_id)
+        .where(UserAvatar.user_id == id)
+        .correlate_except(UserAvatar)
+        .exists(),
+        expire_on_flush=False,
+    )
+    bio: Mapped[str | None] = mapped_column(Text)
 
     # Theme preferences
-    theme_preference = Column(String(50), default="dark", nullable=False)
-    page_accents = Column(
-        JSON, nullable=True
-    )  # {"dashboard": "violet", "devices": "blue", ...}
+    theme_preference: Mapped[str] = mapped_column(String(50), default="dark")
+    # Accent per page, e.g. {"dashboard": "violet", "devices": "blue", ...}
+    page_accents: Mapped[dict[str, str] | None] = mapped_column(JSON)
 
     # Permissions
-    is_admin = Column(Boolean, default=False, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
     )
-    last_login = Column(DateTime, nullable=True)
+    last_login: Mapped[datetime | None] = mapped_column(DateTime)
+
+    @validates("username")
+    def _lowercase_username(self, key, value):
+        """Store usernames lower-cased; login looks them up the same way."""
+        return value.lower() if value is not None else None
 
     def set_password(self, password: str) -> None:
         """Hash and set the user's password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
-        """Check if the provided password matches the hash."""
-        return check_password_hash(self.password_hash, password)
+        """Check if the provided password matches the hash.
+
+        A match against a legacy werkzeug hash, or an Argon2 hash with
+        outdated parameters, re-hashes the password; the caller's commit
+        persists it.
+        """
+        if not self.password_hash.startswith("$argon2"):
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+
+        try:
+            _password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if _password_hasher.check_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
+
+    def set_avatar(self, session: Session, data: bytes, mime_type: str) -> None:
+        """Store an uploaded avatar image for this user. The caller commits."""
+        UserAvatar.store(session, self.id, data, mime_type)
+        self.has_avatar = True
+
+    def clear_avatar(self, session: Session) -> None:
+        """Delete this user's uploaded avatar, if any. The caller commits."""
+        if self.has_avatar:
+            UserAvatar.remove(session, self.id)
+            self.has_avatar = False
 
     def to_dict(self, include_email: bool = False) -> dict:
         """Convert model to dictionary.
 
+        Datetimes are left as-is for the JSON provider to encode.
+
         Args:
             include_email: Whether to include email in response (for profile views)
         """
-        # Determine avatar URL: uploaded avatar takes precedence over external URL
-        if self.avatar_data:
-            avatar_url = f"/api/auth/users/{self.id}/avatar"
-        else:
-            avatar_url = self.avatar_url
-
-        data = {
-            "id": self.id,
-            "username": self.username,
-            "display_name": self.display_name or self.username,
-            "avatar_url": avatar_url,
-            "has_uploaded_avatar": self.avatar_data is not None,
-            "bio": self.bio,
-            "is_admin": self.is_admin,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "last_login": self.last_login.isoformat() if self.last_login else None,
-            "theme_preference": self.theme_preference,
-            "page_accents": self.page_accents,
-        }
-        if include_email:
-            data["email"] = self.email
-        return data
+        return _user_dict(self, include_email)
+
+    @classmethod
+    def list_dicts(cls, session: Session, include_email: bool = False) -> list[dict]:
+        """
+        Serialize every user without building User instances.
+
+        The query computes each ``to_dict`` field itself, so every result row
+        becomes a dict with one C-level ``dict(zip(...))`` call; no instance
+        state, identity-map entries or per-field attribute lookups.
+
+        Args:
+            session: Session to execute in
+            include_email: Whether to include email addresses
+
+        Returns:
+            One ``to_dict``-shaped dictionary per user
+        """
+        columns = _LIST_COLUMNS + (cls.email,) if include_email else _LIST_COLUMNS
+        result = session.execute(select(*columns))
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row, strict=True)) for row in result]
 
     def __repr__(self):
         """String representation."""
         return f"<User {self.username} (admin={self.is_admin})>"
+
+
+@event.listens_for(User, "init")
+def _init_has_avatar(target, args, kwargs):
+    """New users start without an image, so has_avatar needs no reload."""
+    target.has_avatar = False
+
+
+# The fields of _user_dict (minus email) computed in SQL, labelled with their
+# keys; keep the two in step
+_LIST_COLUMNS = (
+    User.id,
+    User.username,
+    # NULLIF: an empty display name falls back too, like `or` in _user_dict
+    func.coalesce(func.nullif(User.display_name, ""), User.username).label(
+        "display_name"
+    ),
+    case(
+        (User.has_avatar, "/api/auth/users/" + cast(User.id, String) + "/avatar"),
+        else_=User.avatar_url,
+    ).label("avatar_url"),
+    User.has_avatar.label("has_uploaded_avatar"),
+    User.bio,
+    User.is_admin,
+    User.is_active,
+    User.created_at,
+    User.last_login,
+    User.theme_preference,
+    User.page_accents,
+)
+
+
+def _user_dict(user, include_email: bool) -> dict:
+    """Build the API dict for a User (see also _LIST_COLUMNS)."""
+    # Determine avatar URL: uploaded avatar takes precedence over external URL
+    if user.has_avatar:
+        avatar_url = f"/api/auth/users/{user.id}/avatar"
+    else:
+        avatar_url = user.avatar_url
+
+    data = {
+        "id": user.id,
+        "username": user.username,
+        "display_name": user.display_name or user.username,
+        "avatar_url": avatar_url,
+        "has_uploaded_avatar": user.has_avatar,
+        "bio": user.bio,
+        "is_admin": user.is_admin,
+        "is_active": user.is_active,
+        "created_at": user.created_at,
+        "last_login": user.last_login,
+        "theme_preference": user.theme_preference,
+        "page_accents": user.page_accents,
+    }
+    if include_email:
+        data["email"] = user.email
+    return data
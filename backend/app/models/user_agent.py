@@ -0,0 +1,66 @@
+"""User agent lookup table shared by audit log entries."""
+
+import hashlib
+
+from sqlalchemy import Integer, LargeBinary, Text, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.database import Base
+
+# Longest User-Agent header stored; longer values are truncated
+MAX_USER_AGENT_LENGTH = 500
+
+
+class UserAgent(Base):
+    """Distinct User-Agent strings, stored once and referenced by ID.
+
+    Audit entries repeat the same handful of browser strings, so keeping
+    them here keeps audit rows narrow.
+    """
+
+    __tablename__ = "user_agents"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # SHA-256 of the value; unique so lookups hit a fixed-width index
+    digest: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True)
+    value: Mapped[str] = mapped_column(Text)
+
+    @staticmethod
+    def digest_of(value: str) -> bytes:
+        """Hash a User-Agent string for lookup."""
+        return hashlib.sha256(value.encode()).digest()
+
+    @classmethod
+    def get_or_create_id(cls, session: Session, value: str) -> int:
+        """Return the ID for a User-Agent string, inserting it if new.
+
+        Known agents (the common case) cost a single indexed SELECT. A new
+        agent is inserted in a savepoint so a concurrent insert of the same
+        string is resolved by re-reading the winner's row.
+
+        Args:
+            session: Session to execute in
+            value: User-Agent header value
+
+        Returns:
+            Primary key of the matching user_agents row
+        """
+        value = value[:MAX_USER_AGENT_LENGTH]
+        digest = cls.digest_of(value)
+        lookup = select(cls.id).where(cls.digest == digest)
+
+        agent_id = session.scalar(lookup)
+        if agent_id is None:
+            try:
+                with session.begin_nested():
+                    agent_id = session.scalar(
+                        insert(cls).values(digest=digest, value=value).returning(cls.id)
+                    )
+            except IntegrityError:
+                agent_id = session.scalar(lookup)
+        return agent_id
+
+    def __repr__(self):
+        """String representation."""
+        return f"<UserAgent {self.id}>"
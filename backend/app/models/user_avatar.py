@@ -0,0 +1,55 @@
+"""Uploaded avatar images, stored apart from the users table."""
+
+from sqlalchemy import ForeignKey, Integer, LargeBinary, String, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.database import Base
+
+
+class UserAvatar(Base):
+    """An uploaded avatar image, one row per user that has one.
+
+    Images run to a few hundred KB, so keeping them out of the users row
+    means loading or listing users never reads them.
+    """
+
+    __tablename__ = "user_avatars"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+    # Content type of data, e.g. "image/png"
+    mime_type: Mapped[str] = mapped_column(String(50))
+
+    @classmethod
+    def store(cls, session: Session, user_id: int, data: bytes, mime_type: str) -> None:
+        """Create or replace a user's avatar in a single statement.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE, so the previous image is
+        never read first. The caller commits.
+
+        Args:
+            session: Session to execute in
+            user_id: User the image belongs to
+            data: Encoded image
+            mime_type: Content type of the image
+        """
+        dialect = session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(cls).values(user_id=user_id, data=data, mime_type=mime_type)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.user_id],
+            set_={"data": stmt.excluded.data, "mime_type": stmt.excluded.mime_type},
+        )
+        session.execute(stmt)
+
+    @classmethod
+    def remove(cls, session: Session, user_id: int) -> None:
+        """Delete a user's avatar, if any. The caller commits."""
+        session.execute(delete(cls).where(cls.user_id == user_id))
+
+    def __repr__(self):
+        """String representation."""
+        return f"<UserAvatar user={self.user_id} ({self.mime_type})>"
@@ -2,11 +2,15 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Text
+from sqlalchemy import DateTime, Integer, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utcnow
+from app.models._codegen import codegen_to_dict
 
 
+# The encrypted content never leaves the model; VaultService decrypts it
+@codegen_to_dict(exclude=("encrypted_content",))
 class VaultSecret(Base):
     """Store encrypted secrets for use in automation playbooks.
 
@@ -15,34 +19,21 @@ class VaultSecret(Base):
     """
 
     __tablename__ = "vault_secrets"
-
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    # Encrypted content stored as binary
-    encrypted_content = Column(LargeBinary, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    def to_dict(self, include_content: bool = False):
-        """Convert model to dictionary.
-
-        Args:
-            include_content: If True, includes decrypted content (use with caution)
-
-        Returns:
-            Dictionary representation of the secret
-        """
-        result = {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-        # Content is only included when explicitly requested
-        # It must be decrypted by the caller using VaultService
-        return result
+    # Read database-set timestamps back with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    description: Mapped[str | None] = mapped_column(Text)
+    # Encrypted content stored as binary; only loaded where it is decrypted,
+    # which undefers it
+    encrypted_content: Mapped[bytes] = mapped_column(LargeBinary, deferred=True)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
 
     def __repr__(self):
         """String representation."""
@@ -1,25 +1,28 @@
 """Workflow models for multi-step automation."""
 
+import enum
 from datetime import datetime
-from enum import Enum as PyEnum
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
-    JSON,
     Boolean,
-    Column,
+    CheckConstraint,
     DateTime,
-    Enum,
     ForeignKey,
     Integer,
     String,
     Text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from app.database import Base
+from app.database import Base, JSONBType, utcnow
+from app.models._codegen import codegen_to_dict
 
+if TYPE_CHECKING:
+    from app.models.automation_job import AutomationJob
 
-class WorkflowStatus(PyEnum):
+
+class WorkflowStatus(enum.StrEnum):
     """Workflow instance status."""
 
     PENDING = "pending"
@@ -31,6 +34,7 @@ class WorkflowStatus(PyEnum):
     ROLLED_BACK = "rolled_back"
 
 
+@codegen_to_dict
 class WorkflowTemplate(Base):
     """Template defining a reusable workflow.
 
@@ -39,33 +43,28 @@ class WorkflowTemplate(Base):
     """
 
     __tablename__ = "workflow_templates"
+    # Read database-set timestamps back with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    description: Mapped[str | None] = mapped_column(Text)
     # Steps define the workflow structure
     # Format: [{"order": 1, "action_name": "ping", "executor_type": "ansible",
     #           "depends_on": [], "rollback_action": null, "extra_vars": {}}]
-    steps = Column(JSON, nullable=False, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    steps: Mapped[list[dict[str, Any]]] = mapped_column(JSONBType, default=list)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
 
     # Relationships
-    instances = relationship(
-        "WorkflowInstance", back_populates="template", cascade="all, delete-orphan"
+    instances: Mapped[list["WorkflowInstance"]] = relationship(
+        back_populates="template", cascade="all, delete-orphan"
     )
 
-    def to_dict(self):
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "steps": self.steps,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
     def __repr__(self):
         """String representation."""
         return f"<WorkflowTemplate {self.name}>"
@@ -79,35 +78,52 @@ class WorkflowInstance(Base):
     """
 
     __tablename__ = "workflow_instances"
+    __table_args__ = (
+        # Plain varchar storage, so the database checks the value set instead
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s}'" for s in WorkflowStatus)),
+            name="ck_workflow_instances_status",
+        ),
+    )
+    # Read database-set timestamps back with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    template_id = Column(
-        Integer, ForeignKey("workflow_templates.id", ondelete="SET NULL"), nullable=True
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    template_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("workflow_templates.id", ondelete="SET NULL")
     )
     # Store template snapshot in case template is modified/deleted
-    template_snapshot = Column(JSON, nullable=True)
-    status = Column(Enum(WorkflowStatus), default=WorkflowStatus.PENDING)
+    template_snapshot: Mapped[dict[str, Any] | None] = mapped_column(JSONBType)
+    status: Mapped[WorkflowStatus | None] = mapped_column(
+        String(16), default=WorkflowStatus.PENDING
+    )
     # Target devices for this workflow execution
-    device_ids = Column(JSON, nullable=False)
+    device_ids: Mapped[list[int]] = mapped_column(JSONBType)
     # Whether to run rollback actions on failure
-    rollback_on_failure = Column(Boolean, default=False)
+    rollback_on_failure: Mapped[bool | None] = mapped_column(Boolean, default=False)
     # Extra variables passed to all steps
-    extra_vars = Column(JSON, nullable=True)
+    extra_vars: Mapped[dict[str, Any] | None] = mapped_column(JSONBType)
     # Execution timestamps
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
     # Error message if failed
-    error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    error_message: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, server_default=utcnow()
+    )
 
     # Relationships
-    template = relationship("WorkflowTemplate", back_populates="instances")
-    jobs = relationship(
-        "AutomationJob",
+    template: Mapped[WorkflowTemplate | None] = relationship(back_populates="instances")
+    jobs: Mapped[list["AutomationJob"]] = relationship(
         back_populates="workflow_instance",
         foreign_keys="AutomationJob.workflow_instance_id",
     )
 
+    @validates("status")
+    def _validate_status(self, key, value):
+        """Coerce to WorkflowStatus, rejecting unknown values with ValueError."""
+        return WorkflowStatus(value) if value is not None else None
+
     def to_dict(self, include_jobs: bool = False):
         """Convert model to dictionary.
 
@@ -121,22 +137,19 @@ class WorkflowInstance(Base):
             "id": self.id,
             "template_id": self.template_id,
             "template_name": self.template.name if self.template else None,
-            "status": self.status.value if self.status else None,
+            "status": self.status,
             "device_ids": self.device_ids,
             "rollback_on_failure": self.rollback_on_failure,
             "extra_vars": self.extra_vars,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "error_message": self.error_message,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
         if include_jobs:
-            result["jobs"] = [job.to_dict() for job in self.jobs]
+            result["jobs"] = [job.to_dict(include_log=False) for job in self.jobs]
         return result
 
     def __repr__(self):
         """String representation."""
-        status_str = self.status.value if self.status else "unknown"
-        return f"<WorkflowInstance {self.id} ({status_str})>"
+        return f"<WorkflowInstance {self.id} ({self.status or 'unknown'})>"
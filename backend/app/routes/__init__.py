@@ -1,27 +1,46 @@
 """Route registration."""
 
+import importlib
+
 from flask import Flask
 
-from app.routes.auth import auth_bp
-from app.routes.automation import automation_bp
-from app.routes.devices import devices_bp
-from app.routes.metrics import metrics_bp
-from app.routes.network_interfaces import interfaces_bp
-from app.routes.services import services_bp
-from app.routes.workflows import workflows_bp
+from app.routes.errors import errors_bp
+
+# (name in ENABLED_BLUEPRINTS, "module:attribute", URL prefix under API_PREFIX).
+# Modules are imported only when enabled, so a node serving a subset of the
+# API never loads the others' handlers or their dependencies.
+BLUEPRINTS = (
+    # Auth routes (public login, protected user management)
+    ("auth", "app.routes.auth:auth_bp", "/auth"),
+    # Protected routes
+    ("devices", "app.routes.devices:devices_bp", "/devices"),
+    ("services", "app.routes.services:services_bp", "/services"),
+    ("metrics", "app.routes.metrics:metrics_bp", "/metrics"),
+    ("automation", "app.routes.automation:automation_bp", "/automation"),
+    ("workflows", "app.routes.workflows:workflows_bp", "/workflows"),
+    ("interfaces", "app.routes.network_interfaces:interfaces_bp", ""),
+)
+BLUEPRINT_NAMES = tuple(name for name, _, _ in BLUEPRINTS)
 
 
 def register_blueprints(app: Flask):
-    """Register all blueprints with the Flask app."""
+    """Register the enabled blueprints with the Flask app."""
     api_prefix = app.config.get("API_PREFIX", "/api")
+    enabled = set(app.config.get("ENABLED_BLUEPRINTS", BLUEPRINT_NAMES))
 
-    # Auth routes (public login, protected user management)
-    app.register_blueprint(auth_bp, url_prefix=f"{api_prefix}/auth")
+    unknown = enabled.difference(BLUEPRINT_NAMES)
+    if unknown:
+        raise ValueError(
+            f"Unknown ENABLED_BLUEPRINTS: {', '.join(sorted(unknown))} "
+            f"(choose from {', '.join(BLUEPRINT_NAMES)})"
+        )
 
-    # Protected routes
-    app.register_blueprint(devices_bp, url_prefix=f"{api_prefix}/devices")
-    app.register_blueprint(services_bp, url_prefix=f"{api_prefix}/services")
-    app.register_blueprint(metrics_bp, url_prefix=f"{api_prefix}/metrics")
-    app.register_blueprint(automation_bp, url_prefix=f"{api_prefix}/automation")
-    app.register_blueprint(workflows_bp, url_prefix=f"{api_prefix}/workflows")
-    app.register_blueprint(interfaces_bp, url_prefix=api_prefix)
+    # App-wide JSON error handlers
+    app.register_blueprint(errors_bp)
+
+    for name, target, prefix in BLUEPRINTS:
+        if name not in enabled:
+            continue
+        module_name, attribute = target.split(":")
+        blueprint = getattr(importlib.import_module(module_name), attribute)
+        app.register_blueprint(blueprint, url_prefix=f"{api_prefix}{prefix}")
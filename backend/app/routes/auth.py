@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 from io import BytesIO
 
-from flask import Blueprint, Response, jsonify, make_response, request
+from flask import Blueprint, Response, current_app, jsonify, make_response, request
 from flask_jwt_extended import (
     create_access_token,
     get_csrf_token,
@@ -13,9 +13,11 @@ from flask_jwt_extended import (
     unset_jwt_cookies,
 )
 from PIL import Image
+from sqlalchemy import or_
+from sqlalchemy.orm import undefer
 
 from app.extensions import limiter
-from app.models import AppSetting, User
+from app.models import AppSetting, User, UserAvatar
 from app.schemas.auth import (
     AdminPasswordReset,
     LoginRequest,
@@ -25,6 +27,7 @@ from app.schemas.auth import (
     UserUpdate,
 )
 from app.utils.audit import log_login_failure, log_login_success
+from app.utils.auth import require_admin, user_claims
 from app.utils.errors import (
     ConflictError,
     DatabaseSession,
@@ -32,6 +35,7 @@ from app.utils.errors import (
     ValidationError,
     success_response,
 )
+from app.utils.password_cache import check_password_cached
 from app.utils.validation import validate_request
 
 # Allowed MIME types for avatar uploads
@@ -45,28 +49,29 @@ MAX_AVATAR_SIZE = 5 * 1024 * 1024  # 5 MB
 AVATAR_MAX_DIMENSION = 256  # Max width/height for avatars
 
 # File signature (magic bytes) to MIME type mapping
-# More reliable than Content-Type header which can be spoofed
+# More reliable than Content-Type header which can be spoofed. Keyed by the
+# first three bytes, which differ for every accepted format, so one lookup
+# finds the only candidate; the value holds the full signature(s) to confirm.
 FILE_SIGNATURES = {
-    b"\x89PNG\r\n\x1a\n": "image/png",
-    b"\xff\xd8\xff": "image/jpeg",  # JPEG starts with FFD8FF
-    b"GIF87a": "image/gif",
-    b"GIF89a": "image/gif",
-    b"RIFF": "image/webp",  # WebP starts with RIFF...WEBP
+    b"\x89PN": (b"\x89PNG\r\n\x1a\n", "image/png"),
+    b"\xff\xd8\xff": (b"\xff\xd8\xff", "image/jpeg"),  # JPEG starts with FFD8FF
+    b"GIF": ((b"GIF87a", b"GIF89a"), "image/gif"),
+    b"RIF": (b"RIFF", "image/webp"),  # WebP starts with RIFF...WEBP
 }
 
 # Protect against decompression bombs
 Image.MAX_IMAGE_PIXELS = 25_000_000  # 25 megapixels max
 
 
-def get_session_timeout() -> timedelta:
+def get_session_timeout(db) -> timedelta:
     """Get session timeout from app settings.
 
+    Args:
+        db: The route's database session; it is left open
+
     Returns:
         timedelta for JWT token expiration
     """
-    from app.database import Session
-
-    db = Session()
     try:
         setting = (
             db.query(AppSetting)
@@ -76,13 +81,45 @@ def get_session_timeout() -> timedelta:
         if setting:
             minutes = int(setting.value)
             return timedelta(minutes=minutes)
-    except Exception:
+    except (TypeError, ValueError):
         pass
-    finally:
-        db.close()
 
-    # Default to 60 minutes if setting not found
-    return timedelta(minutes=60)
+    # Fall back to the built-in default if the setting is missing or invalid
+    return timedelta(minutes=int(AppSetting.get_default("session_timeout_minutes")))
+
+
+def get_user_for_update(db, user_id: int, email: str | None) -> User:
+    """Fetch a user and check that a new email is free, in one query.
+
+    Args:
+        db: Database session
+        user_id: ID of the user being updated
+        email: New email address, or None if it is not changing
+
+    Returns:
+        The user
+
+    Raises:
+        NotFoundError: If the user does not exist
+        ConflictError: If another user already has the email
+    """
+    condition = User.id == user_id
+    if email is not None:
+        condition = or_(condition, User.email == email)
+
+    user = None
+    email_taken = False
+    for row in db.query(User).filter(condition):
+        if row.id == user_id:
+            user = row
+        else:
+            email_taken = True
+
+    if user is None:
+        raise NotFoundError("User", user_id)
+    if email_taken:
+        raise ConflictError("Email already in use")
+    return user
 
 
 def validate_image_signature(file_data: bytes) -> str | None:
@@ -94,20 +131,23 @@ def validate_image_signature(file_data: bytes) -> str | None:
     Returns:
         Detected MIME type if valid, None if no match
     """
-    for signature, mime_type in FILE_SIGNATURES.items():
-        if file_data.startswith(signature):
-            return mime_type
-    # Special case for WebP: check for RIFF....WEBP pattern
-    if file_data[:4] == b"RIFF" and file_data[8:12] == b"WEBP":
-        return "image/webp"
-    return None
+    candidate = FILE_SIGNATURES.get(file_data[:3])
+    if candidate is None:
+        return None
+    signature, mime_type = candidate
+    if not file_data.startswith(signature):
+        return None
+    # RIFF is a generic container (WAV, AVI, ...); WebP names itself at byte 8
+    if mime_type == "image/webp" and file_data[8:12] != b"WEBP":
+        return None
+    return mime_type
 
 
 def process_avatar_image(file_data: bytes) -> tuple[bytes, str]:
     """Process and optimize avatar image.
 
     Validates the image data, resizes to max 256x256 while preserving
-    aspect ratio, converts to PNG for consistency, and optimizes file size.
+    aspect ratio, and converts to PNG for consistency.
 
     Args:
         file_data: Raw image file bytes
@@ -118,29 +158,36 @@ def process_avatar_image(file_data: bytes) -> tuple[bytes, str]:
     Raises:
         ValueError: If image data is invalid or corrupted
     """
-    # First, verify the image is valid using Pillow's verify()
-    # This catches corrupted or malformed image files
+    # Decoding fully is the validity check: a corrupted or truncated file
+    # fails here, so no separate verify() pass over the data is needed
     try:
-        verify_img = Image.open(BytesIO(file_data))
-        verify_img.verify()  # Checks for corruption/truncation
+        img = Image.open(BytesIO(file_data))
+
+        # Have libjpeg decode large JPEGs at 1/2 to 1/8 scale, still at least
+        # twice the target size. thumbnail() would request this itself, but
+        # convert() below decodes the image first.
+        if img.format == "JPEG":
+            img.draft(None, (AVATAR_MAX_DIMENSION * 2, AVATAR_MAX_DIMENSION * 2))
+
+        # Handle different image modes - keep alpha channel for transparency
+        img = (
+            img.convert("RGBA")
+            if img.mode in ("RGBA", "LA", "P")
+            else img.convert("RGB")
+        )
     except Exception as e:
         raise ValueError(f"Invalid or corrupted image file: {e}") from e
 
-    # Re-open the image for actual processing (verify() consumes the file)
-    img = Image.open(BytesIO(file_data))
-
-    # Handle different image modes - keep alpha channel for transparency
-    img = img.convert("RGBA") if img.mode in ("RGBA", "LA", "P") else img.convert("RGB")
-
     # Resize if larger than max dimension
     if img.width > AVATAR_MAX_DIMENSION or img.height > AVATAR_MAX_DIMENSION:
         img.thumbnail(
             (AVATAR_MAX_DIMENSION, AVATAR_MAX_DIMENSION), Image.Resampling.LANCZOS
         )
 
-    # Save as PNG with optimization
+    # Save as PNG at zlib's default level; optimize=True (level 9) costs more
+    # time than it saves bytes on an image this small
     output = BytesIO()
-    img.save(output, format="PNG", optimize=True)
+    img.save(output, format="PNG", compress_level=6)
 
     return output.getvalue(), "image/png"
 
@@ -192,9 +239,15 @@ def login():
     data = request.validated_data
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.username == data.username.lower()).first()
+        user = (
+            db.query(User)
+            .options(undefer(User.password_hash))
+            .filter(User.username == data.username.lower())
+            .first()
+        )
 
-        if not user or not user.check_password(data.password):
+        verify_ttl = current_app.config["AUTH_VERIFY_CACHE_TTL"]
+        if not user or not check_password_cached(user, data.password, verify_ttl):
             log_login_failure(data.username, "invalid_credentials")
             raise ValidationError("Invalid username or password")
 
@@ -205,14 +258,15 @@ def login():
         # Update last login timestamp
         user.last_login = datetime.utcnow()
         db.commit()
-        db.refresh(user)
 
         # Log successful login
         log_login_success(user.id, user.username)
 
         # Create access token with user ID as identity (must be string for JWT)
         access_token = create_access_token(
-            identity=str(user.id), expires_delta=get_session_timeout()
+            identity=str(user.id),
+            expires_delta=get_session_timeout(db),
+            additional_claims=user_claims(user),
         )
 
         # Build response with user data and CSRF token
@@ -268,14 +322,20 @@ def get_current_user():
     user_id = int(get_jwt_identity())
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
+        # Never re-issue a token to a deactivated account
+        if not user.is_active:
+            raise ValidationError("Account is disabled")
+
         # Generate fresh access token to provide CSRF token for session refresh
         # This is needed when the page is refreshed and CSRF token (in memory) is lost
         access_token = create_access_token(
-            identity=str(user.id), expires_delta=get_session_timeout()
+            identity=str(user.id),
+            expires_delta=get_session_timeout(db),
+            additional_claims=user_claims(user),
         )
 
         response_data = {
@@ -326,20 +386,10 @@ def update_current_user():
     data = request.validated_data
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise NotFoundError("User", user_id)
+        user = get_user_for_update(db, user_id, data.email)
 
         # Update allowed fields (non-admin can't change is_admin or is_active)
         if data.email is not None:
-            # Check email uniqueness
-            existing = (
-                db.query(User)
-                .filter(User.email == data.email, User.id != user_id)
-                .first()
-            )
-            if existing:
-                raise ConflictError("Email already in use")
             user.email = data.email
         if data.display_name is not None:
             user.display_name = data.display_name
@@ -347,13 +397,11 @@ def update_current_user():
             user.avatar_url = data.avatar_url
             # Clear uploaded avatar when setting external URL
             if data.avatar_url:
-                user.avatar_data = None
-                user.avatar_mime_type = None
+                user.clear_avatar(db)
         if data.bio is not None:
             user.bio = data.bio
 
         db.commit()
-        db.refresh(user)
 
         return success_response(user.to_dict(include_email=True))
 
@@ -394,7 +442,7 @@ def change_password():
     data = request.validated_data
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id, options=[undefer(User.password_hash)])
         if not user:
             raise NotFoundError("User", user_id)
 
@@ -440,7 +488,7 @@ def update_preferences():
     data = request.validated_data
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
@@ -450,7 +498,6 @@ def update_preferences():
             user.page_accents = data.page_accents
 
         db.commit()
-        db.refresh(user)
 
         return success_response(user.to_dict(include_email=True))
 
@@ -513,7 +560,7 @@ def upload_avatar():
     if file.content_type not in ALLOWED_AVATAR_MIME_TYPES:
         raise ValidationError("Invalid file type. Allowed: PNG, JPG, GIF, WebP")
 
-    # Process image: verify, resize, and optimize
+    # Process image: decode (validating it), resize, and optimize
     try:
         processed_data, processed_mime = process_avatar_image(file_data)
     except ValueError as e:
@@ -522,17 +569,15 @@ def upload_avatar():
         raise ValidationError("Invalid or corrupted image file") from None
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
         # Store processed avatar in database
-        user.avatar_data = processed_data
-        user.avatar_mime_type = processed_mime
+        user.set_avatar(db, processed_data, processed_mime)
         user.avatar_url = None  # Clear external URL when uploading
 
         db.commit()
-        db.refresh(user)
 
         return success_response(
             {
@@ -560,17 +605,15 @@ def delete_avatar():
     user_id = int(get_jwt_identity())
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
         # Clear both uploaded and external avatar
-        user.avatar_data = None
-        user.avatar_mime_type = None
+        user.clear_avatar(db)
         user.avatar_url = None
 
         db.commit()
-        db.refresh(user)
 
         return success_response(
             {
@@ -598,16 +641,15 @@ def get_user_avatar(user_id: int):
         description: User or avatar not found
     """
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise NotFoundError("User", user_id)
-
-        if not user.avatar_data:
+        avatar = db.get(UserAvatar, user_id)
+        if not avatar:
+            if not db.get(User, user_id):
+                raise NotFoundError("User", user_id)
             raise NotFoundError("Avatar", user_id)
 
         return Response(
-            user.avatar_data,
-            mimetype=user.avatar_mime_type or "image/png",
+            avatar.data,
+            mimetype=avatar.mime_type,
             headers={
                 "Cache-Control": "public, max-age=86400",  # Cache for 1 day
             },
@@ -616,7 +658,7 @@ def get_user_avatar(user_id: int):
 
 # Admin-only user management routes
 @auth_bp.route("/users", methods=["GET"])
-@jwt_required()
+@require_admin()
 def list_users():
     """List all users (admin only).
     ---
@@ -636,19 +678,12 @@ def list_users():
       403:
         description: Admin access required
     """
-    user_id = int(get_jwt_identity())
-
     with DatabaseSession() as db:
-        current_user = db.query(User).filter(User.id == user_id).first()
-        if not current_user or not current_user.is_admin:
-            raise ValidationError("Admin access required")
-
-        users = db.query(User).all()
-        return success_response([user.to_dict(include_email=True) for user in users])
+        return success_response(User.list_dicts(db, include_email=True))
 
 
 @auth_bp.route("/users", methods=["POST"])
-@jwt_required()
+@require_admin()
 @validate_request(UserCreate)
 def create_user():
     """Create a new user (admin only).
@@ -694,20 +729,18 @@ def create_user():
       409:
         description: User already exists
     """
-    admin_id = int(get_jwt_identity())
     data = request.validated_data
 
     with DatabaseSession() as db:
-        current_user = db.query(User).filter(User.id == admin_id).first()
-        if not current_user or not current_user.is_admin:
-            raise ValidationError("Admin access required")
-
-        # Check for existing username
-        if db.query(User).filter(User.username == data.username).first():
+        # Check username and email uniqueness in one query
+        taken = (
+            db.query(User.username, User.email)
+            .filter(or_(User.username == data.username, User.email == data.email))
+            .all()
+        )
+        if any(username == data.username for username, _ in taken):
             raise ConflictError("Username already exists")
-
-        # Check for existing email
-        if db.query(User).filter(User.email == data.email).first():
+        if taken:
             raise ConflictError("Email already in use")
 
         user = User(
@@ -720,13 +753,12 @@ def create_user():
 
         db.add(user)
         db.commit()
-        db.refresh(user)
 
         return success_response(user.to_dict(include_email=True), status_code=201)
 
 
 @auth_bp.route("/users/<int:user_id>", methods=["GET"])
-@jwt_required()
+@require_admin()
 def get_user(user_id: int):
     """Get a specific user (admin only).
     ---
@@ -749,14 +781,8 @@ def get_user(user_id: int):
       404:
         description: User not found
     """
-    admin_id = int(get_jwt_identity())
-
     with DatabaseSession() as db:
-        current_user = db.query(User).filter(User.id == admin_id).first()
-        if not current_user or not current_user.is_admin:
-            raise ValidationError("Admin access required")
-
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
@@ -764,7 +790,7 @@ def get_user(user_id: int):
 
 
 @auth_bp.route("/users/<int:user_id>", methods=["PUT"])
-@jwt_required()
+@require_admin()
 @validate_request(UserUpdate)
 def update_user(user_id: int):
     """Update a user (admin only).
@@ -807,23 +833,10 @@ def update_user(user_id: int):
     data = request.validated_data
 
     with DatabaseSession() as db:
-        current_user = db.query(User).filter(User.id == admin_id).first()
-        if not current_user or not current_user.is_admin:
-            raise ValidationError("Admin access required")
-
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise NotFoundError("User", user_id)
+        user = get_user_for_update(db, user_id, data.email)
 
         # Update fields
         if data.email is not None:
-            existing = (
-                db.query(User)
-                .filter(User.email == data.email, User.id != user_id)
-                .first()
-            )
-            if existing:
-                raise ConflictError("Email already in use")
             user.email = data.email
         if data.display_name is not None:
             user.display_name = data.display_name
@@ -843,13 +856,12 @@ def update_user(user_id: int):
             user.is_active = data.is_active
 
         db.commit()
-        db.refresh(user)
 
         return success_response(user.to_dict(include_email=True))
 
 
 @auth_bp.route("/users/<int:user_id>", methods=["DELETE"])
-@jwt_required()
+@require_admin()
 def delete_user(user_id: int):
     """Delete a user (admin only).
     ---
@@ -874,18 +886,16 @@ def delete_user(user_id: int):
     """
     admin_id = int(get_jwt_identity())
 
-    with DatabaseSession() as db:
-        current_user = db.query(User).filter(User.id == admin_id).first()
-        if not current_user or not current_user.is_admin:
-            raise ValidationError("Admin access required")
-
-        if user_id == admin_id:
-            raise ValidationError("Cannot delete your own account")
+    if user_id == admin_id:
+        raise ValidationError("Cannot delete your own account")
 
-        user = db.query(User).filter(User.id == user_id).first()
+    with DatabaseSession() as db:
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
+        # The foreign key cascades on PostgreSQL; SQLite does not enforce it
+        user.clear_avatar(db)
         db.delete(user)
         db.commit()
 
@@ -893,7 +903,7 @@ def delete_user(user_id: int):
 
 
 @auth_bp.route("/users/<int:user_id>/reset-password", methods=["POST"])
-@jwt_required()
+@require_admin()
 @validate_request(AdminPasswordReset)
 def admin_reset_password(user_id: int):
     """Reset a user's password (admin only).
@@ -929,15 +939,10 @@ def admin_reset_password(user_id: int):
       404:
         description: User not found
     """
-    admin_id = int(get_jwt_identity())
     data = request.validated_data
 
     with DatabaseSession() as db:
-        current_user = db.query(User).filter(User.id == admin_id).first()
-        if not current_user or not current_user.is_admin:
-            raise ValidationError("Admin access required")
-
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
             raise NotFoundError("User", user_id)
 
@@ -954,7 +959,7 @@ def admin_reset_password(user_id: int):
 
 
 @auth_bp.route("/settings", methods=["GET"])
-@jwt_required()
+@require_admin()
 def get_settings():
     """Get all application settings.
     ---
@@ -982,19 +987,13 @@ def get_settings():
       403:
         description: Admin access required
     """
-    user_id = int(get_jwt_identity())
-
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_admin:
-            raise ValidationError("Admin access required")
-
         settings = db.query(AppSetting).order_by(AppSetting.key).all()
         return success_response([s.to_dict() for s in settings])
 
 
 @auth_bp.route("/settings/<key>", methods=["PUT"])
-@jwt_required()
+@require_admin()
 @limiter.limit("10 per minute")
 def update_setting(key: str):
     """Update an application setting.
@@ -1037,10 +1036,6 @@ def update_setting(key: str):
         raise ValidationError("Value is required")
 
     with DatabaseSession() as db:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_admin:
-            raise ValidationError("Admin access required")
-
         setting = db.query(AppSetting).filter(AppSetting.key == key).first()
         if not setting:
             raise NotFoundError("Setting", key)
@@ -1075,6 +1070,5 @@ def update_setting(key: str):
         setting.value = new_value
         setting.updated_by = user_id
         db.commit()
-        db.refresh(setting)
 
         return success_response(setting.to_dict())
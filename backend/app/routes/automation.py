@@ -5,10 +5,13 @@ import re
 from flask import Blueprint, Response, request
 from flask_jwt_extended import jwt_required
 from kombu.exceptions import OperationalError as KombuOperationalError
+from sqlalchemy import exists, select
+from sqlalchemy.orm import selectinload, undefer
 
 from app import limiter
 from app.config import Config
 from app.models import AutomationJob, Device, JobStatus, VaultSecret
+from app.models.automation_job import automation_job_devices
 from app.schemas.automation import AutomationJobCreate
 from app.services.executors import registry
 from app.services.vault import VaultService
@@ -19,6 +22,7 @@ from app.utils.errors import (
     ValidationError,
     success_response,
 )
+from app.utils.loading import strict_loading
 from app.utils.pagination import (
     get_pagination_params,
     paginate_query,
@@ -96,7 +100,6 @@ def trigger_automation():
     with DatabaseSession() as db:
         # Build list of target devices
         devices_list = []
-        all_device_ids = []
 
         if data.device_ids and len(data.device_ids) > 0:
             # Multi-device mode: fetch all specified devices
@@ -122,7 +125,7 @@ def trigger_automation():
         else:
             # Single device mode
             device_id = data.device_id
-            device = db.query(Device).filter(Device.id == device_id).first()
+            device = db.get(Device, device_id)
             if not device:
                 raise NotFoundError("Device", device_id)
 
@@ -130,15 +133,15 @@ def trigger_automation():
                 raise ValidationError("Device must have an IP address for automation")
 
             primary_device = device
-            all_device_ids = [device_id]
+            devices = [device]
 
         # Validate vault secret if provided
         vault_password = None
         if data.vault_secret_id:
-            vault_secret = (
-                db.query(VaultSecret)
-                .filter(VaultSecret.id == data.vault_secret_id)
-                .first()
+            vault_secret = db.get(
+                VaultSecret,
+                data.vault_secret_id,
+                options=[undefer(VaultSecret.encrypted_content)],
             )
             if not vault_secret:
                 raise NotFoundError("VaultSecret", data.vault_secret_id)
@@ -148,7 +151,7 @@ def trigger_automation():
         # Create the job
         job = AutomationJob(
             device_id=primary_device.id,
-            device_ids=all_device_ids if len(all_device_ids) > 1 else None,
+            target_devices=devices,
             executor_type=data.executor_type,
             action_name=data.action_name,
             action_config=data.action_config,
@@ -217,7 +220,7 @@ def get_job_status(job_id: int):
         description: Job not found
     """
     with DatabaseSession() as db:
-        job = db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(db, job_id)
         if not job:
             raise NotFoundError("Job", job_id)
 
@@ -254,7 +257,7 @@ def get_job_logs(job_id: int):
         description: Job not found
     """
     with DatabaseSession() as db:
-        job = db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(db, job_id)
         if not job:
             raise NotFoundError("Job", job_id)
 
@@ -292,11 +295,11 @@ def stream_job_logs(job_id: int):
 
     # Verify job exists first
     with DatabaseSession() as db:
-        job = db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(db, job_id)
         if not job:
             raise NotFoundError("Job", job_id)
 
-        initial_status = job.status.value
+        initial_status = str(job.status)
         initial_logs = job.log_output or ""
         initial_progress = job.progress
 
@@ -392,14 +395,14 @@ def cancel_job(job_id: int):
     from datetime import datetime
 
     with DatabaseSession() as db:
-        job = db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(db, job_id)
         if not job:
             raise NotFoundError("Job", job_id)
 
         # Can only cancel running or pending jobs
         if job.status not in (JobStatus.RUNNING, JobStatus.PENDING):
             raise ValidationError(
-                f"Cannot cancel job with status '{job.status.value}'. "
+                f"Cannot cancel job with status '{job.status}'. "
                 "Only running or pending jobs can be cancelled."
             )
 
@@ -465,19 +468,19 @@ def rerun_job(job_id: int):
     from app.services.vault import VaultService
 
     with DatabaseSession() as db:
-        job = db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(db, job_id)
         if not job:
             raise NotFoundError("Job", job_id)
 
         # Cannot re-run jobs that are still in progress
         if job.status in (JobStatus.RUNNING, JobStatus.PENDING):
             raise ValidationError(
-                f"Cannot re-run job with status '{job.status.value}'. "
+                f"Cannot re-run job with status '{job.status}'. "
                 "Wait for it to complete or cancel it first."
             )
 
         # Get the device
-        device = db.query(Device).filter(Device.id == job.device_id).first()
+        device = job.device
         if not device:
             raise NotFoundError("Device", job.device_id)
 
@@ -491,19 +494,18 @@ def rerun_job(job_id: int):
 
         # Build device list for multi-device jobs
         devices_list = []
-        if job.device_ids and len(job.device_ids) > 1:
-            devices = db.query(Device).filter(Device.id.in_(job.device_ids)).all()
-            for d in devices:
+        if len(job.target_devices) > 1:
+            for d in job.target_devices:
                 if d.ip_address:
                     devices_list.append({"ip": d.ip_address, "name": d.name})
 
         # Get vault password if needed
         vault_password = None
         if job.vault_secret_id:
-            vault_secret = (
-                db.query(VaultSecret)
-                .filter(VaultSecret.id == job.vault_secret_id)
-                .first()
+            vault_secret = db.get(
+                VaultSecret,
+                job.vault_secret_id,
+                options=[undefer(VaultSecret.encrypted_content)],
             )
             if vault_secret:
                 vault_password = VaultService.decrypt(vault_secret.encrypted_content)
@@ -758,20 +760,31 @@ def list_jobs():
 
         if device_id:
             # Verify device exists
-            device = db.query(Device).filter(Device.id == device_id).first()
+            device = db.get(Device, device_id)
             if not device:
                 raise NotFoundError("Device", device_id)
-            query = query.filter(AutomationJob.device_id == device_id)
+            # Batch jobs count for every device they target, not just the primary
+            query = query.filter(
+                AutomationJob.id.in_(
+                    select(automation_job_devices.c.job_id).where(
+                        automation_job_devices.c.device_id == device_id
+                    )
+                )
+            )
 
         if executor_type:
             query = query.filter(AutomationJob.executor_type == executor_type)
 
         # Order by id descending (newest first)
-        query = query.order_by(AutomationJob.id.desc())
+        query = query.order_by(AutomationJob.id.desc()).options(
+            selectinload(AutomationJob.target_devices),
+            selectinload(AutomationJob.depends_on),
+            *strict_loading(),
+        )
         jobs, total = paginate_query(query, page, per_page)
 
         return paginated_response(
-            [job.to_dict() for job in jobs], total, page, per_page
+            [job.to_dict(include_log=False) for job in jobs], total, page, per_page
         )
 
 
@@ -871,8 +884,7 @@ def create_vault_secret():
 
     with DatabaseSession() as db:
         # Check for existing secret with same name
-        existing = db.query(VaultSecret).filter(VaultSecret.name == name).first()
-        if existing:
+        if db.query(exists().where(VaultSecret.name == name)).scalar():
             raise ValidationError(f"Secret with name '{name}' already exists")
 
         # Encrypt the content
@@ -910,7 +922,7 @@ def get_vault_secret(secret_id: int):
         description: Secret not found
     """
     with DatabaseSession() as db:
-        secret = db.query(VaultSecret).filter(VaultSecret.id == secret_id).first()
+        secret = db.get(VaultSecret, secret_id)
         if not secret:
             raise NotFoundError("VaultSecret", secret_id)
 
@@ -956,7 +968,7 @@ def update_vault_secret(secret_id: int):
         raise ValidationError("No data provided")
 
     with DatabaseSession() as db:
-        secret = db.query(VaultSecret).filter(VaultSecret.id == secret_id).first()
+        secret = db.get(VaultSecret, secret_id)
         if not secret:
             raise NotFoundError("VaultSecret", secret_id)
 
@@ -994,7 +1006,7 @@ def delete_vault_secret(secret_id: int):
         description: Secret not found
     """
     with DatabaseSession() as db:
-        secret = db.query(VaultSecret).filter(VaultSecret.id == secret_id).first()
+        secret = db.get(VaultSecret, secret_id)
         if not secret:
             raise NotFoundError("VaultSecret", secret_id)
 
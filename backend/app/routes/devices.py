@@ -2,8 +2,9 @@
 
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required
+from sqlalchemy import delete, or_, select
 
-from app.models import Device, DeviceStatus, DeviceType, DeviceVariables
+from app.models import Device, DeviceStatus, DeviceType, DeviceVariables, Metric
 from app.schemas.device import DeviceCreate, DeviceUpdate, DeviceVariablesUpdate
 from app.utils.errors import (
     ConflictError,
@@ -96,7 +97,7 @@ def get_device(device_id: int):
         description: Device not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
         return success_response(device.to_dict())
@@ -162,7 +163,7 @@ def create_device():
 
     with DatabaseSession() as db:
         # Check if device with same name already exists
-        existing = db.query(Device).filter(Device.name == data.name).first()
+        existing = Device.get_by_name(db, data.name)
         if existing:
             raise ConflictError("Device with this name already exists")
 
@@ -172,7 +173,7 @@ def create_device():
             status=DeviceStatus(data.status) if data.status else DeviceStatus.INACTIVE,
             ip_address=data.ip_address,
             mac_address=data.mac_address,
-            device_metadata=data.metadata or {},
+            device_metadata=data.metadata,
         )
 
         db.add(device)
@@ -233,7 +234,7 @@ def update_device(device_id: int):
     data = request.validated_data
 
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
@@ -283,7 +284,7 @@ def delete_device(device_id: int):
         description: Device not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
@@ -291,12 +292,32 @@ def delete_device(device_id: int):
         from app.models import (
             AutomationJob,
             HardwareSpec,
-            Metric,
             NetworkInterface,
             Service,
         )
+        from app.models.automation_job import (
+            automation_job_deps,
+            automation_job_devices,
+        )
         from app.models.device_variables import DeviceVariables
 
+        job_ids = select(AutomationJob.id).where(AutomationJob.device_id == device_id)
+        db.execute(
+            delete(automation_job_devices).where(
+                or_(
+                    automation_job_devices.c.device_id == device_id,
+                    automation_job_devices.c.job_id.in_(job_ids),
+                )
+            )
+        )
+        db.execute(
+            delete(automation_job_deps).where(
+                or_(
+                    automation_job_deps.c.job_id.in_(job_ids),
+                    automation_job_deps.c.depends_on_id.in_(job_ids),
+                )
+            )
+        )
         db.query(AutomationJob).filter(AutomationJob.device_id == device_id).delete(
             synchronize_session=False
         )
@@ -349,12 +370,12 @@ def get_device_services(device_id: int):
         description: Device not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
-        services = [service.to_dict() for service in device.services]
-        return success_response(services)
+        services = db.scalars(device.services.select())
+        return success_response([service.to_dict() for service in services])
 
 
 @devices_bp.route("/<int:device_id>/metrics", methods=["GET"])
@@ -389,15 +410,22 @@ def get_device_metrics(device_id: int):
         description: Device not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
         # Get limit from query params, default to 100
         limit = request.args.get("limit", 100, type=int)
 
-        # Get recent metrics from device's relationship
-        metrics = device.metrics[-limit:] if device.metrics else []
+        # Newest samples via ix_metrics_device_ts, returned oldest first
+        metrics = (
+            db.query(Metric)
+            .filter(Metric.device_id == device_id)
+            .order_by(Metric.timestamp.desc())
+            .limit(limit)
+            .all()
+        )
+        metrics.reverse()
 
         return success_response([metric.to_dict() for metric in metrics])
 
@@ -437,7 +465,7 @@ def get_device_variables(device_id: int):
         description: Device not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
@@ -497,32 +525,13 @@ def update_device_variables(device_id: int):
     data = request.validated_data
 
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
-        # Find or create device defaults (playbook_name = NULL)
-        var_set = (
-            db.query(DeviceVariables)
-            .filter(
-                DeviceVariables.device_id == device_id,
-                DeviceVariables.playbook_name.is_(None),
-            )
-            .first()
-        )
-
-        if var_set:
-            var_set.variables = data.variables
-        else:
-            var_set = DeviceVariables(
-                device_id=device_id,
-                playbook_name=None,
-                variables=data.variables,
-            )
-            db.add(var_set)
-
+        # Create or replace device defaults (playbook_name = NULL)
+        var_set = DeviceVariables.upsert(db, device_id, None, data.variables)
         db.commit()
-        db.refresh(var_set)
 
         return success_response(var_set.to_dict())
 
@@ -550,7 +559,7 @@ def get_device_playbook_variables(device_id: int, playbook_name: str):
         description: Device or variables not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
@@ -610,32 +619,13 @@ def update_device_playbook_variables(device_id: int, playbook_name: str):
     data = request.validated_data
 
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
-        # Find or create playbook-specific overrides
-        var_set = (
-            db.query(DeviceVariables)
-            .filter(
-                DeviceVariables.device_id == device_id,
-                DeviceVariables.playbook_name == playbook_name,
-            )
-            .first()
-        )
-
-        if var_set:
-            var_set.variables = data.variables
-        else:
-            var_set = DeviceVariables(
-                device_id=device_id,
-                playbook_name=playbook_name,
-                variables=data.variables,
-            )
-            db.add(var_set)
-
+        # Create or replace playbook-specific overrides
+        var_set = DeviceVariables.upsert(db, device_id, playbook_name, data.variables)
         db.commit()
-        db.refresh(var_set)
 
         return success_response(var_set.to_dict())
 
@@ -663,7 +653,7 @@ def delete_device_playbook_variables(device_id: int, playbook_name: str):
         description: Device or variables not found
     """
     with DatabaseSession() as db:
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
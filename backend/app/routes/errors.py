@@ -0,0 +1,87 @@
+"""Application-wide JSON error handlers."""
+
+import logging
+
+import orjson
+from flask import Blueprint, current_app, jsonify
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
+
+from app.utils.errors import APIError, handle_database_exception
+
+logger = logging.getLogger(__name__)
+
+errors_bp = Blueprint("errors", __name__)
+
+# Pre-serialized bodies for error responses whose payload never changes
+RATE_LIMIT_BODY = orjson.dumps(
+    {"error": "Rate limit exceeded. Please try again later."}
+)
+NOT_FOUND_BODY = orjson.dumps({"error": "Endpoint not found"})
+METHOD_NOT_ALLOWED_BODY = orjson.dumps({"error": "Method not allowed"})
+INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error"})
+
+
+def _static_json_response(body: bytes, status: int):
+    """Build a JSON response from pre-serialized bytes."""
+    return current_app.response_class(body, status, mimetype="application/json")
+
+
+@errors_bp.app_errorhandler(APIError)
+def handle_api_error(error):
+    """Handle custom API errors."""
+    logger.warning("API Error %s: %s", error.status_code, error.message)
+    return jsonify(error.to_dict()), error.status_code
+
+
+@errors_bp.app_errorhandler(SQLAlchemyError)
+def handle_sqlalchemy_error(error):
+    """Handle SQLAlchemy database errors."""
+    logger.error("Database error: %s", error)
+    return handle_database_exception(error)
+
+
+@errors_bp.app_errorhandler(ValueError)
+def handle_value_error(error):
+    """Handle ValueError exceptions (usually enum validation)."""
+    logger.warning("ValueError: %s", error)
+    # Don't expose raw error message in production
+    return jsonify({"error": "Invalid input provided"}), 400
+
+
+@errors_bp.app_errorhandler(429)
+def handle_rate_limit_exceeded(error):
+    """Handle rate limit exceeded errors."""
+    logger.warning("Rate limit exceeded: %s", error.description)
+    return _static_json_response(RATE_LIMIT_BODY, 429)
+
+
+@errors_bp.app_errorhandler(404)
+def handle_not_found(error):
+    """Handle 404 Not Found errors."""
+    return _static_json_response(NOT_FOUND_BODY, 404)
+
+
+@errors_bp.app_errorhandler(405)
+def handle_method_not_allowed(error):
+    """Handle 405 Method Not Allowed errors."""
+    return _static_json_response(METHOD_NOT_ALLOWED_BODY, 405)
+
+
+@errors_bp.app_errorhandler(500)
+def handle_internal_error(error):
+    """Handle 500 Internal Server Error."""
+    # Unhandled exceptions were already logged with a traceback by Flask
+    if error.original_exception is None:
+        logger.error("Internal server error: %s", error)
+    return _static_json_response(INTERNAL_ERROR_BODY, 500)
+
+
+@errors_bp.app_errorhandler(HTTPException)
+def handle_http_exception(error):
+    """Handle remaining HTTP errors (400, 401, 413, ...) as JSON.
+
+    Unhandled non-HTTP exceptions are logged by Flask and routed to the
+    500 handler above.
+    """
+    return jsonify({"error": error.description}), error.code
@@ -4,7 +4,7 @@ from flask import Blueprint, request
 from flask_jwt_extended import jwt_required
 
 from app.models import Device, Metric
-from app.schemas.metric import MetricCreate
+from app.schemas.metric import MetricBatchCreate, MetricCreate
 from app.utils.errors import (
     DatabaseSession,
     NotFoundError,
@@ -76,7 +76,7 @@ def submit_metrics():
 
     with DatabaseSession() as db:
         # Verify device exists
-        device = db.query(Device).filter(Device.id == data.device_id).first()
+        device = db.get(Device, data.device_id)
         if not device:
             raise NotFoundError("Device", data.device_id)
 
@@ -94,3 +94,79 @@ def submit_metrics():
         db.refresh(metric)
 
         return success_response(metric.to_dict(), status_code=201)
+
+
+@metrics_bp.route("/batch", methods=["POST"])
+@jwt_required()
+@validate_request(MetricBatchCreate)
+def submit_metrics_batch():
+    """Submit metrics for one or more devices in a single request.
+    ---
+    tags:
+      - Metrics
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          required:
+            - metrics
+          properties:
+            metrics:
+              type: array
+              description: Up to 1000 samples, same fields as POST /metrics
+              items:
+                type: object
+                required:
+                  - device_id
+                properties:
+                  device_id:
+                    type: integer
+                  cpu_usage:
+                    type: number
+                    format: float
+                  memory_usage:
+                    type: number
+                    format: float
+                  disk_usage:
+                    type: number
+                    format: float
+                  network_rx_bytes:
+                    type: integer
+                  network_tx_bytes:
+                    type: integer
+    responses:
+      201:
+        description: Metrics submitted successfully
+        schema:
+          type: object
+          properties:
+            data:
+              type: object
+              properties:
+                inserted:
+                  type: integer
+      400:
+        description: Validation error
+      404:
+        description: Device not found
+    """
+    data = request.validated_data
+    rows = [sample.model_dump() for sample in data.metrics]
+
+    with DatabaseSession() as db:
+        # Verify every referenced device exists with a single query
+        device_ids = {row["device_id"] for row in rows}
+        found = {
+            device_id
+            for (device_id,) in db.query(Device.id).filter(Device.id.in_(device_ids))
+        }
+        missing = device_ids - found
+        if missing:
+            raise NotFoundError("Device", min(missing))
+
+        inserted = Metric.bulk_insert(db, rows)
+        db.commit()
+
+        return success_response({"inserted": inserted}, status_code=201)
@@ -2,6 +2,7 @@
 
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required
+from sqlalchemy import exists
 
 from app.models import Device, InterfaceStatus, NetworkInterface
 from app.schemas.network_interface import (
@@ -57,7 +58,7 @@ def list_device_interfaces(device_id: int):
     """
     with DatabaseSession() as db:
         # Verify device exists
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
@@ -182,20 +183,18 @@ def create_device_interface(device_id: int):
 
     with DatabaseSession() as db:
         # Verify device exists
-        device = db.query(Device).filter(Device.id == device_id).first()
+        device = db.get(Device, device_id)
         if not device:
             raise NotFoundError("Device", device_id)
 
         # Check if MAC address already exists for this device
-        existing = (
-            db.query(NetworkInterface)
-            .filter(
+        mac_taken = db.query(
+            exists().where(
                 NetworkInterface.device_id == device_id,
                 NetworkInterface.mac_address == data.mac_address,
             )
-            .first()
-        )
-        if existing:
+        ).scalar()
+        if mac_taken:
             raise ConflictError(
                 "Interface with this MAC address already exists for this device"
             )
@@ -301,16 +300,14 @@ def update_device_interface(device_id: int, interface_id: int):
 
         # Check for MAC address conflicts if updating MAC
         if data.mac_address and data.mac_address != interface.mac_address:
-            existing = (
-                db.query(NetworkInterface)
-                .filter(
+            mac_taken = db.query(
+                exists().where(
                     NetworkInterface.device_id == device_id,
                     NetworkInterface.mac_address == data.mac_address,
                     NetworkInterface.id != interface_id,
                 )
-                .first()
-            )
-            if existing:
+            ).scalar()
+            if mac_taken:
                 raise ConflictError(
                     "Interface with this MAC address already exists for this device"
                 )
@@ -540,11 +537,7 @@ def get_interface(interface_id: int):
         description: Interface not found
     """
     with DatabaseSession() as db:
-        interface = (
-            db.query(NetworkInterface)
-            .filter(NetworkInterface.id == interface_id)
-            .first()
-        )
+        interface = db.get(NetworkInterface, interface_id)
 
         if not interface:
             raise NotFoundError("Interface", interface_id)
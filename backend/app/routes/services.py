@@ -86,7 +86,7 @@ def get_service(service_id: int):
         description: Service not found
     """
     with DatabaseSession() as db:
-        service = db.query(Service).filter(Service.id == service_id).first()
+        service = db.get(Service, service_id)
         if not service:
             raise NotFoundError("Service", service_id)
         return success_response(service.to_dict())
@@ -146,7 +146,7 @@ def create_service():
 
     with DatabaseSession() as db:
         # Verify device exists
-        device = db.query(Device).filter(Device.id == data.device_id).first()
+        device = db.get(Device, data.device_id)
         if not device:
             raise NotFoundError("Device", data.device_id)
 
@@ -208,7 +208,7 @@ def update_service(service_id: int):
     data = request.validated_data
 
     with DatabaseSession() as db:
-        service = db.query(Service).filter(Service.id == service_id).first()
+        service = db.get(Service, service_id)
         if not service:
             raise NotFoundError("Service", service_id)
 
@@ -256,7 +256,7 @@ def delete_service(service_id: int):
         description: Service not found
     """
     with DatabaseSession() as db:
-        service = db.query(Service).filter(Service.id == service_id).first()
+        service = db.get(Service, service_id)
         if not service:
             raise NotFoundError("Service", service_id)
 
@@ -301,7 +301,7 @@ def update_service_status(service_id: int):
     data = request.validated_data
 
     with DatabaseSession() as db:
-        service = db.query(Service).filter(Service.id == service_id).first()
+        service = db.get(Service, service_id)
         if not service:
             raise NotFoundError("Service", service_id)
 
@@ -3,9 +3,16 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required
 from pydantic import BaseModel, Field
+from sqlalchemy import exists
+from sqlalchemy.orm import joinedload, selectinload
 
 from app import limiter
-from app.models import WorkflowInstance, WorkflowStatus, WorkflowTemplate
+from app.models import (
+    AutomationJob,
+    WorkflowInstance,
+    WorkflowStatus,
+    WorkflowTemplate,
+)
 from app.services.workflow_engine import WorkflowOrchestrator
 from app.utils.errors import (
     DatabaseSession,
@@ -13,6 +20,7 @@ from app.utils.errors import (
     ValidationError,
     success_response,
 )
+from app.utils.loading import strict_loading
 from app.utils.pagination import (
     get_pagination_params,
     paginate_query,
@@ -191,12 +199,10 @@ def create_template():
 
     with DatabaseSession() as db:
         # Check for existing template with same name
-        existing = (
-            db.query(WorkflowTemplate)
-            .filter(WorkflowTemplate.name == data.name)
-            .first()
-        )
-        if existing:
+        name_taken = db.query(
+            exists().where(WorkflowTemplate.name == data.name)
+        ).scalar()
+        if name_taken:
             raise ValidationError(f"Template with name '{data.name}' already exists")
 
         template = WorkflowTemplate(
@@ -231,11 +237,7 @@ def get_template(template_id: int):
         description: Template not found
     """
     with DatabaseSession() as db:
-        template = (
-            db.query(WorkflowTemplate)
-            .filter(WorkflowTemplate.id == template_id)
-            .first()
-        )
+        template = db.get(WorkflowTemplate, template_id)
         if not template:
             raise NotFoundError("WorkflowTemplate", template_id)
 
@@ -280,25 +282,19 @@ def update_template(template_id: int):
     data: WorkflowTemplateUpdate = request.validated_data
 
     with DatabaseSession() as db:
-        template = (
-            db.query(WorkflowTemplate)
-            .filter(WorkflowTemplate.id == template_id)
-            .first()
-        )
+        template = db.get(WorkflowTemplate, template_id)
         if not template:
             raise NotFoundError("WorkflowTemplate", template_id)
 
         if data.name is not None:
             # Check for name conflict
-            existing = (
-                db.query(WorkflowTemplate)
-                .filter(
+            name_taken = db.query(
+                exists().where(
                     WorkflowTemplate.name == data.name,
                     WorkflowTemplate.id != template_id,
                 )
-                .first()
-            )
-            if existing:
+            ).scalar()
+            if name_taken:
                 raise ValidationError(
                     f"Template with name '{data.name}' already exists"
                 )
@@ -355,11 +351,7 @@ def delete_template(template_id: int):
         description: Template not found
     """
     with DatabaseSession() as db:
-        template = (
-            db.query(WorkflowTemplate)
-            .filter(WorkflowTemplate.id == template_id)
-            .first()
-        )
+        template = db.get(WorkflowTemplate, template_id)
         if not template:
             raise NotFoundError("WorkflowTemplate", template_id)
 
@@ -487,7 +479,14 @@ def list_instances():
     page, per_page = get_pagination_params()
 
     with DatabaseSession() as db:
-        query = db.query(WorkflowInstance).order_by(WorkflowInstance.id.desc())
+        query = (
+            db.query(WorkflowInstance)
+            .options(
+                joinedload(WorkflowInstance.template).load_only(WorkflowTemplate.name),
+                *strict_loading(),
+            )
+            .order_by(WorkflowInstance.id.desc())
+        )
 
         if template_id:
             query = query.filter(WorkflowInstance.template_id == template_id)
@@ -533,11 +532,22 @@ def get_instance(instance_id: int):
     include_jobs = request.args.get("include_jobs", "false").lower() == "true"
 
     with DatabaseSession() as db:
-        instance = (
+        query = (
             db.query(WorkflowInstance)
+            .options(
+                joinedload(WorkflowInstance.template).load_only(WorkflowTemplate.name)
+            )
             .filter(WorkflowInstance.id == instance_id)
-            .first()
         )
+        if include_jobs:
+            query = query.options(
+                selectinload(WorkflowInstance.jobs).options(
+                    selectinload(AutomationJob.target_devices),
+                    selectinload(AutomationJob.depends_on),
+                    *strict_loading(),
+                )
+            )
+        instance = query.options(*strict_loading()).first()
         if not instance:
             raise NotFoundError("WorkflowInstance", instance_id)
 
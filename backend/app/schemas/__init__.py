@@ -10,6 +10,7 @@ from app.schemas.device import (
     DeviceUpdate,
 )
 from app.schemas.metric import (
+    MetricBatchCreate,
     MetricCreate,
     MetricResponse,
 )
@@ -35,6 +36,7 @@ __all__ = [
     "ServiceUpdate",
     "ServiceResponse",
     "MetricCreate",
+    "MetricBatchCreate",
     "MetricResponse",
     "AutomationJobCreate",
     "AutomationJobResponse",
@@ -47,6 +47,21 @@ class MetricCreate(MetricBase):
     device_id: int = Field(..., description="ID of the device this metric belongs to")
 
 
+# Most samples accepted in one batch submission
+MAX_METRIC_BATCH = 1000
+
+
+class MetricBatchCreate(BaseModel):
+    """Schema for submitting several metric samples at once."""
+
+    metrics: list[MetricCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_METRIC_BATCH,
+        description="Metric samples, each for an existing device",
+    )
+
+
 class MetricResponse(MetricBase):
     """Schema for metric response."""
 
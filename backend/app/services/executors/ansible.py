@@ -8,7 +8,6 @@ from typing import Any
 import yaml
 
 from app.config import Config
-from app.tasks.automation import run_ansible_playbook
 
 from .base import ActionInfo, BaseExecutor
 
@@ -70,6 +69,9 @@ class AnsibleExecutor(BaseExecutor):
         Returns:
             Celery task ID for tracking
         """
+        # Imported here so web processes only load Celery once a job is queued
+        from app.tasks.automation import run_ansible_playbook
+
         task = run_ansible_playbook.delay(
             job_id=job_id,
             device_ip=device_ip,
@@ -81,8 +83,10 @@ class AnsibleExecutor(BaseExecutor):
         )
         device_count = len(devices) if devices else 1
         logger.info(
-            f"Queued playbook execution for job {job_id}, "
-            f"task_id={task.id}, devices={device_count}"
+            "Queued playbook execution for job %s, task_id=%s, devices=%s",
+            job_id,
+            task.id,
+            device_count,
         )
         return task.id
 
@@ -117,7 +121,7 @@ class AnsibleExecutor(BaseExecutor):
         """
         # Validate action name contains only safe characters (prevent path traversal)
         if not SAFE_ACTION_NAME_PATTERN.match(action_name):
-            logger.warning(f"Invalid action name rejected: {action_name}")
+            logger.warning("Invalid action name rejected: %s", action_name)
             return False
 
         # Build path and resolve to absolute
@@ -125,7 +129,7 @@ class AnsibleExecutor(BaseExecutor):
 
         # Ensure the resolved path is within the playbooks directory (prevent symlink attacks)
         if not str(playbook_path).startswith(str(self.playbooks_dir.resolve())):
-            logger.warning(f"Path traversal attempt blocked: {action_name}")
+            logger.warning("Path traversal attempt blocked: %s", action_name)
             return False
 
         return playbook_path.exists()
@@ -180,7 +184,7 @@ class AnsibleExecutor(BaseExecutor):
                 schema = yaml.safe_load(f)
                 return schema if isinstance(schema, dict) else None
         except Exception as e:
-            logger.warning(f"Failed to load schema for {action_name}: {e}")
+            logger.warning("Failed to load schema for %s: %s", action_name, e)
             return None
 
     def get_schema_defaults(self, action_name: str) -> dict:
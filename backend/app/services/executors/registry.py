@@ -31,7 +31,7 @@ class ExecutorRegistry:
         """
         executor_type = executor_class.get_executor_type()
         self._executors[executor_type] = executor_class()
-        logger.info(f"Registered executor: {executor_type}")
+        logger.info("Registered executor: %s", executor_type)
 
     def get_executor(self, executor_type: str) -> BaseExecutor | None:
         """Get an executor instance by type.
@@ -3,11 +3,12 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
 
 from app.models import (
     AutomationJob,
     Device,
+    ErrorCategory,
     JobStatus,
     VaultSecret,
     WorkflowInstance,
@@ -62,11 +63,7 @@ class WorkflowOrchestrator:
             ValueError: If template not found or invalid
         """
         # Fetch template
-        template = (
-            self.db.query(WorkflowTemplate)
-            .filter(WorkflowTemplate.id == template_id)
-            .first()
-        )
+        template = self.db.get(WorkflowTemplate, template_id)
         if not template:
             raise ValueError(f"Workflow template {template_id} not found")
 
@@ -89,10 +86,10 @@ class WorkflowOrchestrator:
         # Get vault password if vault secret specified
         vault_password = None
         if vault_secret_id:
-            vault_secret = (
-                self.db.query(VaultSecret)
-                .filter(VaultSecret.id == vault_secret_id)
-                .first()
+            vault_secret = self.db.get(
+                VaultSecret,
+                vault_secret_id,
+                options=[undefer(VaultSecret.encrypted_content)],
             )
             if not vault_secret:
                 raise ValueError(f"Vault secret {vault_secret_id} not found")
@@ -100,7 +97,7 @@ class WorkflowOrchestrator:
 
         # Create workflow instance with template snapshot
         instance = WorkflowInstance(
-            template_id=template_id,
+            template=template,
             template_snapshot={
                 "name": template.name,
                 "steps": template.steps,
@@ -114,7 +111,7 @@ class WorkflowOrchestrator:
         self.db.flush()  # Get instance ID
 
         # Create jobs for all steps
-        step_jobs = {}  # step_order -> job_id mapping
+        step_jobs = {}  # step_order -> job mapping
         for step in sorted(template.steps, key=lambda s: s.get("order", 0)):
             step_order = step.get("order", 0)
             action_name = step.get("action_name")
@@ -125,8 +122,8 @@ class WorkflowOrchestrator:
             # Merge extra vars: workflow > step
             merged_vars = {**(extra_vars or {}), **step_extra_vars}
 
-            # Map depends_on step orders to job IDs
-            depends_on_job_ids = [step_jobs[o] for o in depends_on if o in step_jobs]
+            # Map depends_on step orders to the jobs created for them
+            depends_on_jobs = [step_jobs[o] for o in depends_on if o in step_jobs]
 
             # Use first device as primary (for FK constraint)
             primary_device = devices[0]
@@ -134,7 +131,7 @@ class WorkflowOrchestrator:
             # Create the job
             job = AutomationJob(
                 device_id=primary_device.id,
-                device_ids=device_ids if len(device_ids) > 1 else None,
+                target_devices=devices,
                 executor_type=executor_type,
                 action_name=action_name,
                 extra_vars=merged_vars if merged_vars else None,
@@ -142,12 +139,11 @@ class WorkflowOrchestrator:
                 status=JobStatus.PENDING,
                 workflow_instance_id=instance.id,
                 step_order=step_order,
-                depends_on_job_ids=depends_on_job_ids if depends_on_job_ids else None,
+                depends_on=depends_on_jobs,
                 is_rollback=False,
             )
             self.db.add(job)
-            self.db.flush()
-            step_jobs[step_order] = job.id
+            step_jobs[step_order] = job
 
         self.db.commit()
 
@@ -181,6 +177,7 @@ class WorkflowOrchestrator:
                 AutomationJob.status == JobStatus.PENDING,
                 AutomationJob.is_rollback == False,  # noqa: E712
             )
+            .options(selectinload(AutomationJob.depends_on))
             .all()
         )
 
@@ -193,8 +190,7 @@ class WorkflowOrchestrator:
 
         for job in pending_jobs:
             # Check if all dependencies are satisfied
-            depends_on = job.depends_on_job_ids or []
-            if all(dep_id in completed_job_ids for dep_id in depends_on):
+            if all(dep.id in completed_job_ids for dep in job.depends_on):
                 self._execute_job(job, devices, vault_password)
 
     def _execute_job(
@@ -212,9 +208,9 @@ class WorkflowOrchestrator:
         """
         executor = registry.get_executor(job.executor_type)
         if not executor:
-            logger.error(f"Executor {job.executor_type} not found for job {job.id}")
+            logger.error("Executor %s not found for job %s", job.executor_type, job.id)
             job.status = JobStatus.FAILED
-            job.error_category = "configuration"
+            job.error_category = ErrorCategory.CONFIGURATION
             self.db.commit()
             return
 
@@ -235,11 +231,11 @@ class WorkflowOrchestrator:
             if celery_task_id:
                 job.celery_task_id = celery_task_id
                 self.db.commit()
-            logger.info(f"Started workflow job {job.id} (step {job.step_order})")
+            logger.info("Started workflow job %s (step %s)", job.id, job.step_order)
         except Exception as e:
-            logger.exception(f"Failed to start job {job.id}: {e}")
+            logger.exception("Failed to start job %s: %s", job.id, e)
             job.status = JobStatus.FAILED
-            job.error_category = "execution"
+            job.error_category = ErrorCategory.EXECUTION
             self.db.commit()
 
     def on_job_complete(self, job_id: int):
@@ -250,7 +246,7 @@ class WorkflowOrchestrator:
         Args:
             job_id: ID of the completed job
         """
-        job = self.db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(self.db, job_id)
         if not job or not job.workflow_instance_id:
             return
 
@@ -267,10 +263,10 @@ class WorkflowOrchestrator:
         # Get vault password if needed
         vault_password = None
         if job.vault_secret_id:
-            vault_secret = (
-                self.db.query(VaultSecret)
-                .filter(VaultSecret.id == job.vault_secret_id)
-                .first()
+            vault_secret = self.db.get(
+                VaultSecret,
+                job.vault_secret_id,
+                options=[undefer(VaultSecret.encrypted_content)],
             )
             if vault_secret:
                 vault_password = VaultService.decrypt(vault_secret.encrypted_content)
@@ -287,7 +283,7 @@ class WorkflowOrchestrator:
                 instance.status = WorkflowStatus.COMPLETED
                 instance.completed_at = datetime.utcnow()
                 self.db.commit()
-                logger.info(f"Workflow instance {instance.id} completed successfully")
+                logger.info("Workflow instance %s completed successfully", instance.id)
             else:
                 # Start next ready jobs
                 self._start_ready_jobs(instance, devices, vault_password)
@@ -303,7 +299,9 @@ class WorkflowOrchestrator:
                 )
                 self.db.commit()
                 logger.info(
-                    f"Workflow instance {instance.id} failed at step {job.step_order}"
+                    "Workflow instance %s failed at step %s",
+                    instance.id,
+                    job.step_order,
                 )
 
     def _trigger_rollback(
@@ -321,7 +319,7 @@ class WorkflowOrchestrator:
         """
         instance.status = WorkflowStatus.ROLLING_BACK
         self.db.commit()
-        logger.info(f"Starting rollback for workflow instance {instance.id}")
+        logger.info("Starting rollback for workflow instance %s", instance.id)
 
         # Get template steps
         steps = (
@@ -348,9 +346,7 @@ class WorkflowOrchestrator:
                 primary_device = devices[0]
                 rollback_job = AutomationJob(
                     device_id=primary_device.id,
-                    device_ids=instance.device_ids
-                    if len(instance.device_ids) > 1
-                    else None,
+                    target_devices=devices,
                     executor_type=step.get("executor_type", "ansible"),
                     action_name=rollback_action,
                     extra_vars=instance.extra_vars,
@@ -398,10 +394,10 @@ class WorkflowOrchestrator:
             vault_password = None
             first_job = rollback_jobs[0] if rollback_jobs else None
             if first_job and first_job.vault_secret_id:
-                vault_secret = (
-                    self.db.query(VaultSecret)
-                    .filter(VaultSecret.id == first_job.vault_secret_id)
-                    .first()
+                vault_secret = self.db.get(
+                    VaultSecret,
+                    first_job.vault_secret_id,
+                    options=[undefer(VaultSecret.encrypted_content)],
                 )
                 if vault_secret:
                     vault_password = VaultService.decrypt(
@@ -418,7 +414,7 @@ class WorkflowOrchestrator:
             instance.status = WorkflowStatus.ROLLED_BACK
             instance.completed_at = datetime.utcnow()
             self.db.commit()
-            logger.info(f"Workflow instance {instance.id} rolled back successfully")
+            logger.info("Workflow instance %s rolled back successfully", instance.id)
 
     def cancel_workflow(self, instance_id: int) -> WorkflowInstance:
         """Cancel a running workflow.
@@ -432,8 +428,16 @@ class WorkflowOrchestrator:
         Raises:
             ValueError: If instance not found or not cancellable
         """
+        # The caller returns the instance with its jobs, so load them up front
         instance = (
             self.db.query(WorkflowInstance)
+            .options(
+                joinedload(WorkflowInstance.template),
+                selectinload(WorkflowInstance.jobs).options(
+                    selectinload(AutomationJob.target_devices),
+                    selectinload(AutomationJob.depends_on),
+                ),
+            )
             .filter(WorkflowInstance.id == instance_id)
             .first()
         )
@@ -441,7 +445,7 @@ class WorkflowOrchestrator:
             raise ValueError(f"Workflow instance {instance_id} not found")
 
         if instance.status not in (WorkflowStatus.PENDING, WorkflowStatus.RUNNING):
-            raise ValueError(f"Cannot cancel workflow in {instance.status.value} state")
+            raise ValueError(f"Cannot cancel workflow in {instance.status} state")
 
         # Mark pending jobs as cancelled
         for job in instance.jobs:
@@ -455,5 +459,5 @@ class WorkflowOrchestrator:
         instance.completed_at = datetime.utcnow()
         self.db.commit()
 
-        logger.info(f"Workflow instance {instance.id} cancelled")
+        logger.info("Workflow instance %s cancelled", instance.id)
         return instance
@@ -18,7 +18,7 @@ from celery.exceptions import SoftTimeLimitExceeded
 from app.celery_app import celery_app
 from app.config import Config
 from app.database import Session
-from app.models import AutomationJob, JobStatus
+from app.models import AutomationJob, ErrorCategory, JobStatus
 
 logger = logging.getLogger(__name__)
 
@@ -295,27 +295,27 @@ ansible_python_interpreter=/usr/bin/python3
     return inventory_path
 
 
-def _categorize_error(error: Exception) -> str:
+def _categorize_error(error: Exception) -> ErrorCategory:
     """Categorize an error for better user feedback.
 
     Args:
         error: The exception that occurred
 
     Returns:
-        Error category string
+        Error category
     """
     error_str = str(error).lower()
     if "connection refused" in error_str or "unreachable" in error_str:
-        return "connectivity"
+        return ErrorCategory.CONNECTIVITY
     elif "permission denied" in error_str:
-        return "permission"
+        return ErrorCategory.PERMISSION
     elif "not found" in error_str:
-        return "not_found"
+        return ErrorCategory.NOT_FOUND
     elif "timeout" in error_str:
-        return "timeout"
+        return ErrorCategory.TIMEOUT
     elif "authentication" in error_str:
-        return "authentication"
-    return "execution"
+        return ErrorCategory.AUTHENTICATION
+    return ErrorCategory.EXECUTION
 
 
 def _sanitize_extra_vars(extra_vars: dict[str, Any] | None) -> dict[str, Any]:
@@ -337,7 +337,7 @@ def _sanitize_extra_vars(extra_vars: dict[str, Any] | None) -> dict[str, Any]:
     for key, value in extra_vars.items():
         # Validate key is alphanumeric with underscores
         if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", key):
-            logger.warning(f"Skipping invalid variable name: {key}")
+            logger.warning("Skipping invalid variable name: %s", key)
             continue
 
         # Only allow safe types
@@ -353,7 +353,7 @@ def _sanitize_extra_vars(extra_vars: dict[str, Any] | None) -> dict[str, Any]:
             sanitized[key] = _sanitize_extra_vars(value)
         else:
             logger.warning(
-                f"Skipping unsupported variable type for {key}: {type(value)}"
+                "Skipping unsupported variable type for %s: %s", key, type(value)
             )
 
     return sanitized
@@ -372,7 +372,7 @@ def _get_redis_client():
         if redis_url and redis_url.startswith("redis://"):
             return Redis.from_url(redis_url)
     except Exception as e:
-        logger.debug(f"Redis not available for streaming: {e}")
+        logger.debug("Redis not available for streaming: %s", e)
     return None
 
 
@@ -408,7 +408,7 @@ def _count_tasks_in_playbook(playbook_path: Path) -> int:
 
         return max(task_count, 1)
     except Exception as e:
-        logger.debug(f"Could not count tasks in playbook: {e}")
+        logger.debug("Could not count tasks in playbook: %s", e)
         return 1
 
 
@@ -479,7 +479,7 @@ def _execute_with_streaming(
                 db.refresh(job)
                 if job.cancel_requested:
                     logger.info(
-                        f"Job {job_id} cancellation detected, terminating process"
+                        "Job %s cancellation detected, terminating process", job_id
                     )
                     process.terminate()
                     try:
@@ -530,9 +530,11 @@ def _trigger_workflow_callback(db, job_id: int) -> None:
 
         orchestrator = WorkflowOrchestrator(db)
         orchestrator.on_job_complete(job_id)
-        logger.info(f"Triggered workflow callback for job {job_id}")
+        logger.info("Triggered workflow callback for job %s", job_id)
     except Exception as e:
-        logger.exception(f"Failed to trigger workflow callback for job {job_id}: {e}")
+        logger.exception(
+            "Failed to trigger workflow callback for job %s: %s", job_id, e
+        )
 
 
 @celery_app.task(
@@ -584,9 +586,9 @@ def run_ansible_playbook(
     redis_client = None
 
     try:
-        job = db.query(AutomationJob).filter(AutomationJob.id == job_id).first()
+        job = AutomationJob.get_with_device(db, job_id)
         if not job:
-            logger.error(f"Job {job_id} not found in database")
+            logger.error("Job %s not found in database", job_id)
             return {"status": "error", "message": "Job not found"}
 
         # Check if already cancelled before starting
@@ -603,7 +605,9 @@ def run_ansible_playbook(
         job.celery_task_id = self.request.id
         db.commit()
         logger.info(
-            f"Job {job_id} status updated to RUNNING (Celery task: {self.request.id})"
+            "Job %s status updated to RUNNING (Celery task: %s)",
+            job_id,
+            self.request.id,
         )
 
         # Get Redis client for streaming (optional)
@@ -631,7 +635,7 @@ def run_ansible_playbook(
         # Generate inventory - use multi-device if devices list provided
         if devices and len(devices) > 0:
             inventory_file = _generate_multi_device_inventory(devices, job_id)
-            logger.info(f"Generated multi-device inventory for {len(devices)} hosts")
+            logger.info("Generated multi-device inventory for %s hosts", len(devices))
         else:
             inventory_file = _generate_inventory(device_ip, device_name, job_id)
 
@@ -687,9 +691,9 @@ def run_ansible_playbook(
             # Restrictive permissions - only owner can read
             os.chmod(vault_password_file, 0o600)
             cmd.extend(["--vault-password-file", vault_password_file])
-            logger.info(f"Using vault password file for job {job_id}")
+            logger.info("Using vault password file for job %s", job_id)
 
-        logger.info(f"Executing command: {' '.join(cmd)}")
+        logger.info("Executing command: %s", " ".join(cmd))
 
         # Execute with streaming
         return_code = _execute_with_streaming(
@@ -705,11 +709,11 @@ def run_ansible_playbook(
         if return_code == 0:
             job.status = JobStatus.COMPLETED
             job.progress = 100
-            logger.info(f"Job {job_id} completed successfully")
+            logger.info("Job %s completed successfully", job_id)
         else:
             job.status = JobStatus.FAILED
-            job.error_category = "execution"
-            logger.error(f"Job {job_id} failed with return code {return_code}")
+            job.error_category = ErrorCategory.EXECUTION
+            logger.error("Job %s failed with return code %s", job_id, return_code)
 
         db.commit()
 
@@ -718,13 +722,13 @@ def run_ansible_playbook(
             _trigger_workflow_callback(db, job_id)
 
         return {
-            "status": job.status.value,
+            "status": str(job.status),
             "job_id": job_id,
             "return_code": return_code,
         }
 
     except CancellationError:
-        logger.info(f"Job {job_id} was cancelled")
+        logger.info("Job %s was cancelled", job_id)
         if job:
             job.status = JobStatus.CANCELLED
             job.cancelled_at = datetime.utcnow()
@@ -735,11 +739,11 @@ def run_ansible_playbook(
         return {"status": "cancelled", "job_id": job_id}
 
     except SoftTimeLimitExceeded:
-        logger.error(f"Job {job_id} hit soft time limit")
+        logger.error("Job %s hit soft time limit", job_id)
         if job:
             job.status = JobStatus.FAILED
             job.completed_at = datetime.utcnow()
-            job.error_category = "timeout"
+            job.error_category = ErrorCategory.TIMEOUT
             # Redact any existing output and append error
             existing = _redact_sensitive_data(job.log_output or "")
             job.log_output = existing + "\n\nERROR: Task exceeded time limit"
@@ -747,11 +751,11 @@ def run_ansible_playbook(
         raise  # Let Celery handle retry
 
     except subprocess.TimeoutExpired:
-        logger.error(f"Job {job_id} subprocess timed out")
+        logger.error("Job %s subprocess timed out", job_id)
         if job:
             job.status = JobStatus.FAILED
             job.completed_at = datetime.utcnow()
-            job.error_category = "timeout"
+            job.error_category = ErrorCategory.TIMEOUT
             # Redact any existing output and append error
             existing = _redact_sensitive_data(job.log_output or "")
             job.log_output = existing + "\n\nERROR: Execution timed out"
@@ -759,7 +763,7 @@ def run_ansible_playbook(
         return {"status": "failed", "job_id": job_id, "error": "timeout"}
 
     except Exception as e:
-        logger.exception(f"Error executing job {job_id}")
+        logger.exception("Error executing job %s", job_id)
         if job:
             job.status = JobStatus.FAILED
             job.completed_at = datetime.utcnow()
@@ -783,14 +787,14 @@ def run_ansible_playbook(
             try:
                 Path(inventory_file).unlink(missing_ok=True)
             except Exception as e:
-                logger.warning(f"Failed to delete inventory file: {e}")
+                logger.warning("Failed to delete inventory file: %s", e)
         if extra_vars_file:
             try:
                 Path(extra_vars_file).unlink(missing_ok=True)
             except Exception as e:
-                logger.warning(f"Failed to delete extra vars file: {e}")
+                logger.warning("Failed to delete extra vars file: %s", e)
         if vault_password_file:
             try:
                 Path(vault_password_file).unlink(missing_ok=True)
             except Exception as e:
-                logger.warning(f"Failed to delete vault password file: {e}")
+                logger.warning("Failed to delete vault password file: %s", e)
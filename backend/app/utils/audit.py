@@ -7,7 +7,7 @@ from functools import wraps
 
 from flask import request
 
-from app.models import AuditLog, User
+from app.models import AuditLog, User, UserAgent
 from app.utils.errors import DatabaseSession
 
 logger = logging.getLogger(__name__)
@@ -18,16 +18,18 @@ def get_current_user_id() -> int | None:
     try:
         from flask_jwt_extended import get_jwt_identity
 
-        return get_jwt_identity()
+        identity = get_jwt_identity()
     except Exception:
         return None
+    # Identities are issued as strings; User primary keys are integers
+    return int(identity) if identity is not None else None
 
 
 def get_current_username(db) -> str | None:
     """Get the current username from the database."""
     user_id = get_current_user_id()
     if user_id:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         return user.username if user else None
     return None
 
@@ -53,6 +55,7 @@ def audit_log(
         with DatabaseSession() as db:
             user_id = get_current_user_id()
             username = get_current_username(db) if user_id else None
+            user_agent = request.headers.get("User-Agent") if request else None
 
             log_entry = AuditLog(
                 user_id=user_id,
@@ -61,8 +64,8 @@ def audit_log(
                 resource_type=resource_type,
                 resource_id=resource_id,
                 ip_address=request.remote_addr if request else None,
-                user_agent=request.headers.get("User-Agent", "")[:500]
-                if request
+                user_agent_id=UserAgent.get_or_create_id(db, user_agent)
+                if user_agent
                 else None,
                 details=details,
                 status=status,
@@ -72,15 +75,17 @@ def audit_log(
             db.commit()
 
             logger.info(
-                f"Audit: {action} {resource_type}"
-                f"{f' #{resource_id}' if resource_id else ''}"
-                f" by {username or 'anonymous'}"
-                f" from {log_entry.ip_address}"
-                f" [{status}]"
+                "Audit: %s %s%s by %s from %s [%s]",
+                action,
+                resource_type,
+                f" #{resource_id}" if resource_id else "",
+                username or "anonymous",
+                log_entry.ip_address,
+                status,
             )
     except Exception as e:
         # Don't let audit logging failures break the application
-        logger.error(f"Failed to write audit log: {e}")
+        logger.error("Failed to write audit log: %s", e)
 
 
 def audit_action(
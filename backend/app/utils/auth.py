@@ -0,0 +1,71 @@
+"""JWT claim helpers for authorization checks."""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from flask_jwt_extended import get_jwt, get_jwt_identity, verify_jwt_in_request
+from sqlalchemy import exists, select
+
+from app.models import User
+from app.utils.errors import DatabaseSession, ValidationError
+
+# Access token claim carrying User.is_admin at the time the token was issued
+ADMIN_CLAIM = "adm"
+
+
+def user_claims(user: User) -> dict[str, Any]:
+    """
+    Build the additional claims for a user's access token.
+
+    Pass as ``additional_claims`` to ``create_access_token``. The claims are
+    refreshed whenever a new token is issued (login and ``GET /auth/me``).
+
+    Args:
+        user: User the token is issued to
+
+    Returns:
+        Claims to embed in the token
+    """
+    return {ADMIN_CLAIM: user.is_admin}
+
+
+def _is_active_admin(user_id: int) -> bool:
+    """Check that a user still exists and is an active admin."""
+    with DatabaseSession() as db:
+        return db.scalar(
+            select(exists().where(User.id == user_id, User.is_admin, User.is_active))
+        )
+
+
+def require_admin():
+    """
+    Decorator requiring a valid access token issued to an admin.
+
+    Replaces ``@jwt_required()`` on admin-only routes. Tokens without the
+    admin claim are rejected without a query; otherwise a single indexed
+    EXISTS confirms the caller is still an active admin, so demoting,
+    deactivating or deleting a user takes effect on their next request.
+
+    Usage:
+        @require_admin()
+        def list_users():
+            ...
+
+    Returns:
+        Decorated function that rejects non-admin callers
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            verify_jwt_in_request()
+            if not get_jwt().get(ADMIN_CLAIM) or not _is_active_admin(
+                int(get_jwt_identity())
+            ):
+                raise ValidationError("Admin access required")
+            return f(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
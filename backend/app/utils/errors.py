@@ -8,7 +8,7 @@ for common error scenarios.
 import logging
 from typing import Any
 
-from flask import jsonify
+from flask import has_app_context, jsonify
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +87,7 @@ def error_response(
 
     # Log error if it's a server error
     if status_code >= 500:
-        logger.error(f"Error {status_code}: {message}", extra=kwargs)
+        logger.error("Error %s: %s", status_code, message, extra=kwargs)
 
     return jsonify(response), status_code
 
@@ -187,9 +187,9 @@ def database_error(
         Tuple of (response_dict, status_code)
     """
     if log_details:
-        logger.error(f"Database error: {log_details}")
+        logger.error("Database error: %s", log_details)
     else:
-        logger.error(f"Database error: {message}")
+        logger.error("Database error: %s", message)
 
     return jsonify({"error": message}), 500
 
@@ -212,29 +212,29 @@ def handle_database_exception(e: Exception) -> tuple[dict[str, Any], int]:
 
         # Check for common constraint violations
         if "unique constraint" in error_msg.lower():
-            logger.warning(f"Unique constraint violation: {error_msg}")
+            logger.warning("Unique constraint violation: %s", error_msg)
             return conflict_error("Resource already exists with this value")
         elif "foreign key constraint" in error_msg.lower():
-            logger.warning(f"Foreign key constraint violation: {error_msg}")
+            logger.warning("Foreign key constraint violation: %s", error_msg)
             return validation_error("Referenced resource does not exist")
         elif "not null constraint" in error_msg.lower():
-            logger.warning(f"Not null constraint violation: {error_msg}")
+            logger.warning("Not null constraint violation: %s", error_msg)
             return validation_error("Required field is missing")
         else:
-            logger.error(f"Integrity error: {error_msg}")
+            logger.error("Integrity error: %s", error_msg)
             return database_error("Data integrity constraint violated")
 
     elif isinstance(e, OperationalError):
-        logger.error(f"Database operational error: {str(e)}")
+        logger.error("Database operational error: %s", e)
         return database_error("Database connection or operation failed")
 
     elif isinstance(e, SQLAlchemyError):
-        logger.error(f"SQLAlchemy error: {str(e)}")
+        logger.error("SQLAlchemy error: %s", e)
         return database_error("Database operation failed")
 
     else:
         # Generic database error
-        logger.error(f"Unexpected database error: {str(e)}")
+        logger.error("Unexpected database error: %s", e)
         return database_error()
 
 
@@ -242,6 +242,11 @@ class DatabaseSession:
     """
     Context manager for database sessions with automatic error handling.
 
+    Inside a Flask app context the session is the request-scoped one: it is
+    rolled back on error but left open for later blocks and helpers, and
+    closed by the app's teardown handler. Outside an app context it is
+    closed on exit.
+
     Usage:
         with DatabaseSession() as db:
             # perform database operations
@@ -261,15 +266,15 @@ class DatabaseSession:
         return self.db
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Close database session and handle exceptions."""
+        """Roll back on exceptions; close the session outside requests."""
         if exc_type is not None and self.db:
             # Rollback on exception
             self.db.rollback()
-            logger.warning(f"Database transaction rolled back due to: {exc_val}")
+            logger.warning("Database transaction rolled back due to: %s", exc_val)
 
-        # Always close the session
-        if self.db:
-            self.db.close()
+        # Within an app context the teardown handler closes the session
+        if self.db and not has_app_context():
+            self.Session.remove()
 
         # Don't suppress the exception, let it propagate
         return False
@@ -0,0 +1,28 @@
+"""Relationship loading guards for serialization queries."""
+
+from flask import current_app
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def strict_loading() -> tuple[LoaderOption, ...]:
+    """
+    Loader options that make unplanned lazy loads raise, when enabled.
+
+    Add to queries whose results are serialized, after their explicit eager
+    loads, so a ``to_dict`` that starts touching a relationship the query
+    does not load fails in development and tests instead of silently
+    issuing one query per row. Disabled (no options) unless the app's
+    ``STRICT_LOADING`` setting is on.
+
+    Usage:
+        query = query.options(selectinload(AutomationJob.depends_on))
+        query = query.options(*strict_loading())
+
+    Returns:
+        Options to pass to ``Query.options``
+    """
+    if not current_app.config.get("STRICT_LOADING"):
+        return ()
+    # sql_only: related objects already in the identity map may still be used
+    return (raiseload("*", sql_only=True),)
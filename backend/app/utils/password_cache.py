@@ -0,0 +1,66 @@
+"""Short-lived cache of successful password verifications."""
+
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from app.models import User
+
+# Most verifications remembered at once; the oldest are evicted first
+MAX_ENTRIES = 1024
+
+# Per-process key for the password digests, so cache contents cannot be
+# brute-forced offline the way an unkeyed fast hash could
+_DIGEST_KEY = secrets.token_bytes(32)
+
+_lock = threading.Lock()
+# (user ID, stored hash, password digest) -> monotonic expiry time
+_verified: OrderedDict[tuple[int, str, bytes], float] = OrderedDict()
+
+
+def _cache_key(user: User, password: str) -> tuple[int, str, bytes]:
+    digest = hashlib.blake2b(
+        password.encode(), digest_size=16, key=_DIGEST_KEY
+    ).digest()
+    # The stored hash is part of the key, so a password change misses
+    return (user.id, user.password_hash, digest)
+
+
+def check_password_cached(user: User, password: str, ttl: int) -> bool:
+    """
+    Check a user's password, skipping the KDF if it verified recently.
+
+    Only successful checks are cached; a wrong password always runs the full
+    Argon2 verification.
+
+    Args:
+        user: User whose password to check
+        password: Password to verify
+        ttl: Seconds a successful check is remembered; 0 disables the cache
+
+    Returns:
+        True if the password matches
+    """
+    if ttl <= 0:
+        return user.check_password(password)
+
+    key = _cache_key(user, password)
+    now = time.monotonic()
+    with _lock:
+        expires = _verified.pop(key, None)
+        if expires is not None and expires > now:
+            _verified[key] = expires
+            return True
+
+    if not user.check_password(password):
+        return False
+
+    # check_password may have re-hashed; key on the hash now stored
+    key = _cache_key(user, password)
+    with _lock:
+        _verified[key] = now + ttl
+        while len(_verified) > MAX_ENTRIES:
+            _verified.popitem(last=False)
+    return True
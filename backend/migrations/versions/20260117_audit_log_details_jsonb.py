@@ -0,0 +1,66 @@
+"""Store audit_logs.details as JSONB with a GIN index
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-01-17 11:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "j0k1l2m3n4o5"
+down_revision: str | Sequence[str] | None = "i9j0k1l2m3n4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # JSONB and GIN are PostgreSQL features; other backends keep plain JSON
+    if not is_postgresql() or not table_exists("audit_logs"):
+        return
+
+    op.alter_column(
+        "audit_logs",
+        "details",
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="details::jsonb",
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_details_gin "
+        "ON audit_logs USING gin (details)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not is_postgresql() or not table_exists("audit_logs"):
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_audit_details_gin")
+    op.alter_column(
+        "audit_logs",
+        "details",
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="details::json",
+    )
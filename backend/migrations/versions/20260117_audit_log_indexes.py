@@ -0,0 +1,84 @@
+"""Add composite and partial indexes on audit_logs
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-01-17 10:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "i9j0k1l2m3n4"
+down_revision: str | Sequence[str] | None = "h8i9j0k1l2m3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in {i["name"] for i in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("audit_logs"):
+        return
+
+    if not index_exists("audit_logs", "ix_audit_user_ts"):
+        op.create_index(
+            "ix_audit_user_ts", "audit_logs", ["user_id", "timestamp"], unique=False
+        )
+    if not index_exists("audit_logs", "ix_audit_resource"):
+        op.create_index(
+            "ix_audit_resource",
+            "audit_logs",
+            ["resource_type", "resource_id"],
+            unique=False,
+        )
+    if not index_exists("audit_logs", "ix_audit_action_ts"):
+        op.create_index(
+            "ix_audit_action_ts",
+            "audit_logs",
+            ["action", "timestamp"],
+            unique=False,
+            postgresql_where=sa.text("status IN ('failure', 'denied')"),
+        )
+
+    # Single-column indexes now covered by the composites above
+    if index_exists("audit_logs", "ix_audit_logs_user_id"):
+        op.drop_index("ix_audit_logs_user_id", table_name="audit_logs")
+    if index_exists("audit_logs", "ix_audit_logs_resource_type"):
+        op.drop_index("ix_audit_logs_resource_type", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not table_exists("audit_logs"):
+        return
+
+    if not index_exists("audit_logs", "ix_audit_logs_resource_type"):
+        op.create_index(
+            "ix_audit_logs_resource_type", "audit_logs", ["resource_type"], unique=False
+        )
+    if not index_exists("audit_logs", "ix_audit_logs_user_id"):
+        op.create_index(
+            "ix_audit_logs_user_id", "audit_logs", ["user_id"], unique=False
+        )
+
+    for index_name in ("ix_audit_action_ts", "ix_audit_resource", "ix_audit_user_ts"):
+        if index_exists("audit_logs", index_name):
+            op.drop_index(index_name, table_name="audit_logs")
@@ -0,0 +1,63 @@
+"""Default audit and setting timestamps to UTC on the database server
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-01-17 12:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+# revision identifiers, used by Alembic.
+revision: str = "k1l2m3n4o5p6"
+down_revision: str | Sequence[str] | None = "j0k1l2m3n4o5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMESTAMP_COLUMNS = {
+    "audit_logs": "timestamp",
+    "app_settings": "updated_at",
+}
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _set_default(table: str, default) -> None:
+    """Set (or with None, drop) the server default on a table's timestamp."""
+    if not table_exists(table):
+        return
+    # SQLite cannot alter a default in place; batch mode rebuilds the table
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.alter_column(TIMESTAMP_COLUMNS[table], server_default=default)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Columns hold naive UTC, matching what datetime.utcnow wrote before;
+    # now() would give the server's local time when TimeZone is not UTC
+    if is_postgresql():
+        default = text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    else:
+        default = text("CURRENT_TIMESTAMP")
+    for table in TIMESTAMP_COLUMNS:
+        _set_default(table, default)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_default("audit_logs", None)
+    # app_settings.updated_at was created with a now() default
+    _set_default("app_settings", text("now()"))
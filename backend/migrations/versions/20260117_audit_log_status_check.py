@@ -0,0 +1,65 @@
+"""Restrict audit_logs.status to the known outcomes
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-01-17 13:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "l2m3n4o5p6q7"
+down_revision: str | Sequence[str] | None = "k1l2m3n4o5p6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CONSTRAINT_NAME = "ck_audit_logs_status"
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def constraint_exists(table_name: str, constraint_name: str) -> bool:
+    """Check if a check constraint exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    constraints = inspector.get_check_constraints(table_name)
+    return any(c["name"] == constraint_name for c in constraints)
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite cannot add constraints in place; new databases get it from the model
+    if not is_postgresql() or not table_exists("audit_logs"):
+        return
+    if constraint_exists("audit_logs", CONSTRAINT_NAME):
+        return
+
+    op.create_check_constraint(
+        CONSTRAINT_NAME,
+        "audit_logs",
+        "status IN ('success', 'failure', 'denied')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not is_postgresql() or not table_exists("audit_logs"):
+        return
+    if not constraint_exists("audit_logs", CONSTRAINT_NAME):
+        return
+
+    op.drop_constraint(CONSTRAINT_NAME, "audit_logs", type_="check")
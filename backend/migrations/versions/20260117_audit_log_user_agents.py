@@ -0,0 +1,106 @@
+"""Move audit_logs.user_agent into a user_agents lookup table
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-01-17 14:00:00.000000+00:00
+
+"""
+
+import hashlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "m3n4o5p6q7r8"
+down_revision: str | Sequence[str] | None = "l2m3n4o5p6q7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FK_NAME = "fk_audit_logs_user_agent_id"
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = [c["name"] for c in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("user_agents"):
+        op.create_table(
+            "user_agents",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("digest", sa.LargeBinary(length=32), nullable=False),
+            sa.Column("value", sa.Text(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("digest"),
+        )
+
+    # audit_logs is created by the application; nothing to move on fresh installs
+    if not table_exists("audit_logs") or not column_exists("audit_logs", "user_agent"):
+        return
+
+    with op.batch_alter_table("audit_logs") as batch_op:
+        batch_op.add_column(sa.Column("user_agent_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(FK_NAME, "user_agents", ["user_agent_id"], ["id"])
+
+    # Copy each distinct agent once, then point the audit rows at it
+    bind = op.get_bind()
+    agents = bind.execute(
+        sa.text(
+            "SELECT DISTINCT user_agent FROM audit_logs "
+            "WHERE user_agent IS NOT NULL AND user_agent != ''"
+        )
+    ).scalars()
+    user_agents = sa.table(
+        "user_agents",
+        sa.column("digest", sa.LargeBinary),
+        sa.column("value", sa.Text),
+    )
+    rows = [
+        {"digest": hashlib.sha256(value.encode()).digest(), "value": value}
+        for value in agents
+    ]
+    if rows:
+        op.bulk_insert(user_agents, rows)
+    op.execute(
+        "UPDATE audit_logs SET user_agent_id = "
+        "(SELECT id FROM user_agents WHERE user_agents.value = audit_logs.user_agent) "
+        "WHERE user_agent IS NOT NULL"
+    )
+
+    with op.batch_alter_table("audit_logs") as batch_op:
+        batch_op.drop_column("user_agent")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if table_exists("audit_logs") and column_exists("audit_logs", "user_agent_id"):
+        with op.batch_alter_table("audit_logs") as batch_op:
+            batch_op.add_column(
+                sa.Column("user_agent", sa.String(length=500), nullable=True)
+            )
+        op.execute(
+            "UPDATE audit_logs SET user_agent = "
+            "(SELECT value FROM user_agents "
+            "WHERE user_agents.id = audit_logs.user_agent_id)"
+        )
+        with op.batch_alter_table("audit_logs") as batch_op:
+            batch_op.drop_constraint(FK_NAME, type_="foreignkey")
+            batch_op.drop_column("user_agent_id")
+
+    if table_exists("user_agents"):
+        op.drop_table("user_agents")
@@ -0,0 +1,81 @@
+"""Store automation job and device JSON columns as JSONB
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-01-18 12:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "q7r8s9t0u1v2"
+down_revision: str | Sequence[str] | None = "p6q7r8s9t0u1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, nullable, server default)
+JSON_COLUMNS = (
+    ("automation_jobs", "device_ids", True, None),
+    ("automation_jobs", "action_config", True, None),
+    ("automation_jobs", "extra_vars", True, None),
+    ("automation_jobs", "depends_on_job_ids", True, None),
+    ("devices", "device_metadata", True, None),
+    ("device_variables", "variables", False, "'{}'"),
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _change_type(
+    table: str, column: str, nullable: bool, default: str | None, target: str
+) -> None:
+    """Convert a column between json and jsonb, keeping its server default."""
+    # The old default cannot be cast along with the column, so re-create it
+    if default is not None:
+        op.alter_column(table, column, server_default=None)
+    op.alter_column(
+        table,
+        column,
+        type_=postgresql.JSONB() if target == "jsonb" else sa.JSON(),
+        existing_nullable=nullable,
+        postgresql_using=f"{column}::{target}",
+    )
+    if default is not None:
+        op.alter_column(table, column, server_default=sa.text(f"{default}::{target}"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # JSONB is a PostgreSQL feature; other backends keep plain JSON
+    if not is_postgresql():
+        return
+
+    for table, column, nullable, default in JSON_COLUMNS:
+        if table_exists(table):
+            _change_type(table, column, nullable, default, "jsonb")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not is_postgresql():
+        return
+
+    for table, column, nullable, default in JSON_COLUMNS:
+        if table_exists(table):
+            _change_type(table, column, nullable, default, "json")
@@ -0,0 +1,172 @@
+"""Move automation job device and dependency arrays into association tables
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-01-18 13:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "r8s9t0u1v2w3"
+down_revision: str | Sequence[str] | None = "q7r8s9t0u1v2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+automation_jobs = sa.table(
+    "automation_jobs",
+    sa.column("id", sa.Integer),
+    sa.column("device_id", sa.Integer),
+    sa.column("device_ids", sa.JSON(none_as_null=True)),
+    sa.column("depends_on_job_ids", sa.JSON(none_as_null=True)),
+)
+job_devices = sa.table(
+    "automation_job_devices",
+    sa.column("job_id", sa.Integer),
+    sa.column("device_id", sa.Integer),
+)
+job_deps = sa.table(
+    "automation_job_deps",
+    sa.column("job_id", sa.Integer),
+    sa.column("depends_on_id", sa.Integer),
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = [c["name"] for c in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("automation_job_devices"):
+        op.create_table(
+            "automation_job_devices",
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("device_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["job_id"], ["automation_jobs.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(["device_id"], ["devices.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("job_id", "device_id"),
+        )
+        op.create_index(
+            "ix_automation_job_devices_device_job",
+            "automation_job_devices",
+            ["device_id", "job_id"],
+            unique=False,
+        )
+    if not table_exists("automation_job_deps"):
+        op.create_table(
+            "automation_job_deps",
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("depends_on_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["job_id"], ["automation_jobs.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["depends_on_id"], ["automation_jobs.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("job_id", "depends_on_id"),
+        )
+        op.create_index(
+            "ix_automation_job_deps_depends_on_job",
+            "automation_job_deps",
+            ["depends_on_id", "job_id"],
+            unique=False,
+        )
+
+    if not column_exists("automation_jobs", "device_ids"):
+        return
+
+    # Unpack the JSON arrays; single-device jobs only had device_id set.
+    # Ids that no longer exist are dropped rather than violating the FKs.
+    bind = op.get_bind()
+    device_ids = set(bind.execute(sa.text("SELECT id FROM devices")).scalars())
+    jobs = bind.execute(sa.select(automation_jobs)).all()
+    job_ids = {job.id for job in jobs}
+    device_rows = []
+    dep_rows = []
+    for job in jobs:
+        targets = job.device_ids or [job.device_id]
+        device_rows.extend(
+            {"job_id": job.id, "device_id": device_id}
+            for device_id in dict.fromkeys(targets)
+            if device_id in device_ids
+        )
+        dep_rows.extend(
+            {"job_id": job.id, "depends_on_id": dep_id}
+            for dep_id in dict.fromkeys(job.depends_on_job_ids or [])
+            if dep_id in job_ids
+        )
+    if device_rows:
+        op.bulk_insert(job_devices, device_rows)
+    if dep_rows:
+        op.bulk_insert(job_deps, dep_rows)
+
+    with op.batch_alter_table("automation_jobs") as batch_op:
+        batch_op.drop_column("depends_on_job_ids")
+        batch_op.drop_column("device_ids")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not column_exists("automation_jobs", "device_ids"):
+        json_type = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+        with op.batch_alter_table("automation_jobs") as batch_op:
+            batch_op.add_column(sa.Column("device_ids", json_type, nullable=True))
+            batch_op.add_column(
+                sa.Column("depends_on_job_ids", json_type, nullable=True)
+            )
+
+    if not table_exists("automation_job_devices"):
+        return
+
+    # Previously only batch jobs carried device_ids
+    bind = op.get_bind()
+    targets: dict[int, list[int]] = {}
+    for job_id, device_id in bind.execute(
+        sa.select(job_devices.c.job_id, job_devices.c.device_id).order_by(
+            job_devices.c.job_id, job_devices.c.device_id
+        )
+    ):
+        targets.setdefault(job_id, []).append(device_id)
+    deps: dict[int, list[int]] = {}
+    for job_id, dep_id in bind.execute(
+        sa.select(job_deps.c.job_id, job_deps.c.depends_on_id).order_by(
+            job_deps.c.job_id, job_deps.c.depends_on_id
+        )
+    ):
+        deps.setdefault(job_id, []).append(dep_id)
+
+    for job_id in targets.keys() | deps.keys():
+        device_list = targets.get(job_id, [])
+        bind.execute(
+            automation_jobs.update()
+            .where(automation_jobs.c.id == job_id)
+            .values(
+                device_ids=device_list if len(device_list) > 1 else None,
+                depends_on_job_ids=deps.get(job_id),
+            )
+        )
+
+    op.drop_index("ix_automation_job_deps_depends_on_job", "automation_job_deps")
+    op.drop_table("automation_job_deps")
+    op.drop_index("ix_automation_job_devices_device_job", "automation_job_devices")
+    op.drop_table("automation_job_devices")
@@ -0,0 +1,65 @@
+"""Index automation jobs by (workflow_instance_id, step_order)
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-01-18 14:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "s9t0u1v2w3x4"
+down_revision: str | Sequence[str] | None = "r8s9t0u1v2w3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "ix_automation_jobs_workflow_step"
+COLUMNS = ["workflow_instance_id", "step_order"]
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    indexes = [idx["name"] for idx in inspector.get_indexes(table_name)]
+    return index_name in indexes
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if index_exists("automation_jobs", INDEX_NAME):
+        return
+    if not is_postgresql():
+        op.create_index(INDEX_NAME, "automation_jobs", COLUMNS, unique=False)
+        return
+    # Build without blocking job writes; CONCURRENTLY cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "automation_jobs",
+            COLUMNS,
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not index_exists("automation_jobs", INDEX_NAME):
+        return
+    if not is_postgresql():
+        op.drop_index(INDEX_NAME, table_name="automation_jobs")
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME, table_name="automation_jobs", postgresql_concurrently=True
+        )
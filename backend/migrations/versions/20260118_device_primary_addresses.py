@@ -0,0 +1,69 @@
+"""Denormalize the primary interface addresses onto devices
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-01-18 10:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "o5p6q7r8s9t0"
+down_revision: str | Sequence[str] | None = "n4o5p6q7r8s9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = [c["name"] for c in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not column_exists("devices", "primary_ip_address"):
+        op.add_column(
+            "devices",
+            sa.Column("primary_ip_address", sa.String(length=45), nullable=True),
+        )
+    if not column_exists("devices", "primary_mac_address"):
+        op.add_column(
+            "devices",
+            sa.Column("primary_mac_address", sa.String(length=17), nullable=True),
+        )
+
+    # Backfill from each device's current primary interface
+    op.execute(
+        """
+        UPDATE devices SET
+            primary_ip_address = (
+                SELECT ip_address FROM network_interfaces
+                WHERE network_interfaces.device_id = devices.id
+                  AND network_interfaces.is_primary
+                LIMIT 1
+            ),
+            primary_mac_address = (
+                SELECT mac_address FROM network_interfaces
+                WHERE network_interfaces.device_id = devices.id
+                  AND network_interfaces.is_primary
+                LIMIT 1
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("devices") as batch_op:
+        if column_exists("devices", "primary_mac_address"):
+            batch_op.drop_column("primary_mac_address")
+        if column_exists("devices", "primary_ip_address"):
+            batch_op.drop_column("primary_ip_address")
@@ -0,0 +1,73 @@
+"""Allow only one device-defaults variable set per device
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-01-18 16:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "u1v2w3x4y5z6"
+down_revision: str | Sequence[str] | None = "t0u1v2w3x4y5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    indexes = [idx["name"] for idx in inspector.get_indexes(table_name)]
+    return index_name in indexes
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("device_variables"):
+        return
+    if index_exists("device_variables", "uq_device_variables_defaults"):
+        return
+
+    # uq_device_playbook never matched NULL playbook names, so duplicates of
+    # the device defaults may exist. Keep the most recent one.
+    op.execute(
+        """
+        DELETE FROM device_variables
+        WHERE playbook_name IS NULL
+          AND id NOT IN (
+            SELECT MAX(id) FROM device_variables
+            WHERE playbook_name IS NULL
+            GROUP BY device_id
+          )
+        """
+    )
+    # Also the conflict target for DeviceVariables.upsert on device defaults
+    op.create_index(
+        "uq_device_variables_defaults",
+        "device_variables",
+        ["device_id"],
+        unique=True,
+        postgresql_where=sa.text("playbook_name IS NULL"),
+        sqlite_where=sa.text("playbook_name IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if table_exists("device_variables") and index_exists(
+        "device_variables", "uq_device_variables_defaults"
+    ):
+        op.drop_index("uq_device_variables_defaults", table_name="device_variables")
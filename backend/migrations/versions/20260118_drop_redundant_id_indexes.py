@@ -0,0 +1,94 @@
+"""Drop redundant primary key indexes and widen metrics.id to bigint
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-01-18 15:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+# revision identifiers, used by Alembic.
+revision: str = "t0u1v2w3x4y5"
+down_revision: str | Sequence[str] | None = "s9t0u1v2w3x4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose models declared id with index=True on top of the primary key
+TABLES = (
+    "app_settings",
+    "audit_logs",
+    "automation_jobs",
+    "device_variables",
+    "devices",
+    "hardware_specs",
+    "metrics",
+    "network_interfaces",
+    "services",
+    "users",
+    "vault_secrets",
+    "workflow_instances",
+    "workflow_templates",
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def id_indexes(table_name: str) -> list[str]:
+    """Names of the plain secondary indexes on a table's id column."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return [
+        idx["name"]
+        for idx in inspector.get_indexes(table_name)
+        if idx["column_names"] == ["id"] and not idx["unique"]
+    ]
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _set_metrics_id_type(type_name: str) -> None:
+    """Change metrics.id and its serial sequence to the given integer type."""
+    op.execute(f"ALTER TABLE metrics ALTER COLUMN id TYPE {type_name}")
+    # Serial sequences are typed too and would stop at the old maximum
+    sequence = (
+        op.get_bind()
+        .execute(text("SELECT pg_get_serial_sequence('metrics', 'id')"))
+        .scalar()
+    )
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} AS {type_name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The primary key is already indexed. Names vary (automation_jobs kept
+    # ix_provisioning_jobs_id from before its rename), so match on columns.
+    for table in TABLES:
+        if table_exists(table):
+            for index_name in id_indexes(table):
+                op.drop_index(index_name, table_name=table)
+
+    if is_postgresql() and table_exists("metrics"):
+        _set_metrics_id_type("bigint")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if is_postgresql() and table_exists("metrics"):
+        _set_metrics_id_type("integer")
+
+    for table in TABLES:
+        if table_exists(table) and not id_indexes(table):
+            op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
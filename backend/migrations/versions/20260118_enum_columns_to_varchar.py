@@ -0,0 +1,90 @@
+"""Store device, service, interface and job enums as varchar values
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-01-18 09:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "n4o5p6q7r8s9"
+down_revision: str | Sequence[str] | None = "m3n4o5p6q7r8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, PostgreSQL enum type, enum labels as stored by sa.Enum)
+ENUM_COLUMNS = (
+    (
+        "devices",
+        "type",
+        "devicetype",
+        ("SERVER", "VM", "CONTAINER", "NETWORK", "STORAGE"),
+    ),
+    ("devices", "status", "devicestatus", ("ACTIVE", "INACTIVE", "MAINTENANCE")),
+    (
+        "automation_jobs",
+        "status",
+        "jobstatus",
+        ("PENDING", "RUNNING", "COMPLETED", "FAILED", "CANCELLED"),
+    ),
+    ("services", "status", "servicestatus", ("RUNNING", "STOPPED", "ERROR")),
+    ("network_interfaces", "status", "interfacestatus", ("UP", "DOWN", "DISABLED")),
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # sa.Enum stored member names (e.g. 'PENDING'); the models now store values
+    for table, column, _, _ in ENUM_COLUMNS:
+        if not table_exists(table):
+            continue
+        if is_postgresql():
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE varchar(16) USING lower({column}::text)"
+            )
+        else:
+            op.execute(f"UPDATE {table} SET {column} = lower({column})")
+
+    if is_postgresql():
+        for type_name in {type_name for _, _, type_name, _ in ENUM_COLUMNS}:
+            op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if is_postgresql():
+        created = set()
+        for _, _, type_name, labels in ENUM_COLUMNS:
+            if type_name not in created:
+                values = ", ".join(f"'{label}'" for label in labels)
+                op.execute(f"CREATE TYPE {type_name} AS ENUM ({values})")
+                created.add(type_name)
+
+    for table, column, type_name, _ in ENUM_COLUMNS:
+        if not table_exists(table):
+            continue
+        if is_postgresql():
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE {type_name} USING upper({column})::{type_name}"
+            )
+        else:
+            op.execute(f"UPDATE {table} SET {column} = upper({column})")
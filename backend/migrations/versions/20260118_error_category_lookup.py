@@ -0,0 +1,114 @@
+"""Store automation job error categories as SMALLINT lookup IDs
+
+Revision ID: w3x4y5z6a7b8
+Revises: v2w3x4y5z6a7
+Create Date: 2026-01-18 18:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "w3x4y5z6a7b8"
+down_revision: str | Sequence[str] | None = "v2w3x4y5z6a7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match ERROR_CATEGORY_IDS in app/models/error_category.py
+ERROR_CATEGORIES = (
+    (1, "connectivity"),
+    (2, "permission"),
+    (3, "not_found"),
+    (4, "timeout"),
+    (5, "authentication"),
+    (6, "execution"),
+    (7, "configuration"),
+)
+
+FK_NAME = "fk_automation_jobs_error_category_id"
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = [c["name"] for c in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("error_categories"):
+        error_categories = op.create_table(
+            "error_categories",
+            sa.Column("id", sa.SmallInteger(), autoincrement=False, nullable=False),
+            sa.Column("name", sa.String(length=32), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("name"),
+        )
+        op.bulk_insert(
+            error_categories,
+            [{"id": id_, "name": name} for id_, name in ERROR_CATEGORIES],
+        )
+
+    if not column_exists("automation_jobs", "error_category"):
+        return
+
+    with op.batch_alter_table("automation_jobs") as batch_op:
+        batch_op.add_column(
+            sa.Column("error_category_id", sa.SmallInteger(), nullable=True)
+        )
+        batch_op.create_foreign_key(
+            FK_NAME, "error_categories", ["error_category_id"], ["id"]
+        )
+
+    # Categories outside the known set have no ID and become NULL
+    op.execute(
+        """
+        UPDATE automation_jobs SET error_category_id = (
+            SELECT id FROM error_categories
+            WHERE error_categories.name = automation_jobs.error_category
+        )
+        WHERE error_category IS NOT NULL
+        """
+    )
+
+    with op.batch_alter_table("automation_jobs") as batch_op:
+        batch_op.drop_column("error_category")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if column_exists("automation_jobs", "error_category_id"):
+        with op.batch_alter_table("automation_jobs") as batch_op:
+            batch_op.add_column(
+                sa.Column("error_category", sa.String(length=50), nullable=True)
+            )
+
+        op.execute(
+            """
+            UPDATE automation_jobs SET error_category = (
+                SELECT name FROM error_categories
+                WHERE error_categories.id = automation_jobs.error_category_id
+            )
+            WHERE error_category_id IS NOT NULL
+            """
+        )
+
+        with op.batch_alter_table("automation_jobs") as batch_op:
+            batch_op.drop_constraint(FK_NAME, type_="foreignkey")
+            batch_op.drop_column("error_category_id")
+
+    if table_exists("error_categories"):
+        op.drop_table("error_categories")
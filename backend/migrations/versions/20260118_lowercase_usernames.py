@@ -0,0 +1,51 @@
+"""Lower-case stored usernames
+
+Revision ID: z6a7b8c9d0e1
+Revises: y5z6a7b8c9d0
+Create Date: 2026-01-18 21:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "z6a7b8c9d0e1"
+down_revision: str | Sequence[str] | None = "y5z6a7b8c9d0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("users"):
+        return
+
+    # Login compares against the lower-cased input, so mixed-case rows (e.g.
+    # from flask create-admin) could never sign in. Names that would collide
+    # once lower-cased are left for an admin to rename.
+    op.execute(
+        """
+        UPDATE users SET username = lower(username)
+        WHERE username <> lower(username)
+        AND (
+            SELECT count(*) FROM users AS other
+            WHERE lower(other.username) = lower(users.username)
+        ) = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Original casing is not recorded; lower-case names remain valid
+    pass
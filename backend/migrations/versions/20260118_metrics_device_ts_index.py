@@ -0,0 +1,49 @@
+"""Index metrics by (device_id, timestamp DESC)
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-01-18 11:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "p6q7r8s9t0u1"
+down_revision: str | Sequence[str] | None = "o5p6q7r8s9t0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    indexes = [idx["name"] for idx in inspector.get_indexes(table_name)]
+    return index_name in indexes
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not index_exists("metrics", "ix_metrics_device_ts"):
+        op.create_index(
+            "ix_metrics_device_ts",
+            "metrics",
+            ["device_id", sa.text("timestamp DESC")],
+            unique=False,
+        )
+    # Every metrics query filters on device_id; timestamp alone is never used
+    if index_exists("metrics", "ix_metrics_timestamp"):
+        op.drop_index("ix_metrics_timestamp", table_name="metrics")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not index_exists("metrics", "ix_metrics_timestamp"):
+        op.create_index("ix_metrics_timestamp", "metrics", ["timestamp"], unique=False)
+    if index_exists("metrics", "ix_metrics_device_ts"):
+        op.drop_index("ix_metrics_device_ts", table_name="metrics")
@@ -0,0 +1,94 @@
+"""Move uploaded avatar images from users into user_avatars
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-01-18 23:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | Sequence[str] | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = [c["name"] for c in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("users"):
+        return
+
+    if not table_exists("user_avatars"):
+        op.create_table(
+            "user_avatars",
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("data", sa.LargeBinary(), nullable=False),
+            sa.Column("mime_type", sa.String(length=50), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("user_id"),
+        )
+
+    if not column_exists("users", "avatar_data"):
+        return
+
+    op.execute(
+        """
+        INSERT INTO user_avatars (user_id, data, mime_type)
+        SELECT id, avatar_data, coalesce(avatar_mime_type, 'image/png')
+        FROM users WHERE avatar_data IS NOT NULL
+        """
+    )
+
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("avatar_data")
+        batch_op.drop_column("avatar_mime_type")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not table_exists("users"):
+        return
+
+    if not column_exists("users", "avatar_data"):
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(sa.Column("avatar_data", sa.LargeBinary()))
+            batch_op.add_column(sa.Column("avatar_mime_type", sa.String(length=50)))
+
+    if not table_exists("user_avatars"):
+        return
+
+    op.execute(
+        """
+        UPDATE users SET
+            avatar_data = (
+                SELECT data FROM user_avatars WHERE user_avatars.user_id = users.id
+            ),
+            avatar_mime_type = (
+                SELECT mime_type FROM user_avatars
+                WHERE user_avatars.user_id = users.id
+            )
+        WHERE id IN (SELECT user_id FROM user_avatars)
+        """
+    )
+    op.drop_table("user_avatars")
@@ -0,0 +1,61 @@
+"""Default vault secret and workflow timestamps in the database
+
+Revision ID: y5z6a7b8c9d0
+Revises: x4y5z6a7b8c9
+Create Date: 2026-01-18 20:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+# revision identifiers, used by Alembic.
+revision: str = "y5z6a7b8c9d0"
+down_revision: str | Sequence[str] | None = "x4y5z6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMESTAMP_COLUMNS = {
+    "vault_secrets": ("created_at", "updated_at"),
+    "workflow_templates": ("created_at", "updated_at"),
+    "workflow_instances": ("created_at",),
+}
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _set_defaults(default) -> None:
+    """Set (or with None, drop) the server default on each timestamp column."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if not table_exists(table):
+            continue
+        # SQLite cannot alter a default in place; batch mode rebuilds the table
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, server_default=default)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Columns hold naive UTC, matching what datetime.utcnow wrote before
+    if is_postgresql():
+        _set_defaults(text("TIMEZONE('utc', CURRENT_TIMESTAMP)"))
+    else:
+        _set_defaults(text("CURRENT_TIMESTAMP"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_defaults(None)
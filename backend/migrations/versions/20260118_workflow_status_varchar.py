@@ -0,0 +1,97 @@
+"""Store workflow instance status as varchar with a check constraint
+
+Revision ID: x4y5z6a7b8c9
+Revises: w3x4y5z6a7b8
+Create Date: 2026-01-18 19:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "x4y5z6a7b8c9"
+down_revision: str | Sequence[str] | None = "w3x4y5z6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CONSTRAINT_NAME = "ck_workflow_instances_status"
+
+# Must match WorkflowStatus in app/models/workflow.py
+STATUSES = (
+    "pending",
+    "running",
+    "completed",
+    "failed",
+    "cancelled",
+    "rolling_back",
+    "rolled_back",
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def constraint_exists(table_name: str, constraint_name: str) -> bool:
+    """Check if a check constraint exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    constraints = inspector.get_check_constraints(table_name)
+    return any(c["name"] == constraint_name for c in constraints)
+
+
+def is_postgresql() -> bool:
+    """Check if the migration is running against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not table_exists("workflow_instances"):
+        return
+
+    # Rows written through the old sa.Enum mapping hold member names
+    # (e.g. 'PENDING'); the model now stores the lowercase values
+    if is_postgresql():
+        op.execute(
+            "ALTER TABLE workflow_instances ALTER COLUMN status "
+            "TYPE varchar(16) USING lower(status::text)"
+        )
+        op.execute("DROP TYPE IF EXISTS workflowstatus")
+    else:
+        op.execute("UPDATE workflow_instances SET status = lower(status)")
+
+    if constraint_exists("workflow_instances", CONSTRAINT_NAME):
+        return
+
+    values = ", ".join(f"'{status}'" for status in STATUSES)
+    with op.batch_alter_table("workflow_instances") as batch_op:
+        batch_op.alter_column(
+            "status", type_=sa.String(length=16), existing_nullable=True
+        )
+        batch_op.create_check_constraint(CONSTRAINT_NAME, f"status IN ({values})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not table_exists("workflow_instances"):
+        return
+
+    if constraint_exists("workflow_instances", CONSTRAINT_NAME):
+        with op.batch_alter_table("workflow_instances") as batch_op:
+            batch_op.drop_constraint(CONSTRAINT_NAME, type_="check")
+
+    if is_postgresql():
+        values = ", ".join(f"'{status}'" for status in STATUSES)
+        op.execute(f"CREATE TYPE workflowstatus AS ENUM ({values})")
+        op.execute(
+            "ALTER TABLE workflow_instances ALTER COLUMN status "
+            "TYPE workflowstatus USING status::workflowstatus"
+        )
@@ -0,0 +1,56 @@
+"""Shared test fixtures."""
+
+import os
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+# Config, the engine and the rate limiter read the environment at import, so
+# these must be set before the app package is imported
+os.environ.setdefault("FLASK_ENV", "testing")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("RATE_LIMIT_STORAGE_URL", "memory://")
+
+from app import create_app  # noqa: E402
+from app.config import TestingConfig  # noqa: E402
+from app.database import Base, engine, session_factory  # noqa: E402
+from app.utils.auth import user_claims  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """Create application for testing."""
+    app = create_app(TestingConfig)
+    yield app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client."""
+    return app.test_client()
+
+
+@pytest.fixture
+def db(app):
+    """Create the schema and yield a session; drop everything afterwards."""
+    Base.metadata.create_all(engine)
+    session = session_factory()
+    yield session
+    session.close()
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def login(app):
+    """Return a function that gives a test client signed in as a user."""
+
+    def _login(user):
+        with app.app_context():
+            token = create_access_token(
+                identity=str(user.id), additional_claims=user_claims(user)
+            )
+        client = app.test_client()
+        client.set_cookie(app.config["JWT_ACCESS_COOKIE_NAME"], token)
+        return client
+
+    return _login
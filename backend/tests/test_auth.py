@@ -0,0 +1,95 @@
+"""Authentication and admin authorization tests."""
+
+import pytest
+from flask_jwt_extended import decode_token
+
+from app.models import AppSetting, User
+
+
+@pytest.fixture
+def admin(db):
+    """Create an active admin user."""
+    user = User(username="admin", email="admin@example.com", is_admin=True)
+    user.set_password("Passw0rd!")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_admin_route_allows_admin(admin, login):
+    """Test that an active admin can use admin routes."""
+    response = login(admin).get("/api/auth/users")
+    assert response.status_code == 200
+
+
+def test_demoted_admin_token_is_rejected(admin, login, db):
+    """Test that removing admin rights applies to already issued tokens."""
+    client = login(admin)
+    assert client.get("/api/auth/users").status_code == 200
+
+    admin.is_admin = False
+    db.commit()
+
+    response = client.get("/api/auth/users")
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Admin access required"
+
+
+def test_deactivated_admin_token_is_rejected(admin, login, db):
+    """Test that deactivating an admin applies to already issued tokens."""
+    client = login(admin)
+    admin.is_active = False
+    db.commit()
+
+    response = client.get("/api/auth/users")
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Admin access required"
+
+
+def test_deleted_admin_token_is_rejected(admin, login, db):
+    """Test that a deleted admin's token no longer grants admin access."""
+    client = login(admin)
+    db.delete(admin)
+    db.commit()
+
+    response = client.get("/api/auth/users")
+    assert response.status_code == 400
+
+
+def test_non_admin_token_is_rejected(db, login):
+    """Test that regular users cannot use admin routes."""
+    user = User(username="user", email="user@example.com")
+    user.set_password("Passw0rd!")
+    db.add(user)
+    db.commit()
+
+    response = login(user).get("/api/auth/users")
+    assert response.status_code == 400
+
+
+def test_me_rejects_inactive_user(admin, login, db):
+    """Test that /me does not re-issue a token to a deactivated user."""
+    client = login(admin)
+    admin.is_active = False
+    db.commit()
+
+    response = client.get("/api/auth/me")
+    assert response.status_code == 400
+    assert "Set-Cookie" not in response.headers
+
+
+def test_me_token_uses_session_timeout_setting(admin, login, db, app):
+    """Test that /me issues a token lasting the configured session timeout."""
+    # /me returns the token's CSRF value, which TestingConfig leaves out
+    app.config["JWT_COOKIE_CSRF_PROTECT"] = True
+    db.add(AppSetting(key="session_timeout_minutes", value="30"))
+    db.commit()
+
+    response = login(admin).get("/api/auth/me")
+    assert response.status_code == 200
+    assert response.get_json()["data"]["user"]["username"] == "admin"
+
+    cookie = response.headers["Set-Cookie"].split(";")[0].split("=", 1)[1]
+    with app.app_context():
+        claims = decode_token(cookie)
+    assert claims["exp"] - claims["iat"] == 30 * 60
@@ -0,0 +1,102 @@
+"""Tests for uploaded avatar storage in user_avatars."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from app.models import User, UserAvatar
+
+
+def png_bytes(color: str) -> bytes:
+    """Encode a small solid-colour PNG."""
+    output = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def admin(db):
+    """Create an active admin user."""
+    user = User(username="admin", email="admin@example.com", is_admin=True)
+    user.set_password("Passw0rd!")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def member(db):
+    """Create a regular user."""
+    user = User(username="member", email="member@example.com")
+    user.set_password("Passw0rd!")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_store_inserts_then_replaces(db, member):
+    """Test that storing twice keeps one row holding the latest image."""
+    UserAvatar.store(db, member.id, b"first", "image/png")
+    UserAvatar.store(db, member.id, b"second", "image/webp")
+    db.commit()
+
+    avatars = db.query(UserAvatar).all()
+    assert [(a.user_id, a.data, a.mime_type) for a in avatars] == [
+        (member.id, b"second", "image/webp")
+    ]
+
+
+def test_set_and_clear_avatar_track_has_avatar(db, member):
+    """Test that has_avatar follows set_avatar/clear_avatar without a reload."""
+    assert member.has_avatar is False
+
+    member.set_avatar(db, b"image", "image/png")
+    db.commit()
+    assert member.has_avatar is True
+    assert member.to_dict()["avatar_url"] == f"/api/auth/users/{member.id}/avatar"
+
+    member.clear_avatar(db)
+    db.commit()
+    assert member.has_avatar is False
+    assert db.get(UserAvatar, member.id) is None
+
+
+def test_upload_and_fetch_avatar(member, login):
+    """Test that an uploaded image is served back from user_avatars."""
+    client = login(member)
+    response = client.post(
+        "/api/auth/me/avatar",
+        data={"avatar": (io.BytesIO(png_bytes("red")), "a.png", "image/png")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 200
+    assert response.get_json()["data"]["user"]["has_uploaded_avatar"] is True
+
+    response = client.get(f"/api/auth/users/{member.id}/avatar")
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert Image.open(io.BytesIO(response.data)).getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_fetch_missing_avatar(member, client):
+    """Test the not-found responses for a user without an image or no user."""
+    response = client.get(f"/api/auth/users/{member.id}/avatar")
+    assert response.status_code == 404
+    assert response.get_json()["error"] == f"Avatar not found: {member.id}"
+
+    response = client.get("/api/auth/users/999/avatar")
+    assert response.status_code == 404
+    assert response.get_json()["error"] == "User not found: 999"
+
+
+def test_deleting_user_removes_avatar(db, admin, member, login):
+    """Test that deleting a user also deletes their image on SQLite."""
+    member.set_avatar(db, b"image", "image/png")
+    db.commit()
+
+    response = login(admin).delete(f"/api/auth/users/{member.id}")
+    assert response.status_code == 200
+
+    db.expire_all()
+    assert db.query(UserAvatar).count() == 0
@@ -0,0 +1,32 @@
+"""CORS header tests."""
+
+ALLOWED_ORIGIN = "http://localhost:5173"
+
+
+def test_allowed_origin_gets_cors_headers(client):
+    """Test that responses echo an allowed origin with credentials."""
+    response = client.get("/health", headers={"Origin": ALLOWED_ORIGIN})
+    assert response.headers["Access-Control-Allow-Origin"] == ALLOWED_ORIGIN
+    assert response.headers["Access-Control-Allow-Credentials"] == "true"
+    assert "Origin" in response.headers.get_all("Vary")
+
+
+def test_unknown_origin_gets_no_cors_headers(client):
+    """Test that responses to unknown origins carry no CORS headers."""
+    response = client.get("/health", headers={"Origin": "http://evil.example"})
+    assert "Access-Control-Allow-Origin" not in response.headers
+
+
+def test_preflight_short_circuits(client):
+    """Test that preflight requests are answered without hitting the view."""
+    response = client.options(
+        "/api/devices",
+        headers={
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "POST",
+        },
+    )
+    assert response.status_code == 204
+    assert response.headers["Access-Control-Allow-Origin"] == ALLOWED_ORIGIN
+    assert "X-CSRF-TOKEN" in response.headers["Access-Control-Allow-Headers"]
+    assert "DELETE" in response.headers["Access-Control-Allow-Methods"]
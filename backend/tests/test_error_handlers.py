@@ -0,0 +1,30 @@
+"""Tests for the application-level JSON error handlers."""
+
+from flask import abort
+
+
+def test_unknown_endpoint_returns_json_404(client):
+    """Test that unknown routes return the JSON not-found body."""
+    response = client.get("/does-not-exist")
+    assert response.status_code == 404
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"error": "Endpoint not found"}
+
+
+def test_wrong_method_returns_json_405(client):
+    """Test that unsupported methods return the JSON method-not-allowed body."""
+    response = client.post("/health")
+    assert response.status_code == 405
+    assert response.get_json() == {"error": "Method not allowed"}
+
+
+def test_http_errors_return_json_description(app):
+    """Test that other HTTP errors keep their status and description."""
+
+    @app.route("/test-bad-request")
+    def bad_request():
+        abort(400, "Malformed payload")
+
+    response = app.test_client().get("/test-bad-request")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Malformed payload"}
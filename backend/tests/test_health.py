@@ -1,23 +1,5 @@
 """Basic health check tests."""
 
-import pytest
-
-from app import create_app
-from app.config import TestingConfig
-
-
-@pytest.fixture
-def app():
-    """Create application for testing."""
-    app = create_app(TestingConfig)
-    yield app
-
-
-@pytest.fixture
-def client(app):
-    """Create test client."""
-    return app.test_client()
-
 
 def test_health_endpoint(client):
     """Test that health endpoint returns 200."""
@@ -0,0 +1,82 @@
+"""Tests for the cache of successful password checks."""
+
+import pytest
+
+from app.models import User
+from app.utils import password_cache
+from app.utils.password_cache import check_password_cached
+
+PASSWORD = "Passw0rd!"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty cache."""
+    password_cache._verified.clear()
+    yield
+    password_cache._verified.clear()
+
+
+@pytest.fixture
+def user():
+    """Create a user with a known password (not persisted)."""
+    user = User(id=1, username="user", email="user@example.com")
+    user.set_password(PASSWORD)
+    return user
+
+
+@pytest.fixture
+def kdf_calls(monkeypatch):
+    """Count calls to the real password check."""
+    calls = []
+    check_password = User.check_password
+
+    def counting_check(self, password):
+        calls.append(password)
+        return check_password(self, password)
+
+    monkeypatch.setattr(User, "check_password", counting_check)
+    return calls
+
+
+def test_hit_within_ttl_skips_kdf(user, kdf_calls):
+    """Test that a repeated correct password is served from the cache."""
+    assert check_password_cached(user, PASSWORD, ttl=60)
+    assert check_password_cached(user, PASSWORD, ttl=60)
+    assert len(kdf_calls) == 1
+
+
+def test_expired_entry_runs_kdf_again(user, kdf_calls, monkeypatch):
+    """Test that an entry older than the TTL is verified again."""
+    now = password_cache.time.monotonic()
+    assert check_password_cached(user, PASSWORD, ttl=60)
+
+    monkeypatch.setattr(password_cache.time, "monotonic", lambda: now + 61)
+    assert check_password_cached(user, PASSWORD, ttl=60)
+    assert len(kdf_calls) == 2
+
+
+def test_wrong_password_is_not_cached(user, kdf_calls):
+    """Test that failed checks always run the full verification."""
+    assert not check_password_cached(user, "wrong", ttl=60)
+    assert not check_password_cached(user, "wrong", ttl=60)
+    assert len(kdf_calls) == 2
+    assert not password_cache._verified
+
+
+def test_password_change_misses_cache(user, kdf_calls):
+    """Test that a cached password stops matching once the hash changes."""
+    assert check_password_cached(user, PASSWORD, ttl=60)
+
+    user.set_password("N3w-password!")
+    assert not check_password_cached(user, PASSWORD, ttl=60)
+    assert check_password_cached(user, "N3w-password!", ttl=60)
+    assert len(kdf_calls) == 3
+
+
+def test_zero_ttl_disables_cache(user, kdf_calls):
+    """Test that ttl=0 verifies every time and stores nothing."""
+    assert check_password_cached(user, PASSWORD, ttl=0)
+    assert check_password_cached(user, PASSWORD, ttl=0)
+    assert len(kdf_calls) == 2
+    assert not password_cache._verified
@@ -0,0 +1,60 @@
+"""Tests for User password hashing and legacy hash upgrades."""
+
+from argon2 import PasswordHasher
+from werkzeug.security import generate_password_hash
+
+from app.models import User
+
+PASSWORD = "Passw0rd!"
+
+
+def make_user(password_hash: str | None = None) -> User:
+    """Build a user with a password, or with a given stored hash."""
+    user = User(username="user", email="user@example.com")
+    if password_hash is None:
+        user.set_password(PASSWORD)
+    else:
+        user.password_hash = password_hash
+    return user
+
+
+def test_set_password_uses_argon2id():
+    """Test that new passwords are stored as Argon2id hashes."""
+    user = make_user()
+    assert user.password_hash.startswith("$argon2id$")
+    assert user.check_password(PASSWORD)
+    assert not user.check_password("wrong")
+
+
+def test_legacy_hash_is_upgraded_on_match():
+    """Test that a werkzeug hash verifies and is replaced with Argon2id."""
+    user = make_user(generate_password_hash(PASSWORD))
+
+    assert user.check_password(PASSWORD)
+    assert user.password_hash.startswith("$argon2id$")
+    assert user.check_password(PASSWORD)
+
+
+def test_legacy_hash_is_kept_on_mismatch():
+    """Test that a wrong password leaves the werkzeug hash untouched."""
+    legacy_hash = generate_password_hash(PASSWORD)
+    user = make_user(legacy_hash)
+
+    assert not user.check_password("wrong")
+    assert user.password_hash == legacy_hash
+
+
+def test_outdated_argon2_parameters_are_rehashed():
+    """Test that an Argon2 hash with old parameters is re-hashed on match."""
+    old_hash = PasswordHasher(time_cost=1, memory_cost=8192).hash(PASSWORD)
+    user = make_user(old_hash)
+
+    assert user.check_password(PASSWORD)
+    assert user.password_hash != old_hash
+    assert "m=65536,t=2,p=1" in user.password_hash
+
+
+def test_invalid_hash_does_not_match():
+    """Test that a corrupt Argon2 hash is treated as a mismatch."""
+    user = make_user("$argon2id$not-a-real-hash")
+    assert not user.check_password(PASSWORD)